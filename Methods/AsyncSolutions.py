@@ -0,0 +1,166 @@
+import asyncio
+import inspect
+import math
+from concurrent.futures import Executor
+from typing import Awaitable, Callable, List, Optional, Union
+
+Objective = Callable[[float], Union[float, Awaitable[float]]]
+
+
+class AsyncSolutions:
+    """
+    Bracketed root finding for objectives that are slow to evaluate, such as calls to a remote
+    or out-of-process simulator. The objective may be a coroutine function or a plain function;
+    plain functions are run on an executor so they do not block the event loop.
+    """
+
+    @staticmethod
+    async def _evaluate(f: Objective, x: float, executor: Optional[Executor] = None) -> float:
+        """Evaluates f at x, awaiting it if it is a coroutine function."""
+        if inspect.iscoroutinefunction(f):
+            return await f(x)
+        value = await asyncio.get_running_loop().run_in_executor(executor, f, x)
+        if inspect.isawaitable(value):
+            value = await value
+        return value
+
+    @staticmethod
+    async def _evaluate_many(f: Objective, points: List[float], executor: Optional[Executor] = None) -> List[float]:
+        """Evaluates f at every point concurrently."""
+        return list(await asyncio.gather(*(AsyncSolutions._evaluate(f, x, executor) for x in points)))
+
+    @staticmethod
+    async def bisection(
+        f: Objective,
+        a: float,
+        b: float,
+        error: float,
+        max_iter: int,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Bisection method awaiting one evaluation of f at a time.
+        Args:
+            f: The function, or coroutine function, for which to find the root.
+            a: The start of the interval.
+            b: The end of the interval.
+            error: The acceptable error margin.
+            max_iter: The maximum number of iterations to perform.
+            executor: Executor used to run a plain function f, the loop default when None.
+        Returns:
+            A tuple containing the root and the number of iterations performed.
+        Raises:
+            ValueError: If the method fails to converge within the maximum number of iterations.
+        """
+        if error <= 0 or max_iter <= 0:
+            raise ValueError("Error and max_iter must be positive values.")
+        F_a, F_b = await AsyncSolutions._evaluate_many(f, [a, b], executor)
+        if F_a * F_b >= 0:
+            raise ValueError("f(a) and f(b) must have different signs.")
+        i = 0
+        while i <= max_iter:
+            x = (a + b) / 2
+            F_x = await AsyncSolutions._evaluate(f, x, executor)
+            if F_x == 0 or (b - a) / 2 < error:
+                return x, i
+
+            if F_a * F_x > 0:
+                a, F_a = x, F_x
+            else:
+                b = x
+            i += 1
+        raise ValueError("Method failed after maximum iterations")
+
+    @staticmethod
+    def _check_finite(points: List[float], values: List[float]) -> None:
+        """Rejects NaN and infinite values, which have no sign to keep the root bracketed with."""
+        for x, F_x in zip(points, values):
+            if not math.isfinite(F_x):
+                raise ValueError(f"f({x}) = {F_x} is not finite. No solution found.")
+
+    @staticmethod
+    async def k_section(
+        f: Objective,
+        a: float,
+        b: float,
+        error: float,
+        max_iter: int,
+        k: int = 4,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Parallel k-section method: each iteration evaluates the k - 1 interior points of an equal
+        split of [a, b] concurrently and keeps the subinterval with a sign change, so the bracket
+        shrinks by a factor of k per round instead of 2. This trades k - 1 evaluations per round
+        for fewer sequential rounds, which cuts wall-clock time when evaluations are I/O bound.
+        Args:
+            f: The function, or coroutine function, for which to find the root.
+            a: The start of the interval.
+            b: The end of the interval.
+            error: The acceptable error margin.
+            max_iter: The maximum number of iterations to perform.
+            k: Number of subintervals per round, at least 2 (k = 2 is the bisection method).
+            executor: Executor used to run a plain function f, the loop default when None.
+                      A ProcessPoolExecutor requires f to be picklable.
+        Returns:
+            A tuple containing the root, the number of iterations performed and the number of evaluations of f.
+        Raises:
+            ValueError: If f is not finite at a probe or the method fails to converge within the maximum number of iterations.
+        """
+        if error <= 0 or max_iter <= 0:
+            raise ValueError("Error and max_iter must be positive values.")
+        if k < 2:
+            raise ValueError("k must be at least 2.")
+        F_a, F_b = await AsyncSolutions._evaluate_many(f, [a, b], executor)
+        evaluations = 2
+        AsyncSolutions._check_finite([a, b], [F_a, F_b])
+        if F_a * F_b >= 0:
+            raise ValueError("f(a) and f(b) must have different signs.")
+        i = 0
+        while i <= max_iter:
+            if (b - a) / 2 < error:
+                return (a + b) / 2, i, evaluations
+            width = (b - a) / k
+            points = [a + j * width for j in range(1, k)]
+            values = await AsyncSolutions._evaluate_many(f, points, executor)
+            evaluations += k - 1
+            AsyncSolutions._check_finite(points, values)
+            for x, F_x in zip(points, values):
+                if F_x == 0:
+                    return x, i, evaluations
+            points = [a] + points + [b]
+            values = [F_a] + values + [F_b]
+            for j in range(k): # Keep the first subinterval with a sign change
+                if values[j] * values[j + 1] < 0:
+                    a, b, F_a, F_b = points[j], points[j + 1], values[j], values[j + 1]
+                    break
+            i += 1
+        raise ValueError("Method failed after maximum iterations")
+
+    @staticmethod
+    def parallel_k_section(
+        f: Callable[[float], float],
+        a: float,
+        b: float,
+        error: float,
+        max_iter: int,
+        k: int = 4,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Synchronous entry point for k_section, for callers without an event loop.
+        The interior points are evaluated on the given thread or process pool.
+        Args:
+            f: The function for which to find the root.
+            a: The start of the interval.
+            b: The end of the interval.
+            error: The acceptable error margin.
+            max_iter: The maximum number of iterations to perform.
+            k: Number of subintervals per round, at least 2.
+            executor: Thread or process pool used to evaluate f, the loop default when None.
+        Returns:
+            A tuple containing the root, the number of iterations performed and the number of evaluations of f.
+        Raises:
+            ValueError: If f is not finite at a probe or the method fails to converge within the maximum number of iterations.
+        """
+        return asyncio.run(AsyncSolutions.k_section(f, a, b, error, max_iter, k, executor))
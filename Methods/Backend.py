@@ -0,0 +1,401 @@
+import math
+import os
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+from .CSRMatrix import CSRMatrix
+
+ZERO_POLICIES = ("nan", "inf", "absolute", "raise")
+
+
+def load_numpy():
+    """Imports NumPy on first use, so everything else keeps working without it."""
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError("This feature requires NumPy to be installed.") from exc
+    return numpy
+
+
+def is_array(values) -> bool:
+    """Returns True for NumPy arrays and scalars, without importing NumPy."""
+    return type(values).__module__ == "numpy"
+
+
+def off_diagonal_rows(coefficients) -> List[Tuple[list, list]]:
+    """Returns the (columns, values) of the nonzero off-diagonal entries of each row of a dense or CSR matrix."""
+    rows = []
+    if isinstance(coefficients, CSRMatrix):
+        A = coefficients
+        for i in range(A.shape[0]):
+            entries = [(A.indices[k], A.data[k]) for k in range(A.indptr[i], A.indptr[i + 1]) if A.indices[k] != i]
+            rows.append(([j for j, _ in entries], [a for _, a in entries]))
+        return rows
+    for i, row in enumerate(coefficients):
+        columns = [j for j, a in enumerate(row) if a != 0 and j != i]
+        rows.append((columns, [row[j] for j in columns]))
+    return rows
+
+
+class Backend(ABC):
+    """
+    Compute kernels shared by LinearSystem, Interpolation and Errors, implemented once with
+    Python lists (PythonBackend) and once with NumPy arrays (NumPyBackend).
+    Both implementations return the same values up to rounding; the Python backend returns lists
+    and the NumPy backend returns arrays. See benchmarks/backends.py for the cross-check.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def absolute_errors(self, true_values, approx_values):
+        """Elementwise |true - approx|."""
+
+    @abstractmethod
+    def relative_errors(self, true_values, approx_values, zero: str):
+        """Elementwise |true - approx| / |true|, with zero true values handled by the given policy."""
+
+    @abstractmethod
+    def error_summary(self, errors) -> Tuple[int, int, float, float, float]:
+        """Returns the count, number of NaNs, mean, sum of squared deviations and maximum of the non-NaN errors."""
+
+    @abstractmethod
+    def barycentric(self, nodes, values, weights, xs):
+        """Evaluates the barycentric form of the interpolation polynomial at every point of xs."""
+
+    @abstractmethod
+    def newton(self, coefficients, nodes, xs):
+        """Evaluates the Newton form of the interpolation polynomial at every point of xs with Horner's scheme."""
+
+    @abstractmethod
+    def spline(self, knots, a, b, c, d, xs):
+        """Evaluates the piecewise cubic a + b dx + c dx^2 + d dx^3 at every point of xs."""
+
+    @abstractmethod
+    def vector(self, values):
+        """Returns a new vector of this backend holding values, the iterate of the sweeps below."""
+
+    @abstractmethod
+    def jacobi_sweep(self, coefficients, constants, diagonal) -> Callable:
+        """
+        Prepares the Jacobi sweep x_new = x + (b - A x) / D for a dense or CSR matrix.
+        Returns a function step(x) -> (x_new, largest change), which may update x in place.
+        """
+
+    @abstractmethod
+    def red_black_sweep(self, coefficients, constants, diagonal, colors, omega: float) -> Callable:
+        """
+        Prepares a red-black Gauss-Seidel (SOR for omega != 1) sweep over the two colors of unknowns.
+        Returns a function step(x) -> largest change, updating x in place.
+        """
+
+
+class PythonBackend(Backend):
+    """The zero-dependency backend, working on any sequences and returning lists."""
+
+    name = "python"
+
+    def absolute_errors(self, true_values, approx_values) -> List[float]:
+        return [abs(t - a) for t, a in zip(true_values, approx_values)]
+
+    @staticmethod
+    def _relative(true_value, approx_value, zero: str) -> float:
+        if true_value != 0:
+            return abs((true_value - approx_value) / true_value)
+        difference = abs(true_value - approx_value)
+        if zero == "raise":
+            raise ValueError("True value cannot be zero for relative error calculation.")
+        if zero == "nan":
+            return math.nan
+        if zero == "inf":
+            return math.inf if difference else 0.0
+        return difference
+
+    def relative_errors(self, true_values, approx_values, zero: str) -> List[float]:
+        return [self._relative(t, a, zero) for t, a in zip(true_values, approx_values)]
+
+    def error_summary(self, errors) -> Tuple[int, int, float, float, float]:
+        errors = list(errors)
+        valid = [e for e in errors if e == e]  # NaN is the only value not equal to itself
+        if not valid:
+            return 0, len(errors), 0.0, 0.0, -math.inf
+        mean = math.fsum(valid) / len(valid)
+        return len(valid), len(errors) - len(valid), mean, math.fsum((e - mean) ** 2 for e in valid), max(valid)
+
+    def barycentric(self, nodes, values, weights, xs) -> List[float]:
+        result = []
+        for x in xs:
+            numerator = 0.0
+            denominator = 0.0
+            for x_j, y_j, w_j in zip(nodes, values, weights):
+                if x == x_j:
+                    break  # x is a node, the formula would divide by zero
+                term = w_j / (x - x_j)
+                numerator += term * y_j
+                denominator += term
+            else:
+                result.append(numerator / denominator)
+                continue
+            result.append(y_j)
+        return result
+
+    def newton(self, coefficients, nodes, xs) -> List[float]:
+        n = len(coefficients)
+        result = []
+        for x in xs:
+            value = coefficients[-1]
+            for i in range(n - 2, -1, -1):
+                value = value * (x - nodes[i]) + coefficients[i]
+            result.append(value)
+        return result
+
+    def spline(self, knots, a, b, c, d, xs) -> List[float]:
+        last = len(knots) - 2
+        result = []
+        for x in xs:
+            if x < knots[0] or x > knots[-1]:
+                raise ValueError("x is outside the range of x_values.")
+            i = min(bisect_right(knots, x) - 1, last)
+            dx = x - knots[i]
+            result.append(a[i] + dx * (b[i] + dx * (c[i] + dx * d[i])))
+        return result
+
+    def vector(self, values) -> List[float]:
+        return [float(v) for v in values]
+
+    def jacobi_sweep(self, coefficients, constants, diagonal) -> Callable:
+        rows = off_diagonal_rows(coefficients)
+
+        def step(x):
+            new = []
+            for (columns, values), b, d in zip(rows, constants, diagonal):
+                s = 0.0
+                for j, a in zip(columns, values):
+                    s += a * x[j]  # Sum of known variables
+                new.append((b - s) / d)
+            return new, max(abs(u - v) for u, v in zip(new, x))
+
+        return step
+
+    def red_black_sweep(self, coefficients, constants, diagonal, colors, omega: float) -> Callable:
+        rows = off_diagonal_rows(coefficients)
+
+        def step(x):
+            error = 0.0
+            for color in colors:
+                updates = []
+                for i in color:  # Unknowns of one color only depend on the other color
+                    columns, values = rows[i]
+                    s = 0.0
+                    for j, a in zip(columns, values):
+                        s += a * x[j]
+                    updates.append(omega * ((constants[i] - s) / diagonal[i] - x[i]))
+                for i, delta in zip(color, updates):
+                    x[i] += delta
+                    error = max(error, abs(delta))
+            return error
+
+        return step
+
+
+class NumPyBackend(Backend):
+    """The array backend: each kernel is a few whole-array operations. NumPy is imported when it is created."""
+
+    name = "numpy"
+    _block = 1 << 20  # Largest number of entries of the temporary (points x nodes) matrices
+
+    def __init__(self):
+        self.np = load_numpy()
+
+    def _asarray(self, values):
+        if not hasattr(values, "__len__"):
+            values = list(values)
+        return self.np.asarray(values, dtype=self.np.float64)
+
+    def absolute_errors(self, true_values, approx_values):
+        return self.np.abs(self._asarray(true_values) - self._asarray(approx_values))
+
+    def relative_errors(self, true_values, approx_values, zero: str):
+        np = self.np
+        true_values = self._asarray(true_values)
+        difference = np.abs(true_values - self._asarray(approx_values))
+        zeros = true_values == 0
+        if not zeros.any():
+            return difference / np.abs(true_values)
+        if zero == "raise":
+            raise ValueError("True value cannot be zero for relative error calculation.")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = difference / np.abs(true_values)
+        if zero == "nan":
+            result[zeros] = np.nan
+        elif zero == "inf":
+            result[zeros] = np.where(difference[zeros] == 0, 0.0, np.inf)
+        else:
+            result[zeros] = difference[zeros]
+        return result
+
+    def error_summary(self, errors) -> Tuple[int, int, float, float, float]:
+        np = self.np
+        errors = self._asarray(errors).ravel()
+        valid = errors[~np.isnan(errors)]
+        if not len(valid):
+            return 0, len(errors), 0.0, 0.0, -math.inf
+        mean = float(valid.mean())
+        return len(valid), len(errors) - len(valid), mean, float(((valid - mean) ** 2).sum()), float(valid.max())
+
+    def barycentric(self, nodes, values, weights, xs):
+        np = self.np
+        nodes, values, weights, xs = (self._asarray(v) for v in (nodes, values, weights, xs))
+        result = np.empty(len(xs))
+        step = max(1, self._block // max(1, len(nodes)))
+        for start in range(0, len(xs), step):  # Bound the size of the difference matrix
+            block = xs[start:start + step]
+            difference = block[:, None] - nodes[None, :]
+            exact = difference == 0
+            with np.errstate(divide="ignore", invalid="ignore"):
+                terms = weights / difference
+                out = (terms @ values) / terms.sum(axis=1)
+            rows, columns = np.nonzero(exact)
+            out[rows] = values[columns]  # Points that are nodes
+            result[start:start + step] = out
+        return result
+
+    def newton(self, coefficients, nodes, xs):
+        coefficients, nodes, xs = (self._asarray(v) for v in (coefficients, nodes, xs))
+        result = self.np.full(len(xs), coefficients[-1])
+        for i in range(len(coefficients) - 2, -1, -1):
+            result = result * (xs - nodes[i]) + coefficients[i]
+        return result
+
+    def spline(self, knots, a, b, c, d, xs):
+        np = self.np
+        knots, xs = self._asarray(knots), self._asarray(xs)
+        if len(xs) and (xs.min() < knots[0] or xs.max() > knots[-1]) or np.isnan(xs).any():
+            raise ValueError("x is outside the range of x_values.")
+        i = np.minimum(np.searchsorted(knots, xs, side="right") - 1, len(knots) - 2)
+        dx = xs - knots[i]
+        a, b, c, d = (self._asarray(v)[i] for v in (a, b, c, d))
+        return a + dx * (b + dx * (c + dx * d))
+
+    def _product(self, coefficients, rows=None) -> Callable:
+        """
+        Returns a function computing (A x)[rows], for all rows when rows is None.
+        The matrix is converted once and reused by every call.
+        """
+        np = self.np
+        if not isinstance(coefficients, CSRMatrix):
+            A = np.asarray(coefficients, dtype=float)
+            if rows is not None:
+                A = A[np.asarray(rows, dtype=np.int64)]
+            return lambda x, out=None: np.dot(A, x, out=out)
+        A = coefficients
+        indptr = np.asarray(A.indptr)
+        rows = np.arange(A.shape[0]) if rows is None else np.asarray(rows, dtype=np.int64)
+        lengths = indptr[rows + 1] - indptr[rows]
+        positions = np.concatenate([np.arange(indptr[i], indptr[i + 1]) for i in rows]) if len(rows) else np.zeros(0, dtype=np.int64)
+        data = np.asarray(A.data)[positions]
+        indices = np.asarray(A.indices)[positions]
+        local_rows = np.repeat(np.arange(len(rows)), lengths)
+        gathered = np.empty(len(data))
+
+        def product(x, out=None):
+            np.take(x, indices, out=gathered)
+            np.multiply(gathered, data, out=gathered)
+            result = np.bincount(local_rows, weights=gathered, minlength=len(rows))
+            if out is None:
+                return result
+            out[:] = result
+            return out
+
+        return product
+
+    def vector(self, values):
+        return self.np.array(values, dtype=float)
+
+    def jacobi_sweep(self, coefficients, constants, diagonal) -> Callable:
+        np = self.np
+        product = self._product(coefficients)
+        b = self._asarray(constants)
+        diagonal = self._asarray(diagonal)
+        delta = np.empty(len(b))
+
+        def step(x):
+            product(x, out=delta)  # One matrix-vector product per sweep, into a preallocated buffer
+            np.subtract(b, delta, out=delta)
+            np.divide(delta, diagonal, out=delta)
+            x += delta
+            return x, float(np.max(np.abs(delta)))
+
+        return step
+
+    def red_black_sweep(self, coefficients, constants, diagonal, colors, omega: float) -> Callable:
+        np = self.np
+        b = self._asarray(constants)
+        diagonal = self._asarray(diagonal)
+        half_sweeps = []
+        for color in colors:
+            index = np.asarray(color, dtype=np.int64)
+            half_sweeps.append((index, self._product(coefficients, color), b[index], diagonal[index], np.empty(len(index))))
+
+        def step(x):
+            error = 0.0
+            for index, product, b_color, d_color, delta in half_sweeps:
+                product(x, out=delta)  # Includes the diagonal term, so the update is (b - A x) / D
+                np.subtract(b_color, delta, out=delta)
+                delta *= omega / d_color
+                x[index] += delta
+                if len(delta):
+                    error = max(error, float(np.max(np.abs(delta))))
+            return error
+
+        return step
+
+
+_BACKENDS = {"python": PythonBackend, "numpy": NumPyBackend}
+_instances: Dict[str, Backend] = {}
+_default = os.environ.get("NUMERICAL_METHODS_BACKEND", "python")
+
+
+def get_backend(name: Union[str, Backend, None] = None) -> Backend:
+    """
+    Returns the backend with the given name, creating it (and importing NumPy) on first use.
+    Args:
+        name: "python", "numpy", a Backend instance, or None for the default backend.
+    Returns:
+        The Backend.
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    if isinstance(name, Backend):
+        return name
+    name = name or _default
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown backend: {name}.")
+    if name not in _instances:
+        _instances[name] = _BACKENDS[name]()
+    return _instances[name]
+
+
+def set_backend(name: str) -> None:
+    """
+    Selects the default backend, "python" unless the NUMERICAL_METHODS_BACKEND environment variable says otherwise.
+    Args:
+        name: "python" or "numpy".
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If "numpy" is selected and NumPy is not installed.
+    """
+    global _default
+    get_backend(name)
+    _default = name
+
+
+def resolve_backend(name: Union[str, Backend, None], *values: Sequence) -> Backend:
+    """
+    Picks the backend for a call: the named one if given, NumPy if any input is a NumPy array,
+    and the default backend otherwise.
+    """
+    if name is None and any(is_array(v) for v in values):
+        name = "numpy"
+    return get_backend(name)
@@ -0,0 +1,348 @@
+import ast
+import csv
+import json
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
+from time import perf_counter
+from typing import Callable, Iterable, Iterator, List, NamedTuple, TextIO, Tuple
+
+from .Interpolation import Interpolation
+from .LinearSystem import LinearSystem
+from .Solutions import Solutions
+
+_FUNCTION_KEYS = ("f", "df", "d2f", "g")
+# Integer combinatorics can take unbounded time on large arguments and are of no use in an f(x)
+_NAMESPACE = {name: getattr(math, name) for name in dir(math) if not name.startswith("_") and name not in ("factorial", "comb", "perm")}
+_NAMESPACE.update({"__builtins__": {}, "abs": abs, "min": min, "max": max, "pow": pow})
+
+
+_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.UAdd, ast.USub)
+
+
+def _check(node: ast.AST, expression: str) -> None:
+    """Accepts only arithmetic on numbers, x and the math functions; anything else could reach Python internals."""
+    if isinstance(node, ast.Expression):
+        _check(node.body, expression)
+    elif isinstance(node, ast.Name) and (node.id == "x" or (node.id in _NAMESPACE and not node.id.startswith("_"))):
+        pass
+    elif isinstance(node, ast.Constant) and type(node.value) in (int, float, complex):
+        pass
+    elif isinstance(node, ast.BinOp) and isinstance(node.op, _OPERATORS):
+        _check(node.left, expression)
+        _check(node.right, expression)
+    elif isinstance(node, ast.UnaryOp) and isinstance(node.op, _OPERATORS):
+        _check(node.operand, expression)
+    elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and callable(_NAMESPACE.get(node.func.id)) and not node.keywords:
+        for argument in node.args:
+            _check(argument, expression)
+    else:
+        raise ValueError(f"Unsupported {type(node).__name__} in expression {expression!r}.")
+
+
+class _Floats(ast.NodeTransformer):
+    """Makes every number and x a float, so ** and pow overflow quickly instead of building huge integers."""
+
+    def visit_Constant(self, node: ast.Constant) -> ast.AST:
+        if type(node.value) is int:
+            return ast.copy_location(ast.Constant(float(node.value)), node)
+        return node
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if node.id == "x":
+            return ast.copy_location(ast.BinOp(node, ast.Mult(), ast.Constant(1.0)), node)
+        return node
+
+
+@lru_cache(maxsize=256)
+def _function(expression: str) -> Callable[[float], float]:
+    """
+    Compiles an expression in x, such as "x**2 - cos(x)", into a function, once per process.
+    The expression may only use numbers, x, arithmetic operators and the functions and constants of
+    the math module (plus abs, min, max and pow); attribute access, subscripts and any other name
+    are rejected before anything is compiled. Integer constants and x are evaluated as floats.
+    """
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as exc:
+        raise ValueError(f"Invalid expression {expression!r}: {exc.msg}.") from None
+    _check(tree, expression)
+    function = ast.parse("lambda x: None", mode="eval")
+    function.body.body = _Floats().visit(tree.body)  # type: ignore
+    return eval(compile(ast.fix_missing_locations(function), "<job>", "eval"), _NAMESPACE)
+
+
+class _Malformed(NamedTuple):
+    """Stands in for an input line that is not valid JSON, so it is reported in its own record."""
+    error: str
+
+
+def _jsonable(value):
+    """Converts solver results (tuples, NumPy values, complex numbers) to JSON-compatible values."""
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, complex):
+        return [value.real, value.imag]
+    if hasattr(value, "tolist"):
+        return _jsonable(value.tolist())
+    return value
+
+
+def _parse_cell(cell: str):
+    """Reads a CSV cell as JSON when possible, so numbers and lists keep their type."""
+    try:
+        return json.loads(cell)
+    except ValueError:
+        return cell
+
+
+class BatchRunner:
+    """
+    Runs batches of problems described by JSON objects ("specs") on a process pool.
+    A spec names the method as "solutions.<name>", "linear_system.<name>" or "interpolation.<name>"
+    (a bare name means Solutions) and holds its arguments:
+        {"id": 1, "method": "bisection", "f": "x**2 - 4", "a": 0, "b": 3, "error": 1e-6, "max_iter": 100}
+        {"method": "linear_system.gauss_seidel", "matrix_file": "A.csv", "tolerance": 1e-8}
+        {"method": "interpolation.cubic_spline", "x_values": [0, 1, 2], "y_values": [1, 3, 2], "points": [0.5, 1.5]}
+    The functions f, df, d2f and g are arithmetic expressions in x over the math module; anything
+    else, such as attribute access, is rejected. A linear system is given by "coefficients" and "constants", or by a
+    "matrix_file" holding the augmented matrix [A | b] as CSV, or a JSON object with both keys.
+    An interpolation method is evaluated at "x", or at every point of "points". Arguments whose
+    names clash with the spec keys, such as the method of find_all_roots, go in a "params" object.
+    """
+
+    @staticmethod
+    def _load_system(spec: dict) -> Tuple[list, list]:
+        if "matrix_file" not in spec:
+            return spec["coefficients"], spec["constants"]
+        path = spec["matrix_file"]
+        with open(path, newline="") as file:
+            if path.endswith(".json"):
+                data = json.load(file)
+                return data["coefficients"], data["constants"]
+            rows = [[float(v) for v in row] for row in csv.reader(file) if row]
+        return [row[:-1] for row in rows], [row[-1] for row in rows]
+
+    @staticmethod
+    def run(spec: dict):
+        """
+        Solves a single problem.
+        Args:
+            spec: The problem description, see the class docstring.
+        Returns:
+            The return value of the method.
+        Raises:
+            ValueError: If the spec is not an object, the method is unknown or the spec is incomplete.
+        """
+        if isinstance(spec, _Malformed):
+            raise ValueError(spec.error)
+        if not isinstance(spec, dict):
+            raise ValueError(f"A spec must be a JSON object, not {type(spec).__name__}.")
+        target, _, name = spec.get("method", "").rpartition(".")
+        reserved = {"id", "method", "params", "coefficients", "constants", "matrix_file", "x_values", "y_values", "points"}
+        params = {key: value for key, value in spec.items() if key not in reserved}
+        params.update(spec.get("params", {}))
+        if not name or name.startswith("_"):
+            raise ValueError(f"Unknown method {spec.get('method')!r}.")
+        if target in ("", "solutions"):
+            solver = getattr(Solutions, name, None)
+            for key in _FUNCTION_KEYS:
+                if isinstance(params.get(key), str):
+                    params[key] = _function(params[key])
+        elif target == "linear_system":
+            solver = getattr(LinearSystem(*BatchRunner._load_system(spec)), name, None)
+        elif target == "interpolation":
+            interpolation = Interpolation(spec["x_values"], spec["y_values"])
+            solver = getattr(interpolation, name, None)
+            if solver is not None and "points" in spec:
+                return [solver(x, **params) for x in spec["points"]]
+        else:
+            raise ValueError(f"Unknown method {spec['method']!r}.")
+        if not callable(solver):
+            raise ValueError(f"Unknown method {spec['method']!r}.")
+        return solver(**params)
+
+    @staticmethod
+    def _record(index: int, spec) -> dict:
+        """The fields of a result record known before the spec is solved."""
+        if isinstance(spec, dict):
+            return {"index": index, "id": spec.get("id"), "method": spec.get("method")}
+        return {"index": index, "id": None, "method": None}
+
+    @staticmethod
+    def _timed_out(chunk: List[Tuple[int, dict]], timeout: float) -> List[dict]:
+        """Error records for the specs of a chunk that did not finish in time."""
+        records = []
+        for index, spec in chunk:
+            record = BatchRunner._record(index, spec)
+            record["status"] = "error"
+            record["error"] = f"TimeoutError: the chunk holding this spec did not finish within {timeout} s"
+            record["elapsed"] = timeout
+            records.append(record)
+        return records
+
+    @staticmethod
+    def _terminate(pool: ProcessPoolExecutor) -> None:
+        """Stops a process pool whose workers may be stuck, without waiting for them."""
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def run_chunk(chunk: List[Tuple[int, dict]]) -> List[dict]:
+        """
+        Solves a chunk of indexed specs in the current process; the unit of work sent to the pool.
+        Failures, including specs that are not objects or lines that are not valid JSON, are reported
+        in the result record instead of being raised.
+        Args:
+            chunk: A list of (index, spec) pairs.
+        Returns:
+            One result record per spec, with its index, id, status, result or error and elapsed time.
+        """
+        records = []
+        for index, spec in chunk:
+            record = BatchRunner._record(index, spec)
+            start = perf_counter()
+            try:
+                record["result"] = _jsonable(BatchRunner.run(spec))
+                record["status"] = "ok"
+            except Exception as exc: # Report the failure and keep going with the rest of the batch
+                record["status"] = "error"
+                record["error"] = f"{type(exc).__name__}: {exc}"
+            record["elapsed"] = perf_counter() - start
+            records.append(record)
+        return records
+
+    @staticmethod
+    def read_specs(stream: TextIO, format: str = "jsonl") -> Iterator[dict]:
+        """
+        Reads specs lazily from a text stream.
+        Args:
+            stream: The input, one JSON object per line, or CSV with the spec keys as header.
+            format: "jsonl" or "csv".
+        Returns:
+            An iterator over the specs. A line that is not valid JSON is passed on as a marker
+            that run reports as an error, so the rest of the batch still runs.
+        """
+        if format == "jsonl":
+            for number, line in enumerate(stream, 1):
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except ValueError as exc:
+                        yield _Malformed(f"Invalid JSON on line {number}: {exc}")
+        elif format == "csv":
+            for row in csv.DictReader(stream):
+                yield {key: _parse_cell(cell) for key, cell in row.items() if cell not in ("", None)}
+        else:
+            raise ValueError("Unknown format. Use 'jsonl' or 'csv'.")
+
+    @staticmethod
+    def execute(
+        specs: Iterable[dict],
+        workers: int = None, # type: ignore
+        chunk_size: int = 16,
+        executor: Executor = None, # type: ignore
+        timeout: float = None, # type: ignore
+    ) -> Iterator[dict]:
+        """
+        Solves every spec on a process pool and yields the result records as chunks complete.
+        Specs are read and submitted in chunks of chunk_size, keeping at most two chunks per worker
+        in flight, so memory stays bounded and results stream out while the input is still being read.
+        Records come out in completion order; their index field gives the position of the spec.
+        With a timeout, only one chunk per worker is in flight, and a chunk still running timeout
+        seconds after it was submitted is reported as one error record per spec. Its worker cannot be
+        interrupted, so an owned pool is then replaced and the other chunks in flight are submitted
+        again; with an executor passed in, the stuck task is abandoned.
+        Args:
+            specs: The problem specs, any iterable.
+            workers: Number of worker processes, os.cpu_count() when None; 0 runs everything in this process.
+            chunk_size: Number of specs sent to a worker at a time.
+            executor: An existing executor to use instead of creating a process pool.
+            timeout: Seconds allowed per chunk, no limit when None. Not applied when workers is 0.
+        Returns:
+            An iterator over the result records.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive value.")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be a positive value.")
+        indexed = enumerate(specs)
+        if workers == 0 and executor is None:
+            chunk = list(islice(indexed, chunk_size))
+            while chunk:
+                yield from BatchRunner.run_chunk(chunk)
+                chunk = list(islice(indexed, chunk_size))
+            return
+        workers = workers or os.cpu_count() or 1
+        pool = executor or ProcessPoolExecutor(max_workers=workers)
+        deadline = (lambda: perf_counter() + timeout) if timeout else (lambda: math.inf)
+        in_flight = workers if timeout else 2 * workers  # A queued chunk must not spend its time waiting
+        try:
+            pending = {}  # Future -> (chunk, deadline)
+            exhausted = False
+            while pending or not exhausted:
+                while not exhausted and len(pending) < in_flight:
+                    chunk = list(islice(indexed, chunk_size))
+                    if not chunk:
+                        exhausted = True
+                        break
+                    pending[pool.submit(BatchRunner.run_chunk, chunk)] = (chunk, deadline())
+                if not pending:
+                    break
+                first = min(limit for _, limit in pending.values())
+                remaining = None if first == math.inf else max(0.0, first - perf_counter())
+                done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del pending[future]
+                    yield from future.result()
+                now = perf_counter()
+                expired = [future for future, (_, limit) in pending.items() if limit <= now]
+                for future in expired:
+                    yield from BatchRunner._timed_out(pending.pop(future)[0], timeout)
+                if expired and executor is None:
+                    BatchRunner._terminate(pool)
+                    pool = ProcessPoolExecutor(max_workers=workers)
+                    pending = {pool.submit(BatchRunner.run_chunk, chunk): (chunk, deadline()) for chunk, _ in pending.values()}
+        finally:
+            if executor is None:
+                pool.shutdown(cancel_futures=True)
+
+    @staticmethod
+    def main(argv: List[str] = None) -> int: # type: ignore
+        """
+        Command line entry point: reads specs from a file or stdin and writes JSONL records.
+        Args:
+            argv: The command line arguments, sys.argv[1:] when None.
+        Returns:
+            The exit status, 1 if any spec failed.
+        """
+        import argparse
+        import sys
+
+        parser = argparse.ArgumentParser(description="Solve a batch of numerical problems on a process pool.")
+        parser.add_argument("input", nargs="?", default="-", help="JSONL or CSV file of problem specs, - for stdin")
+        parser.add_argument("-o", "--output", default="-", help="JSONL file for the results, - for stdout")
+        parser.add_argument("--format", choices=("jsonl", "csv"), help="input format, from the file extension by default")
+        parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes, 0 to run in-process")
+        parser.add_argument("-c", "--chunk-size", type=int, default=16, help="specs per task sent to a worker")
+        parser.add_argument("-t", "--timeout", type=float, default=300.0, help="seconds allowed per chunk, 0 for no limit")
+        args = parser.parse_args(argv)
+        input_format = args.format or ("csv" if args.input.endswith(".csv") else "jsonl")
+        source = sys.stdin if args.input == "-" else open(args.input, newline="")
+        target = sys.stdout if args.output == "-" else open(args.output, "w")
+        failures = 0
+        try:
+            specs = BatchRunner.read_specs(source, input_format)
+            for record in BatchRunner.execute(specs, args.workers, args.chunk_size, timeout=args.timeout or None):
+                failures += record["status"] != "ok"
+                target.write(json.dumps(record) + "\n")
+                target.flush()
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if target is not sys.stdout:
+                target.close()
+        return 1 if failures else 0
@@ -0,0 +1,213 @@
+from typing import Callable
+
+from .Backend import load_numpy
+
+
+class BatchSolutions:
+    """
+    Vectorized counterparts of the Solutions root finders that solve many independent problems at once.
+    Each method takes arrays of brackets or initial guesses and a vectorized f that maps an array of
+    points to an array of values. All unconverged problems are stepped together and converged ones are
+    masked out, so f is only evaluated on the active problems.
+    Per-problem parameters are passed as a tuple of arrays (or scalars shared by every problem) in
+    args; they are sliced to the active problems and f is called as f(x, *args).
+    Every method returns three arrays: the roots (NaN where a problem failed), the number of iterations
+    performed, with the same meaning as the iteration count returned by Solutions, and a boolean
+    convergence flag. Problems that the scalar method would reject with a ValueError are reported as
+    not converged instead of raising.
+    """
+
+    @staticmethod
+    def _check(error: float, max_iter: int):
+        if error <= 0 or max_iter <= 0:
+            raise ValueError("Error and max_iter must be positive values.")
+
+    @staticmethod
+    def _args(args: tuple, size: int) -> tuple:
+        """Broadcasts every parameter to one value per problem, so a scalar is shared by all problems."""
+        np = load_numpy()
+        return tuple(np.broadcast_to(np.asarray(p), (size,)) for p in args)
+
+    @staticmethod
+    def _call(f: Callable, x, args: tuple, active):
+        """Evaluates f on the active problems, passing their slice of every parameter array."""
+        return load_numpy().asarray(f(x, *(p[active] for p in args)), dtype=float)
+
+    @staticmethod
+    def _results(size: int):
+        np = load_numpy()
+        return np.full(size, np.nan), np.zeros(size, dtype=int), np.zeros(size, dtype=bool)
+
+    @staticmethod
+    def bisection(f: Callable, a, b, error: float, max_iter: int, args: tuple = ()):
+        """
+        Bisection method applied to every bracket [a_k, b_k] at once.
+        Args:
+            f: Vectorized function for which to find the roots.
+            a: Array with the start of each interval.
+            b: Array with the end of each interval.
+            error: The acceptable error margin.
+            max_iter: The maximum number of iterations to perform.
+            args: Arrays of per-problem parameters passed to f after x.
+        Returns:
+            A tuple of arrays (roots, iterations, converged).
+        Raises:
+            ValueError: If error or max_iter are not positive.
+        """
+        BatchSolutions._check(error, max_iter)
+        np = load_numpy()
+        a = np.array(a, dtype=float)
+        b = np.array(b, dtype=float)
+        roots, iterations, converged = BatchSolutions._results(a.size)
+        args = BatchSolutions._args(args, a.size)
+        everything = np.arange(a.size)
+        F_a = BatchSolutions._call(f, a, args, everything)
+        active = np.flatnonzero(F_a * BatchSolutions._call(f, b, args, everything) < 0) # Brackets without a sign change fail
+        a, b, F_a = a[active], b[active], F_a[active]
+        i = 0
+        while i <= max_iter and active.size:
+            x = (a + b) / 2
+            F_x = BatchSolutions._call(f, x, args, active)
+            done = (F_x == 0) | ((b - a) / 2 < error)
+            roots[active[done]] = x[done]
+            iterations[active[done]] = i
+            converged[active[done]] = True
+            keep = ~done
+            active, a, b, F_a, x, F_x = active[keep], a[keep], b[keep], F_a[keep], x[keep], F_x[keep]
+            same_sign = F_a * F_x > 0
+            a = np.where(same_sign, x, a)
+            F_a = np.where(same_sign, F_x, F_a)
+            b = np.where(same_sign, b, x)
+            i += 1
+        iterations[active] = i
+        return roots, iterations, converged
+
+    @staticmethod
+    def regula_falsi(f: Callable, a, b, error: float, max_iter: int, args: tuple = ()):
+        """
+        Regula Falsi method applied to every bracket [a_k, b_k] at once.
+        Args:
+            f: Vectorized function for which to find the roots.
+            a: Array with the start of each interval.
+            b: Array with the end of each interval.
+            error: The acceptable error margin.
+            max_iter: The maximum number of iterations to perform.
+            args: Arrays of per-problem parameters passed to f after x.
+        Returns:
+            A tuple of arrays (roots, iterations, converged).
+        Raises:
+            ValueError: If error or max_iter are not positive.
+        """
+        BatchSolutions._check(error, max_iter)
+        np = load_numpy()
+        a = np.array(a, dtype=float)
+        b = np.array(b, dtype=float)
+        roots, iterations, converged = BatchSolutions._results(a.size)
+        args = BatchSolutions._args(args, a.size)
+        everything = np.arange(a.size)
+        F_a = BatchSolutions._call(f, a, args, everything)
+        F_b = BatchSolutions._call(f, b, args, everything)
+        active = np.flatnonzero(F_a * F_b < 0)
+        a, b, F_a, F_b = a[active], b[active], F_a[active], F_b[active]
+        i = 0
+        while i <= max_iter and active.size:
+            x = (a * F_b - b * F_a) / (F_b - F_a)
+            F_x = BatchSolutions._call(f, x, args, active)
+            done = (F_x == 0) | (np.abs(F_x) < error)
+            roots[active[done]] = x[done]
+            iterations[active[done]] = i
+            converged[active[done]] = True
+            keep = ~done
+            active, a, b, F_a, F_b, x, F_x = active[keep], a[keep], b[keep], F_a[keep], F_b[keep], x[keep], F_x[keep]
+            same_sign = F_a * F_x > 0
+            a, F_a = np.where(same_sign, x, a), np.where(same_sign, F_x, F_a)
+            b, F_b = np.where(same_sign, b, x), np.where(same_sign, F_b, F_x)
+            i += 1
+        iterations[active] = i
+        return roots, iterations, converged
+
+    @staticmethod
+    def newton_raphson(f: Callable, df: Callable, x0, error: float, max_iter: int, args: tuple = ()):
+        """
+        Newton-Raphson method applied to every initial guess at once.
+        Args:
+            f: Vectorized function for which to find the roots.
+            df: Vectorized derivative of f.
+            x0: Array of initial guesses.
+            error: The acceptable error margin.
+            max_iter: The maximum number of iterations to perform.
+            args: Arrays of per-problem parameters passed to f (and df) after x.
+        Returns:
+            A tuple of arrays (roots, iterations, converged). Problems where the derivative
+            vanishes stop without converging.
+        Raises:
+            ValueError: If error or max_iter are not positive.
+        """
+        BatchSolutions._check(error, max_iter)
+        np = load_numpy()
+        x = np.array(x0, dtype=float)
+        roots, iterations, converged = BatchSolutions._results(x.size)
+        args = BatchSolutions._args(args, x.size)
+        active = np.arange(x.size)
+        i = 0
+        while i <= max_iter and active.size:
+            df_x = BatchSolutions._call(df, x, args, active)
+            failed = df_x == 0
+            iterations[active[failed]] = i
+            active, x, df_x = active[~failed], x[~failed], df_x[~failed]
+            x_new = x - BatchSolutions._call(f, x, args, active) / df_x
+            done = np.abs(x_new - x) < error
+            roots[active[done]] = x_new[done]
+            iterations[active[done]] = i
+            converged[active[done]] = True
+            active, x = active[~done], x_new[~done]
+            i += 1
+        iterations[active] = i
+        return roots, iterations, converged
+
+    @staticmethod
+    def secant(f: Callable, x0, x1, error: float, max_iter: int, args: tuple = ()):
+        """
+        Secant method applied to every pair of initial guesses at once.
+        The function values of the previous step are carried forward, so each iteration
+        evaluates f once per active problem.
+        Args:
+            f: Vectorized function for which to find the roots.
+            x0: Array of first initial guesses.
+            x1: Array of second initial guesses.
+            error: The acceptable error margin.
+            max_iter: The maximum number of iterations to perform.
+            args: Arrays of per-problem parameters passed to f after x.
+        Returns:
+            A tuple of arrays (roots, iterations, converged). Problems where f(x1) == f(x0)
+            stop without converging.
+        Raises:
+            ValueError: If error or max_iter are not positive.
+        """
+        BatchSolutions._check(error, max_iter)
+        np = load_numpy()
+        x0 = np.array(x0, dtype=float)
+        x1 = np.array(x1, dtype=float)
+        roots, iterations, converged = BatchSolutions._results(x0.size)
+        args = BatchSolutions._args(args, x0.size)
+        active = np.arange(x0.size)
+        f_x0 = BatchSolutions._call(f, x0, args, active)
+        f_x1 = BatchSolutions._call(f, x1, args, active)
+        i = 0
+        while i <= max_iter and active.size:
+            failed = f_x1 == f_x0
+            iterations[active[failed]] = i
+            keep = ~failed
+            active, x0, x1, f_x0, f_x1 = active[keep], x0[keep], x1[keep], f_x0[keep], f_x1[keep]
+            x2 = x1 - f_x1 * (x1 - x0) / (f_x1 - f_x0)
+            done = np.abs(x2 - x1) < error
+            roots[active[done]] = x2[done]
+            iterations[active[done]] = i
+            converged[active[done]] = True
+            keep = ~done
+            active, x0, x1, f_x0, f_x1 = active[keep], x1[keep], x2[keep], f_x1[keep], None
+            if active.size:
+                f_x1 = BatchSolutions._call(f, x1, args, active)
+            i += 1
+        iterations[active] = i
+        return roots, iterations, converged
@@ -0,0 +1,135 @@
+from array import array
+from typing import List, Sequence, Tuple
+
+
+class CSRMatrix:
+    """
+    A sparse matrix in compressed sparse row (CSR) format.
+    The nonzero entries of row i are data[indptr[i]:indptr[i + 1]], in the columns
+    indices[indptr[i]:indptr[i + 1]], so storage is O(nnz) instead of O(n^2).
+    Attributes:
+        data (array): The nonzero values, row by row.
+        indices (array): The column index of each value in data.
+        indptr (array): The offset in data where each row starts, with a final entry equal to nnz.
+        shape (tuple): The number of rows and columns.
+    """
+
+    def __init__(self, data: Sequence[float], indices: Sequence[int], indptr: Sequence[int], shape: Tuple[int, int]):
+        rows, cols = shape
+        if len(indptr) != rows + 1:
+            raise ValueError("indptr must have one entry per row plus one.")
+        if len(data) != len(indices) or indptr[0] != 0 or indptr[-1] != len(data):
+            raise ValueError("data, indices and indptr do not describe the same number of nonzeros.")
+        if any(indptr[i] > indptr[i + 1] for i in range(rows)):
+            raise ValueError("indptr must be non-decreasing.")
+        if any(j < 0 or j >= cols for j in indices):
+            raise ValueError("Column index out of range.")
+        self.data = array("d", data)
+        self.indices = array("q", indices)
+        self.indptr = array("q", indptr)
+        self.shape = (rows, cols)
+
+    @classmethod
+    def from_triplets(cls, rows: Sequence[int], cols: Sequence[int], values: Sequence[float], shape: Tuple[int, int]) -> "CSRMatrix":
+        """
+        Builds a CSR matrix from (row, column, value) triplets.
+        Duplicate entries are summed and columns are sorted within each row.
+        Args:
+            rows (list): Row index of each entry.
+            cols (list): Column index of each entry.
+            values (list): Value of each entry.
+            shape (tuple): The number of rows and columns.
+        Returns:
+            CSRMatrix: The assembled matrix.
+        Raises:
+            ValueError: If the triplet lists differ in length or an index is out of range.
+        """
+        if not len(rows) == len(cols) == len(values):
+            raise ValueError("rows, cols and values must have the same length.")
+        n_rows = shape[0]
+        buckets: List[dict] = [{} for _ in range(n_rows)]
+        for i, j, v in zip(rows, cols, values):
+            if i < 0 or i >= n_rows:
+                raise ValueError("Row index out of range.")
+            bucket = buckets[i]
+            bucket[j] = bucket.get(j, 0.0) + v
+        data = array("d")
+        indices = array("q")
+        indptr = array("q", [0])
+        for bucket in buckets:
+            for j in sorted(bucket):
+                indices.append(j)
+                data.append(bucket[j])
+            indptr.append(len(data))
+        return cls(data, indices, indptr, shape)
+
+    @classmethod
+    def from_dense(cls, matrix: List[List[float]]) -> "CSRMatrix":
+        """
+        Builds a CSR matrix from a list of lists, dropping the zero entries.
+        Args:
+            matrix (list): A list of lists representing a dense matrix.
+        Returns:
+            CSRMatrix: The compressed matrix.
+        """
+        data = array("d")
+        indices = array("q")
+        indptr = array("q", [0])
+        for row in matrix:
+            for j, v in enumerate(row):
+                if v != 0:
+                    indices.append(j)
+                    data.append(v)
+            indptr.append(len(data))
+        cols = len(matrix[0]) if matrix else 0
+        return cls(data, indices, indptr, (len(matrix), cols))
+
+    @property
+    def nnz(self) -> int:
+        """The number of stored entries."""
+        return len(self.data)
+
+    def diagonal(self) -> List[float]:
+        """
+        Returns the main diagonal, with zeros where no entry is stored.
+        Returns:
+            list: The diagonal entries.
+        """
+        diagonal = [0.0] * min(self.shape)
+        data, indices, indptr = self.data, self.indices, self.indptr
+        for i in range(len(diagonal)):
+            for k in range(indptr[i], indptr[i + 1]):
+                if indices[k] == i:
+                    diagonal[i] += data[k]
+        return diagonal
+
+    def matvec(self, x: Sequence[float]) -> List[float]:
+        """
+        Computes the product of the matrix with a vector in O(nnz).
+        Args:
+            x (list): A vector with one entry per column.
+        Returns:
+            list: The product vector.
+        Raises:
+            ValueError: If x has the wrong size.
+        """
+        if len(x) != self.shape[1]:
+            raise ValueError("Vector size does not match the number of columns.")
+        data, indices, indptr = self.data, self.indices, self.indptr
+        return [
+            sum(data[k] * x[indices[k]] for k in range(indptr[i], indptr[i + 1]))
+            for i in range(self.shape[0])
+        ]
+
+    def to_dense(self) -> List[List[float]]:
+        """
+        Expands the matrix to a list of lists.
+        Returns:
+            list: The dense matrix.
+        """
+        dense = [[0.0] * self.shape[1] for _ in range(self.shape[0])]
+        for i in range(self.shape[0]):
+            row = dense[i]
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                row[self.indices[k]] += self.data[k]
+        return dense
@@ -0,0 +1,205 @@
+import math
+from typing import Callable, List, Sequence, Tuple, Union
+
+Number = Union[int, float]
+
+
+class Dual:
+    """
+    A dual number value + derivative * eps, with eps**2 = 0, for forward-mode automatic differentiation.
+    Arithmetic on Dual numbers propagates exact derivatives, so evaluating an ordinary function on
+    Dual(x, 1) yields f(x) and f'(x) at once. The elementary functions are available both as methods
+    (so NumPy ufuncs such as numpy.sin work on object arrays of Dual numbers) and as the module level
+    functions sin, cos, tan, exp, log, sqrt, arctan, sinh, cosh and tanh, which also accept plain numbers.
+    Attributes:
+        value (float): The real part.
+        derivative (float): The coefficient of eps.
+    """
+
+    __slots__ = ("value", "derivative")
+
+    def __init__(self, value: Number, derivative: Number = 0.0):
+        self.value = value
+        self.derivative = derivative
+
+    def __repr__(self) -> str:
+        return f"Dual({self.value!r}, {self.derivative!r})"
+
+    @staticmethod
+    def _lift(other) -> "Dual":
+        return other if isinstance(other, Dual) else Dual(other, 0.0)
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, self.derivative + other.derivative)
+        if isinstance(other, (int, float)):
+            return Dual(self.value + other, self.derivative)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value - other.value, self.derivative - other.derivative)
+        if isinstance(other, (int, float)):
+            return Dual(self.value - other, self.derivative)
+        return NotImplemented
+
+    def __rsub__(self, other):
+        if isinstance(other, (int, float)):
+            return Dual(other - self.value, -self.derivative)
+        return NotImplemented
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value * other.value, self.derivative * other.value + self.value * other.derivative)
+        if isinstance(other, (int, float)):
+            return Dual(self.value * other, self.derivative * other)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value / other.value, (self.derivative * other.value - self.value * other.derivative) / other.value**2)
+        if isinstance(other, (int, float)):
+            return Dual(self.value / other, self.derivative / other)
+        return NotImplemented
+
+    def __rtruediv__(self, other):
+        if isinstance(other, (int, float)):
+            return Dual(other / self.value, -other * self.derivative / self.value**2)
+        return NotImplemented
+
+    def __pow__(self, other):
+        if isinstance(other, (int, float)):
+            if other == 0:
+                return Dual(1.0, 0.0)
+            return Dual(self.value**other, other * self.value ** (other - 1) * self.derivative)
+        if isinstance(other, Dual):
+            return (other * self.log()).exp()
+        return NotImplemented
+
+    def __rpow__(self, other):
+        if isinstance(other, (int, float)):
+            value = other**self.value
+            return Dual(value, value * math.log(other) * self.derivative)
+        return NotImplemented
+
+    def __neg__(self):
+        return Dual(-self.value, -self.derivative)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self if self.value >= 0 else -self
+
+    # Comparisons only look at the value, so branches in the differentiated function work as usual
+    def __eq__(self, other):
+        return self.value == Dual._lift(other).value
+
+    def __ne__(self, other):
+        return self.value != Dual._lift(other).value
+
+    def __lt__(self, other):
+        return self.value < Dual._lift(other).value
+
+    def __le__(self, other):
+        return self.value <= Dual._lift(other).value
+
+    def __gt__(self, other):
+        return self.value > Dual._lift(other).value
+
+    def __ge__(self, other):
+        return self.value >= Dual._lift(other).value
+
+    __hash__ = None # type: ignore
+
+    def sin(self):
+        return Dual(math.sin(self.value), math.cos(self.value) * self.derivative)
+
+    def cos(self):
+        return Dual(math.cos(self.value), -math.sin(self.value) * self.derivative)
+
+    def tan(self):
+        return Dual(math.tan(self.value), self.derivative / math.cos(self.value) ** 2)
+
+    def exp(self):
+        value = math.exp(self.value)
+        return Dual(value, value * self.derivative)
+
+    def log(self):
+        return Dual(math.log(self.value), self.derivative / self.value)
+
+    def sqrt(self):
+        value = math.sqrt(self.value)
+        return Dual(value, self.derivative / (2 * value))
+
+    def arctan(self):
+        return Dual(math.atan(self.value), self.derivative / (1 + self.value**2))
+
+    def sinh(self):
+        return Dual(math.sinh(self.value), math.cosh(self.value) * self.derivative)
+
+    def cosh(self):
+        return Dual(math.cosh(self.value), math.sinh(self.value) * self.derivative)
+
+    def tanh(self):
+        value = math.tanh(self.value)
+        return Dual(value, (1 - value**2) * self.derivative)
+
+    @staticmethod
+    def derivative_of(f: Callable[["Dual"], "Dual"], x: float) -> Tuple[float, float]:
+        """
+        Evaluates a scalar function and its exact derivative at x.
+        Args:
+            f: The function, written with Dual-aware operations.
+            x: The point of evaluation.
+        Returns:
+            A tuple containing f(x) and f'(x).
+        """
+        result = f(Dual(x, 1.0))
+        if isinstance(result, Dual):
+            return result.value, result.derivative
+        return result, 0.0
+
+    @staticmethod
+    def jacobian(f: Callable[[List["Dual"]], Sequence], x: Sequence[float]) -> Tuple[List[float], List[List[float]]]:
+        """
+        Computes F(x) and the exact Jacobian of F: R^n -> R^m with n forward passes, one per input direction.
+        Args:
+            f: The vector function, taking and returning a sequence, written with Dual-aware operations.
+            x: The point of evaluation.
+        Returns:
+            A tuple containing the list F(x) and the Jacobian as a list of m rows.
+        """
+        n = len(x)
+        values: List[float] = []
+        columns = []
+        for j in range(n):
+            outputs = list(f([Dual(x[i], 1.0 if i == j else 0.0) for i in range(n)]))
+            if j == 0:
+                values = [o.value if isinstance(o, Dual) else o for o in outputs]
+            columns.append([o.derivative if isinstance(o, Dual) else 0.0 for o in outputs])
+        return values, [[columns[j][i] for j in range(n)] for i in range(len(values))]
+
+
+def _elementary(name: str, function: Callable[[float], float]) -> Callable:
+    def apply(x):
+        return getattr(x, name)() if isinstance(x, Dual) else function(x)
+    apply.__name__ = name
+    apply.__doc__ = f"{name} that works on plain numbers and Dual numbers."
+    return apply
+
+
+sin = _elementary("sin", math.sin)
+cos = _elementary("cos", math.cos)
+tan = _elementary("tan", math.tan)
+exp = _elementary("exp", math.exp)
+log = _elementary("log", math.log)
+sqrt = _elementary("sqrt", math.sqrt)
+arctan = _elementary("arctan", math.atan)
+sinh = _elementary("sinh", math.sinh)
+cosh = _elementary("cosh", math.cosh)
+tanh = _elementary("tanh", math.tanh)
@@ -1,3 +1,10 @@
+import math
+from itertools import islice
+from typing import Iterable, Union
+
+from .Backend import ZERO_POLICIES, Backend, resolve_backend
+
+
 class Errors:
     """
     A class to calculate different types of errors between true values and approximate values.
@@ -37,4 +44,205 @@ class Errors:
         """
         if true_value == 0:
             raise ValueError("True value cannot be zero for percentage error calculation.")
-        return abs((true_value - approx_value) / true_value) * 100
\ No newline at end of file
+        return abs((true_value - approx_value) / true_value) * 100
+
+    @staticmethod
+    def absolute_errors(true_values, approx_values, backend: Union[str, Backend] = None): # type: ignore
+        """
+        Calculate the absolute errors elementwise in one pass.
+
+        :param true_values: The true values, a sequence or a NumPy array.
+        :param approx_values: The approximate values, of the same length.
+        :param backend: "python" or "numpy"; by default NumPy when either input is an array, else the default backend.
+        :return: A list with the Python backend, a NumPy array with the NumPy backend.
+        """
+        Errors._check_lengths(true_values, approx_values)
+        return resolve_backend(backend, true_values, approx_values).absolute_errors(true_values, approx_values)
+
+    @staticmethod
+    def relative_errors(true_values, approx_values, zero: str = "nan", backend: Union[str, Backend] = None): # type: ignore
+        """
+        Calculate the relative errors elementwise in one pass.
+        Where a true value is zero the relative error is undefined, and zero selects the result:
+        "nan" gives NaN, "inf" gives infinity (0 if the approximate value is also zero),
+        "absolute" falls back to the absolute error, and "raise" raises a ValueError as relative_error does.
+
+        :param true_values: The true values, a sequence or a NumPy array.
+        :param approx_values: The approximate values, of the same length.
+        :param zero: The policy for zero true values.
+        :param backend: "python" or "numpy", see absolute_errors.
+        :return: A list with the Python backend, a NumPy array with the NumPy backend.
+        """
+        if zero not in ZERO_POLICIES:
+            raise ValueError("Unknown zero policy. Use 'nan', 'inf', 'absolute' or 'raise'.")
+        Errors._check_lengths(true_values, approx_values)
+        return resolve_backend(backend, true_values, approx_values).relative_errors(true_values, approx_values, zero)
+
+    @staticmethod
+    def percentage_errors(true_values, approx_values, zero: str = "nan", backend: Union[str, Backend] = None): # type: ignore
+        """
+        Calculate the percentage errors elementwise in one pass, see relative_errors for the zero policy.
+
+        :param true_values: The true values, a sequence or a NumPy array.
+        :param approx_values: The approximate values, of the same length.
+        :param zero: The policy for zero true values.
+        :param backend: "python" or "numpy", see absolute_errors.
+        :return: A list with the Python backend, a NumPy array with the NumPy backend.
+        """
+        errors = Errors.relative_errors(true_values, approx_values, zero, backend)
+        if isinstance(errors, list):
+            return [e * 100 for e in errors]
+        return errors * 100
+
+    @staticmethod
+    def _check_lengths(true_values, approx_values) -> None:
+        if hasattr(true_values, "__len__") and hasattr(approx_values, "__len__") and len(true_values) != len(approx_values):
+            raise ValueError("true_values and approx_values must have the same length.")
+
+    @staticmethod
+    def statistics(
+        true_values: Iterable[float],
+        approx_values: Iterable[float],
+        kind: str = "absolute",
+        zero: str = "nan",
+        chunk_size: int = 65536,
+        backend: Union[str, Backend] = None, # type: ignore
+    ) -> "ErrorStatistics":
+        """
+        Stream two sequences of values in chunks and accumulate the statistics of their errors,
+        so generators of any length can be validated in bounded memory.
+
+        :param true_values: The true values, any iterable.
+        :param approx_values: The approximate values, in the same order.
+        :param kind: "absolute", "relative" or "percentage".
+        :param zero: The policy for zero true values, see relative_errors.
+        :param chunk_size: Number of pairs processed together.
+        :param backend: "python" or "numpy", the default backend when None.
+        :return: The ErrorStatistics of the errors.
+        """
+        metrics = {"absolute": None, "relative": Errors.relative_errors, "percentage": Errors.percentage_errors}
+        if kind not in metrics:
+            raise ValueError("Unknown kind. Use 'absolute', 'relative' or 'percentage'.")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive value.")
+        Errors._check_lengths(true_values, approx_values)
+        statistics = ErrorStatistics()
+        pairs = zip(true_values, approx_values)
+        chunk = list(islice(pairs, chunk_size))
+        while chunk:
+            t, a = zip(*chunk)
+            if kind == "absolute":
+                statistics.update(Errors.absolute_errors(t, a, backend), backend)
+            else:
+                statistics.update(metrics[kind](t, a, zero, backend), backend)
+            chunk = list(islice(pairs, chunk_size))
+        return statistics
+
+
+class ErrorStatistics:
+    """
+    Streaming accumulator of error statistics: count, maximum, mean, RMS and variance.
+    Each chunk is summarized with a two-pass mean and sum of squared deviations, and the summaries
+    are combined with the parallel form of Welford's algorithm (Chan et al.), which is also how
+    accumulators filled by different worker processes are merged. NaN errors, such as those of the
+    "nan" zero policy of Errors.relative_errors, are counted in ignored and left out of the statistics.
+    Attributes:
+        count (int): Number of errors accumulated.
+        ignored (int): Number of NaN errors skipped.
+        maximum (float): The largest error, -inf while empty.
+        mean (float): The mean error.
+        m2 (float): The sum of squared deviations from the mean.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.ignored = 0
+        self.maximum = -math.inf
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def _combine(self, count: int, mean: float, m2: float, maximum: float) -> None:
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.maximum = max(self.maximum, maximum)
+
+    def update(self, errors: Union[Iterable[float], float], backend: Union[str, Backend] = None) -> "ErrorStatistics": # type: ignore
+        """
+        Add a chunk of errors, or a single error.
+
+        :param errors: An iterable or NumPy array of errors, or a number.
+        :param backend: "python" or "numpy"; by default NumPy for arrays, else the default backend.
+        :return: The accumulator itself.
+        """
+        if isinstance(errors, (int, float)):
+            errors = [errors]
+        count, ignored, mean, m2, maximum = resolve_backend(backend, errors).error_summary(errors)
+        self.ignored += ignored
+        self._combine(count, mean, m2, maximum)
+        return self
+
+    def consume(self, chunks: Iterable[Iterable[float]]) -> "ErrorStatistics":
+        """
+        Add every chunk produced by an iterable, such as a generator reading results from disk.
+
+        :param chunks: An iterable of chunks of errors.
+        :return: The accumulator itself.
+        """
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+    def merge(self, other: "ErrorStatistics") -> "ErrorStatistics":
+        """
+        Add the statistics gathered by another accumulator, for example in a worker process.
+
+        :param other: The accumulator to merge into this one.
+        :return: The accumulator itself.
+        """
+        self._combine(other.count, other.mean, other.m2, other.maximum)
+        self.ignored += other.ignored
+        return self
+
+    def __add__(self, other: "ErrorStatistics") -> "ErrorStatistics":
+        return ErrorStatistics.from_dict(self.to_dict()).merge(other)
+
+    @property
+    def variance(self) -> float:
+        """The population variance of the errors, NaN while empty."""
+        return self.m2 / self.count if self.count else math.nan
+
+    @property
+    def sample_variance(self) -> float:
+        """The sample variance of the errors, NaN with fewer than two errors."""
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def rms(self) -> float:
+        """The root mean square of the errors, NaN while empty."""
+        return math.sqrt(self.mean * self.mean + self.variance) if self.count else math.nan
+
+    def to_dict(self) -> dict:
+        """
+        Serialize the accumulator to a JSON-compatible dictionary, to send it between processes.
+
+        :return: A dictionary holding the accumulated state.
+        """
+        return {"count": self.count, "ignored": self.ignored, "maximum": self.maximum, "mean": self.mean, "m2": self.m2}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ErrorStatistics":
+        """
+        Rebuild an accumulator from the output of to_dict.
+
+        :param data: A dictionary produced by to_dict.
+        :return: The reloaded ErrorStatistics.
+        """
+        statistics = cls()
+        for key in ("count", "ignored", "maximum", "mean", "m2"):
+            setattr(statistics, key, data[key])
+        return statistics
@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class Evaluator:
+    """
+    Wraps an expensive function with a bounded LRU cache and a hard limit on the number of evaluations.
+    An Evaluator is an opt-in wrapper: it is called like the function it wraps, so it can be passed as
+    f to any Solutions method, which otherwise calls f directly with no caching or limit.
+    Attributes:
+        f (callable): The wrapped function.
+        cache_size (int): Maximum number of cached values, 0 disables the cache.
+        max_evaluations (int | None): Maximum number of calls to f, None for no limit.
+        evaluations (int): Number of times f was actually called.
+        saved (int): Number of calls answered from the cache.
+    """
+
+    def __init__(self, f: Callable[[float], float], cache_size: int = 128, max_evaluations: Optional[int] = None):
+        if cache_size < 0:
+            raise ValueError("cache_size must not be negative.")
+        if max_evaluations is not None and max_evaluations <= 0:
+            raise ValueError("max_evaluations must be a positive value.")
+        self.f = f
+        self.cache_size = cache_size
+        self.max_evaluations = max_evaluations
+        self.evaluations = 0
+        self.saved = 0
+        self._cache: OrderedDict = OrderedDict()
+
+    @property
+    def calls(self) -> int:
+        """Total number of calls made to the evaluator, cached or not."""
+        return self.evaluations + self.saved
+
+    def __call__(self, x):
+        """
+        Returns f(x), from the cache when x was evaluated recently.
+        Raises:
+            ValueError: If evaluating f would exceed max_evaluations.
+        """
+        cacheable = self.cache_size > 0
+        if cacheable:
+            try:
+                value = self._cache[x]
+            except KeyError:
+                pass
+            except TypeError:
+                cacheable = False # Unhashable points are evaluated without caching
+            else:
+                self._cache.move_to_end(x)
+                self.saved += 1
+                return value
+        if self.max_evaluations is not None and self.evaluations >= self.max_evaluations:
+            raise ValueError("Maximum number of function evaluations exceeded.")
+        value = self.f(x)
+        self.evaluations += 1
+        if cacheable:
+            self._cache[x] = value
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False) # Evict the least recently used point
+        return value
+
+    def reset(self) -> None:
+        """Clears the cache and the counters, keeping the configuration."""
+        self._cache.clear()
+        self.evaluations = 0
+        self.saved = 0
@@ -1,14 +1,71 @@
-from typing import List,Tuple
+from array import array
+from bisect import bisect_right
+from itertools import islice
+from typing import Iterable, List, Sequence, Tuple, Union
+
+from .Backend import Backend, is_array, load_numpy, resolve_backend
+
+
+def _copy(values: Sequence[float]) -> Sequence[float]:
+    """Copies a list, array('d'), memoryview or NumPy array into a sequence of the same kind."""
+    if isinstance(values, memoryview):
+        return memoryview(array(values.format, values))
+    if isinstance(values, array):
+        return array(values.typecode, values)
+    return values.copy() if hasattr(values, "copy") else list(values)
+
+
+def _appended(values: Sequence[float], value: float) -> Sequence[float]:
+    """Returns a new sequence of the same kind as values with value appended, leaving values untouched."""
+    if isinstance(values, memoryview):
+        return memoryview(array(values.format, values) + array(values.format, [value]))
+    if isinstance(values, array):
+        return values + array(values.typecode, [value])
+    if is_array(values):
+        return load_numpy().append(values, value)
+    return list(values) + [value]
+
+
+def _removed(values: Sequence[float], index: int) -> Sequence[float]:
+    """Returns a new sequence of the same kind as values without the entry at index, leaving values untouched."""
+    index = range(len(values))[index]  # Normalizes negative indices, raises IndexError when out of range
+    if isinstance(values, memoryview):
+        return memoryview(array(values.format, values[:index]) + array(values.format, values[index + 1:]))
+    if isinstance(values, array):
+        return values[:index] + values[index + 1:]
+    if is_array(values):
+        return load_numpy().delete(values, index)
+    return list(values[:index]) + list(values[index + 1:])
+
+
+def _is_increasing(values: Sequence[float]) -> bool:
+    """Checks that values are strictly increasing, with a single vectorized pass for NumPy arrays."""
+    if type(values).__module__ == "numpy":
+        return bool((values[1:] > values[:-1]).all())
+    return all(a < b for a, b in zip(values, islice(values, 1, None)))
+
+
 class Interpolation:
     
-    def __init__(self, x_values: List[float], y_values: List[float]):
+    def __init__(self, x_values: List[float], y_values: List[float], copy: bool = False):
+        """
+        Args:
+            x_values: The nodes, as a list or any sequence such as array('d'), a NumPy array or a memoryview.
+            y_values: The values at the nodes.
+            copy: Whether to copy the inputs. By default they are referenced, not copied.
+        """
         if len(x_values) != len(y_values):
             raise ValueError("x_values and y_values must have the same length.")    # Ensure both lists have the same length
-        if len(set(x_values)) != len(x_values): # Check for distinct x_values
+        # Sorted nodes, the usual case, are checked in one pass without building a set
+        if not _is_increasing(x_values) and len(set(x_values)) != len(x_values): # Check for distinct x_values
             raise ValueError("x_values must be distinct for interpolation.")
-        self.x_values = x_values
-        self.y_values = y_values
+        self.x_values = _copy(x_values) if copy else x_values
+        self.y_values = _copy(y_values) if copy else y_values
         self.n = len(x_values)
+        self._spline = None
+        self._weights = None
+        self._newton_coef = None
+        self._newton_tail = None
 
     def lagrange(self, x: float) -> float:
 
@@ -30,20 +87,128 @@ class Interpolation:
             result += term
         return result
     
-    def _divided_differences(self) -> list:
-        """Compute the divided differences table."""
-        n = self.n
-        coef = [[0 for _ in range(n)] for _ in range(n)]
-        for i in range(n):
-            coef[i][0] = self.y_values[i]
-        for j in range(1, n):
-            for i in range(n - j):
-                coef[i][j] = (coef[i + 1][j - 1] - coef[i][j - 1]) / (self.x_values[i + j] - self.x_values[i]) 
-        return coef
+    def _barycentric_weights(self) -> List[float]:
+        """Compute the barycentric weights w_j = 1 / prod_{k != j} (x_j - x_k) once and cache them."""
+        if self._weights is None:
+            weights = []
+            for j in range(self.n):
+                product = 1.0
+                for k in range(self.n):
+                    if k != j:
+                        product *= self.x_values[j] - self.x_values[k]
+                weights.append(1.0 / product)
+            self._weights = weights
+        return self._weights
+
+    def barycentric_lagrange(self, x: float) -> float:
+        """
+        Compute the Lagrange interpolation polynomial at a given point x using the barycentric formula.
+        The weights are computed on first use, so each evaluation afterwards costs O(n).
+        Args:
+            x: The point at which to evaluate the interpolation polynomial.
+        Returns:
+            The value of the interpolation polynomial at x.
+        """
+        weights = self._barycentric_weights()
+        numerator = 0.0
+        denominator = 0.0
+        for x_j, y_j, w_j in zip(self.x_values, self.y_values, weights):
+            if x == x_j:
+                return y_j  # x is a node, the formula would divide by zero
+            term = w_j / (x - x_j)
+            numerator += term * y_j
+            denominator += term
+        return numerator / denominator
+
+    def barycentric_lagrange_many(self, xs: Iterable[float], backend: Union[str, Backend] = None) -> List[float]: # type: ignore
+        """
+        Compute the barycentric Lagrange interpolation polynomial at every point of xs.
+        Args:
+            xs: The points at which to evaluate the interpolation polynomial.
+            backend: "python" or "numpy"; by default NumPy for NumPy inputs, else the default backend.
+        Returns:
+            A list with the value of the interpolation polynomial at each point, an array with the NumPy backend.
+        """
+        weights = self._barycentric_weights()
+        return resolve_backend(backend, xs, self.x_values).barycentric(self.x_values, self.y_values, weights, xs)
+
+    def add_node(self, x: float, y: float) -> None:
+        """
+        Append the node (x, y), updating the cached barycentric weights and Newton coefficients in O(n).
+        The nodes are replaced by new sequences of the same kind (list, array, memoryview or NumPy array),
+        so the caller's data is never modified.
+        Args:
+            x: The abscissa of the new node.
+            y: The ordinate of the new node.
+        Raises:
+            ValueError: If x is already one of the x_values.
+        """
+        if x in self.x_values:
+            raise ValueError("x_values must be distinct for interpolation.")
+        if self._weights is not None:
+            weight = 1.0
+            for j, x_j in enumerate(self.x_values):
+                self._weights[j] /= x_j - x
+                weight *= x - x_j
+            self._weights.append(1.0 / weight)
+        self.x_values = _appended(self.x_values, x)
+        self.y_values = _appended(self.y_values, y)
+        self.n += 1
+        self._spline = None
+        if self._newton_coef is not None:
+            self._extend_newton(self.n - 1)
+
+    def remove_node(self, index: int) -> Tuple[float, float]:
+        """
+        Remove the node at the given index, updating the cached barycentric weights in O(n).
+        As in add_node, the nodes are replaced by new sequences of the same kind.
+        Args:
+            index: The position of the node to remove.
+        Returns:
+            The removed (x, y) pair.
+        Raises:
+            IndexError: If index is out of range.
+        """
+        x_r, y_r = self.x_values[index], self.y_values[index]
+        x_values = _removed(self.x_values, index)
+        y_values = _removed(self.y_values, index)
+        if self._weights is not None:
+            del self._weights[index]
+            for j, x_j in enumerate(x_values):
+                self._weights[j] *= x_j - x_r
+        self.x_values = x_values
+        self.y_values = y_values
+        self.n -= 1
+        self._spline = None
+        self._newton_coef = None  # Removing a node changes every coefficient after it
+        self._newton_tail = None
+        return x_r, y_r
+
+    def _newton_coefficients(self) -> List[float]:
+        """
+        Compute the top row of the divided differences table once and cache it.
+        Only the top row and the last diagonal of the table are kept, so memory is O(n).
+        """
+        if self._newton_coef is None:
+            self._newton_coef = []
+            self._newton_tail = []
+            for i in range(self.n):
+                self._extend_newton(i)
+        return self._newton_coef
+
+    def _extend_newton(self, i: int) -> None:
+        """Add the coefficient of node i to the cached Newton table in O(i)."""
+        x = self.x_values[i]
+        tail = [self.y_values[i]]  # Last diagonal of the table once node i is included
+        for k in range(1, i + 1):
+            tail.append((tail[k - 1] - self._newton_tail[k - 1]) / (x - self.x_values[i - k]))
+        self._newton_tail = tail
+        self._newton_coef.append(tail[-1])
 
     def newton(self, x: float) -> float:
         """
         Compute the Newton interpolation polynomial at a given point x.
+        The coefficients are computed on first use and the polynomial is evaluated with Horner's scheme.
         Args:
             x: The point at which to evaluate the interpolation polynomial.
         Returns:
@@ -51,14 +216,24 @@ class Interpolation:
         Raises:
             ValueError: If the x_values are not distinct.
         """ 
-        coef = self._divided_differences()
-        result = coef[0][0]
-        term = 1.0
-        for i in range(1, self.n):
-            term *= (x - self.x_values[i - 1])
-            result += coef[0][i] * term
+        coef = self._newton_coefficients()
+        result = coef[-1]
+        for i in range(self.n - 2, -1, -1):
+            result = result * (x - self.x_values[i]) + coef[i]
         return result
 
+    def newton_many(self, xs: Iterable[float], backend: Union[str, Backend] = None) -> List[float]: # type: ignore
+        """
+        Compute the Newton interpolation polynomial at every point of xs.
+        Args:
+            xs: The points at which to evaluate the interpolation polynomial.
+            backend: "python" or "numpy"; by default NumPy for NumPy inputs, else the default backend.
+        Returns:
+            A list with the value of the interpolation polynomial at each point, an array with the NumPy backend.
+        """
+        coef = self._newton_coefficients()
+        return resolve_backend(backend, xs, self.x_values).newton(coef, self.x_values, xs)
+
     def linear_spline(self, x: float) -> float:
         """
         Compute the linear spline interpolation at a given point x.
@@ -77,6 +252,16 @@ class Interpolation:
                 return self.y_values[i] + (self.y_values[i + 1] - self.y_values[i]) * (x - self.x_values[i]) / (self.x_values[i + 1] - self.x_values[i])
         raise ValueError("x is outside the range of x_values.")
 
+    def fit_cubic_spline(self) -> "CubicSpline":
+        """
+        Fit the natural cubic spline through the nodes once and cache it.
+        Returns:
+            The fitted CubicSpline, reused by subsequent calls to cubic_spline.
+        """
+        if self._spline is None:
+            self._spline = CubicSpline(self.x_values, self.y_values)
+        return self._spline
+
     def cubic_spline(self, x: float) -> float:
         """
         Compute the cubic spline interpolation at a given point x.
@@ -87,18 +272,51 @@ class Interpolation:
         Raises:
             ValueError: If x is outside the range of x_values.
         """
-        if x < self.x_values[0] or x > self.x_values[-1]:
-            raise ValueError("x is outside the range of x_values.")
-        n = self.n
-        h = [self.x_values[i + 1] - self.x_values[i] for i in range(n - 1)]
+        return self.fit_cubic_spline().evaluate(x)
+
+
+class CubicSpline:
+    """
+    A natural cubic spline whose coefficients are computed once at construction.
+    On the interval [x_i, x_i+1] the spline is
+        S_i(x) = a_i + b_i*dx + c_i*dx**2 + d_i*dx**3,  dx = x - x_i
+    and the interval containing a query point is located by binary search.
+    Attributes:
+        x_values (list): The spline knots, in strictly increasing order.
+        a, b, c, d (list): The coefficients of each cubic piece.
+    """
+
+    def __init__(self, x_values: List[float], y_values: List[float], copy: bool = False):
+        """
+        Args:
+            x_values: The knots, as a list or any sequence such as array('d'), a NumPy array or a memoryview.
+            y_values: The values at the knots.
+            copy: Whether to copy the inputs. By default the knots and the a coefficients are views
+                  of the caller's data, which must then not be modified.
+        """
+        if len(x_values) != len(y_values):
+            raise ValueError("x_values and y_values must have the same length.")
+        if len(x_values) < 2:
+            raise ValueError("At least two points are required for a cubic spline.")
+        if not _is_increasing(x_values):
+            raise ValueError("x_values must be strictly increasing for a cubic spline.")
+        self.x_values = _copy(x_values) if copy else x_values
+        self.a = _copy(y_values[:-1]) if copy else y_values[:-1]
+        self.b, self.c, self.d = self._coefficients(self.x_values, y_values)
+
+    @staticmethod
+    def _coefficients(x_values: List[float], y_values: List[float]) -> Tuple[list, list, list]:
+        """Solve the tridiagonal system of the natural spline and return (b, c, d)."""
+        n = len(x_values)
+        h = [x_values[i + 1] - x_values[i] for i in range(n - 1)]
         alpha = [0] * (n - 1)
         for i in range(1, n - 1):
-            alpha[i] = (3 / h[i]) * (self.y_values[i + 1] - self.y_values[i]) - (3 / h[i - 1]) * (self.y_values[i] - self.y_values[i - 1])
+            alpha[i] = (3 / h[i]) * (y_values[i + 1] - y_values[i]) - (3 / h[i - 1]) * (y_values[i] - y_values[i - 1])
         l = [1] + [0] * (n - 1)
         mu = [0] * (n - 1)
         z = [0] * n
         for i in range(1, n - 1):
-            l[i] = 2 * (self.x_values[i + 1] - self.x_values[i - 1]) - h[i - 1] * mu[i - 1]
+            l[i] = 2 * (x_values[i + 1] - x_values[i - 1]) - h[i - 1] * mu[i - 1]
             mu[i] = h[i] / l[i]
             z[i] = (alpha[i] - h[i - 1] * z[i - 1]) / l[i]
         l[n - 1] = 1
@@ -108,11 +326,246 @@ class Interpolation:
         d = [0] * (n - 1)
         for j in range(n - 2, -1, -1):
             c[j] = z[j] - mu[j] * c[j + 1]
-            b[j] = (self.y_values[j + 1] - self.y_values[j]) / h[j] - h[j] * (c[j + 1] + 2 * c[j]) / 3
+            b[j] = (y_values[j + 1] - y_values[j]) / h[j] - h[j] * (c[j + 1] + 2 * c[j]) / 3
             d[j] = (c[j + 1] - c[j]) / (3 * h[j])
-        for i in range(n - 1):
-            if self.x_values[i] <= x <= self.x_values[i + 1]:
-                dx = x - self.x_values[i]
-                return self.y_values[i] + b[i] * dx + c[i] * dx**2 + d[i] * dx**3
-        raise ValueError("x is outside the range of x_values.")
-    
\ No newline at end of file
+        return b, c[:-1], d
+
+    def _interval(self, x: float) -> int:
+        """Return the index i of the interval [x_i, x_i+1] that contains x."""
+        if x < self.x_values[0] or x > self.x_values[-1]:
+            raise ValueError("x is outside the range of x_values.")
+        return min(bisect_right(self.x_values, x) - 1, len(self.x_values) - 2)
+
+    def evaluate(self, x: float) -> float:
+        """
+        Evaluate the spline at a single point x in O(log n).
+        Args:
+            x: The point at which to evaluate the spline.
+        Returns:
+            The value of the spline at x.
+        Raises:
+            ValueError: If x is outside the range of x_values.
+        """
+        i = self._interval(x)
+        dx = x - self.x_values[i]
+        return self.a[i] + dx * (self.b[i] + dx * (self.c[i] + dx * self.d[i]))
+
+    def evaluate_many(self, xs: Iterable[float], backend: Union[str, Backend] = None) -> List[float]: # type: ignore
+        """
+        Evaluate the spline at every point of xs.
+        Args:
+            xs: The points at which to evaluate the spline.
+            backend: "python" or "numpy"; by default NumPy for NumPy inputs, else the default backend.
+        Returns:
+            A list with the value of the spline at each point, an array with the NumPy backend.
+        Raises:
+            ValueError: If any point is outside the range of x_values.
+        """
+        return resolve_backend(backend, xs, self.x_values).spline(self.x_values, self.a, self.b, self.c, self.d, xs)
+
+    def __call__(self, x):
+        """Evaluate the spline at a scalar x, or at every point of an iterable x."""
+        if isinstance(x, Iterable):
+            return self.evaluate_many(x)
+        return self.evaluate(x)
+
+    def to_dict(self) -> dict:
+        """
+        Serialize the fitted spline to a JSON-compatible dictionary.
+        Returns:
+            A dictionary holding the knots and the coefficient lists.
+        """
+        return {
+            "x_values": list(self.x_values),
+            "a": list(self.a),
+            "b": list(self.b),
+            "c": list(self.c),
+            "d": list(self.d),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CubicSpline":
+        """
+        Rebuild a spline from the output of to_dict without refitting it.
+        Args:
+            data: A dictionary produced by to_dict.
+        Returns:
+            The reloaded CubicSpline.
+        Raises:
+            ValueError: If the coefficient lists do not match the number of knots.
+        """
+        pieces = len(data["x_values"]) - 1
+        if pieces < 1 or any(len(data[key]) != pieces for key in ("a", "b", "c", "d")):
+            raise ValueError("Coefficient lists must have one entry per spline interval.")
+        spline = cls.__new__(cls)
+        spline.x_values = [float(x) for x in data["x_values"]]
+        for key in ("a", "b", "c", "d"):
+            setattr(spline, key, [float(v) for v in data[key]])
+        return spline
+
+
+class StreamingSpline:
+    """
+    A natural cubic spline over a sliding window of the most recent nodes of a stream.
+    The spline satisfies the same tridiagonal system as CubicSpline. A push adds one row to its forward
+    elimination and redoes the back substitution c_j = z_j - mu_j * c_j+1 only over the tail the new
+    node affects: since |mu_j| < 1/2, the correction shrinks at every step and the substitution stops
+    once it no longer changes c_j beyond the relative tolerance. Evicting the oldest node moves the
+    natural boundary condition to the next one, and the forward elimination is redone from the head
+    in the same way. Each push costs O(window) at worst, usually a few dozen operations.
+    The nodes are kept in lists whose evicted prefix is dropped once it reaches the window size,
+    so memory stays O(window) however long the stream runs.
+    Attributes:
+        window (int): The maximum number of nodes kept.
+        tolerance (float): Relative change below which a coefficient update stops propagating.
+    """
+
+    def __init__(self, window: int, tolerance: float = 1e-14):
+        if window < 2:
+            raise ValueError("window must be at least 2.")
+        if tolerance < 0:
+            raise ValueError("tolerance must be a non-negative value.")
+        self.window = window
+        self.tolerance = tolerance
+        self._start = 0  # Index of the oldest node in the lists below
+        self._x: List[float] = []
+        self._y: List[float] = []
+        self._mu: List[float] = []  # Forward elimination of the tridiagonal system
+        self._z: List[float] = []
+        self._c: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._x) - self._start
+
+    @property
+    def x_values(self) -> List[float]:
+        """The nodes currently in the window."""
+        return self._x[self._start:]
+
+    @property
+    def y_values(self) -> List[float]:
+        """The values at the nodes currently in the window."""
+        return self._y[self._start:]
+
+    def _converged(self, new: float, old: float) -> bool:
+        return abs(new - old) <= self.tolerance * abs(new)
+
+    def _row(self, i: int) -> Tuple[float, float]:
+        """Forward elimination step of the interior row i, returning (mu_i, z_i)."""
+        x, y = self._x, self._y
+        h_prev = x[i] - x[i - 1]
+        h = x[i + 1] - x[i]
+        alpha = (3 / h) * (y[i + 1] - y[i]) - (3 / h_prev) * (y[i] - y[i - 1])
+        l = 2 * (x[i + 1] - x[i - 1]) - h_prev * self._mu[i - 1]
+        return h / l, (alpha - h_prev * self._z[i - 1]) / l
+
+    def _back_substitute(self, j: int, converge: bool) -> None:
+        """Recomputes c_j, c_j-1, ... from c_j+1, stopping at the first unchanged coefficient when converge is set."""
+        c, mu, z = self._c, self._mu, self._z
+        while j > self._start:  # The first node keeps c = 0, the natural boundary condition
+            new = z[j] - mu[j] * c[j + 1]
+            if converge and self._converged(new, c[j]):
+                c[j] = new
+                return
+            c[j] = new
+            j -= 1
+
+    def push(self, x: float, y: float) -> None:
+        """
+        Appends a node to the stream, evicting the oldest one once the window is full.
+        Args:
+            x: The new node, greater than every node pushed before.
+            y: The value at the new node.
+        Raises:
+            ValueError: If x is not greater than the last node.
+        """
+        if len(self) and x <= self._x[-1]:
+            raise ValueError("x must be greater than the last pushed node.")
+        for values, value in ((self._x, x), (self._y, y), (self._mu, 0.0), (self._z, 0.0), (self._c, 0.0)):
+            values.append(value)
+        if len(self) >= 3:  # The previous last node becomes an interior row
+            last = len(self._x) - 2
+            self._mu[last], self._z[last] = self._row(last)
+            self._back_substitute(last, converge=True)
+        if len(self) > self.window:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drops the oldest node and redoes the forward elimination from the new head while it changes."""
+        self._start += 1
+        start = self._start
+        self._mu[start] = self._z[start] = self._c[start] = 0.0
+        last = len(self._x) - 2
+        k = start + 1
+        while k <= last:
+            mu, z = self._row(k)
+            done = self._converged(mu, self._mu[k]) and self._converged(z, self._z[k])
+            self._mu[k], self._z[k] = mu, z
+            if done:
+                break
+            k += 1
+        self._back_substitute(min(k, last), converge=False)
+        if start >= self.window:  # Drop the evicted prefix, amortized O(1) per push
+            for values in (self._x, self._y, self._mu, self._z, self._c):
+                del values[:start]
+            self._start = 0
+
+    def _interval(self, x: float) -> int:
+        """Return the list index i of the interval [x_i, x_i+1] that contains x."""
+        if len(self) < 2:
+            raise ValueError("At least two points are required for a cubic spline.")
+        if x < self._x[self._start] or x > self._x[-1]:
+            raise ValueError("x is outside the range of x_values.")
+        return min(bisect_right(self._x, x, self._start) - 1, len(self._x) - 2)
+
+    def _piece(self, i: int) -> Tuple[float, float, float, float]:
+        """Return the coefficients (a, b, c, d) of the cubic piece starting at list index i."""
+        h = self._x[i + 1] - self._x[i]
+        c, c_next = self._c[i], self._c[i + 1]
+        b = (self._y[i + 1] - self._y[i]) / h - h * (c_next + 2 * c) / 3
+        return self._y[i], b, c, (c_next - c) / (3 * h)
+
+    def evaluate(self, x: float) -> float:
+        """
+        Evaluate the spline at a single point x in O(log window).
+        Args:
+            x: The point at which to evaluate the spline.
+        Returns:
+            The value of the spline at x.
+        Raises:
+            ValueError: If x is outside the range of the window.
+        """
+        i = self._interval(x)
+        a, b, c, d = self._piece(i)
+        dx = x - self._x[i]
+        return a + dx * (b + dx * (c + dx * d))
+
+    def evaluate_many(self, xs: Iterable[float]) -> List[float]:
+        """
+        Evaluate the spline at every point of xs.
+        Args:
+            xs: The points at which to evaluate the spline.
+        Returns:
+            A list with the value of the spline at each point.
+        """
+        return [self.evaluate(x) for x in xs]
+
+    def __call__(self, x):
+        """Evaluate the spline at a scalar x, or at every point of an iterable x."""
+        if isinstance(x, Iterable):
+            return self.evaluate_many(x)
+        return self.evaluate(x)
+
+    def to_spline(self) -> CubicSpline:
+        """
+        Snapshot of the current window as a CubicSpline, without refitting it.
+        Returns:
+            A CubicSpline over the nodes in the window.
+        """
+        if len(self) < 2:
+            raise ValueError("At least two points are required for a cubic spline.")
+        pieces = [self._piece(i) for i in range(self._start, len(self._x) - 1)]
+        data = {"x_values": self.x_values}
+        for key, values in zip("abcd", zip(*pieces)):
+            data[key] = list(values)
+        return CubicSpline.from_dict(data)
@@ -0,0 +1,257 @@
+from math import sqrt
+from typing import Callable, List, Optional, Tuple
+
+from .Monitor import Monitor, instrumented
+
+Vector = List[float]
+
+
+def _dot(u: Vector, v: Vector) -> float:
+    return sum(a * b for a, b in zip(u, v))
+
+
+def _norm(u: Vector) -> float:
+    return sqrt(_dot(u, u))
+
+
+def _residual(matvec: Callable[[Vector], Vector], constants: Vector, x: Vector) -> Vector:
+    return [b - ax for b, ax in zip(constants, matvec(x))]
+
+
+def _start(constants: Vector, initial_guess: Optional[Vector]) -> Vector:
+    if initial_guess:
+        if len(initial_guess) != len(constants):
+            raise ValueError("Initial guess size does not match number of variables.")
+        return [float(v) for v in initial_guess]
+    return [0.0] * len(constants)
+
+
+class Krylov:
+    """
+    Krylov subspace solvers for A x = b that only access A through a matrix-vector product,
+    so they work both with a LinearSystem and in matrix-free mode.
+    Every method returns the solution together with the residual norm history ||b - A x_k||,
+    starting with the residual of the initial guess, and stops once that norm falls below
+    tolerance * ||b||.
+    A preconditioner is a callable returning M^-1 r for a residual r; see the *_preconditioner
+    methods of LinearSystem.
+    """
+
+    @staticmethod
+    @instrumented
+    def conjugate_gradient(
+        matvec: Callable[[Vector], Vector],
+        constants: Vector,
+        max_iterations: int = 1000,
+        tolerance: float = 1e-10,
+        initial_guess: Vector = None, # type: ignore
+        preconditioner: Callable[[Vector], Vector] = None, # type: ignore
+        *,
+        monitor: Monitor = None, # type: ignore
+    ) -> Tuple[Vector, List[float]]:
+        """
+        Preconditioned Conjugate Gradient method for symmetric positive definite systems.
+        Args:
+            matvec: Callable returning A x.
+            constants: The right-hand side b.
+            max_iterations: Maximum number of iterations.
+            tolerance: Convergence tolerance relative to ||b||.
+            initial_guess: Initial guess for the solution.
+            preconditioner: Callable returning M^-1 r, where M is symmetric positive definite.
+            monitor: Optional Monitor recording the residual norm of each iteration.
+        Returns:
+            A tuple containing the solution vector and the residual norm history.
+        Raises:
+            ValueError: If the method breaks down or does not converge.
+        """
+        x = _start(constants, initial_guess)
+        threshold = tolerance * (_norm(constants) or 1.0)
+        r = _residual(matvec, constants, x)
+        history = [_norm(r)]
+        if history[-1] <= threshold:
+            return x, history
+        z = preconditioner(r) if preconditioner else r[:]
+        p = z[:]
+        rz = _dot(r, z)
+        for _ in range(max_iterations):
+            Ap = matvec(p)
+            pAp = _dot(p, Ap)
+            if pAp <= 0:
+                raise ValueError("Matrix is not positive definite.")
+            alpha = rz / pAp
+            for i in range(len(x)):
+                x[i] += alpha * p[i]
+                r[i] -= alpha * Ap[i]
+            history.append(_norm(r))
+            if monitor is not None:
+                monitor.record(len(history) - 2, x, history[-1])
+            if history[-1] <= threshold:
+                return x, history
+            z = preconditioner(r) if preconditioner else r[:]
+            rz_new = _dot(r, z)
+            beta = rz_new / rz
+            rz = rz_new
+            for i in range(len(p)):
+                p[i] = z[i] + beta * p[i]
+        raise ValueError("Method did not converge within the maximum number of iterations.")
+
+    @staticmethod
+    @instrumented
+    def gmres(
+        matvec: Callable[[Vector], Vector],
+        constants: Vector,
+        restart: int = 30,
+        max_iterations: int = 1000,
+        tolerance: float = 1e-10,
+        initial_guess: Vector = None, # type: ignore
+        preconditioner: Callable[[Vector], Vector] = None, # type: ignore
+        *,
+        monitor: Monitor = None, # type: ignore
+    ) -> Tuple[Vector, List[float]]:
+        """
+        Restarted GMRES(m) method for general nonsingular systems, right preconditioned
+        so the recorded residuals are those of the original system.
+        Args:
+            matvec: Callable returning A x.
+            constants: The right-hand side b.
+            restart: Size m of the Krylov basis before restarting.
+            max_iterations: Maximum total number of inner iterations.
+            tolerance: Convergence tolerance relative to ||b||.
+            initial_guess: Initial guess for the solution.
+            preconditioner: Callable returning M^-1 r.
+            monitor: Optional Monitor recording the residual norm of each iteration.
+        Returns:
+            A tuple containing the solution vector and the residual norm history.
+        Raises:
+            ValueError: If restart is not positive or the method does not converge.
+        """
+        if restart <= 0:
+            raise ValueError("restart must be a positive value.")
+        n = len(constants)
+        x = _start(constants, initial_guess)
+        threshold = tolerance * (_norm(constants) or 1.0)
+        r = _residual(matvec, constants, x)
+        beta = _norm(r)
+        history = [beta]
+        total = 0
+        while beta > threshold and total < max_iterations:
+            V = [[v / beta for v in r]] # Orthonormal basis of the Krylov subspace
+            Z = [] # Preconditioned basis vectors, x is updated in their span
+            H = [] # Columns of the Hessenberg matrix, already rotated to upper triangular form
+            cs: List[float] = []
+            sn: List[float] = []
+            g = [beta]
+            for j in range(restart):
+                z = preconditioner(V[j]) if preconditioner else V[j]
+                Z.append(z)
+                w = matvec(z)
+                column = []
+                for v in V: # Modified Gram-Schmidt
+                    h = _dot(w, v)
+                    column.append(h)
+                    for i in range(n):
+                        w[i] -= h * v[i]
+                h_next = _norm(w)
+                for i in range(j): # Apply the previous Givens rotations to the new column
+                    column[i], column[i + 1] = cs[i] * column[i] + sn[i] * column[i + 1], -sn[i] * column[i] + cs[i] * column[i + 1]
+                denominator = sqrt(column[j] ** 2 + h_next ** 2)
+                cs.append(column[j] / denominator)
+                sn.append(h_next / denominator)
+                column[j] = denominator
+                g.append(-sn[j] * g[j])
+                g[j] *= cs[j]
+                H.append(column)
+                total += 1
+                history.append(abs(g[j + 1]))
+                if monitor is not None:
+                    monitor.record(total - 1, x, history[-1]) # x is only updated at the end of each cycle
+                if history[-1] <= threshold or h_next == 0 or total >= max_iterations:
+                    break
+                V.append([v / h_next for v in w])
+            k = len(H)
+            y = [0.0] * k
+            for i in range(k - 1, -1, -1): # Back substitution on the triangular factor
+                y[i] = (g[i] - sum(H[j][i] * y[j] for j in range(i + 1, k))) / H[i][i]
+            for j in range(k):
+                for i in range(n):
+                    x[i] += y[j] * Z[j][i]
+            r = _residual(matvec, constants, x)
+            beta = _norm(r)
+            history[-1] = beta # Replace the estimate with the true residual after the restart
+        if beta <= threshold:
+            return x, history
+        raise ValueError("Method did not converge within the maximum number of iterations.")
+
+    @staticmethod
+    @instrumented
+    def bicgstab(
+        matvec: Callable[[Vector], Vector],
+        constants: Vector,
+        max_iterations: int = 1000,
+        tolerance: float = 1e-10,
+        initial_guess: Vector = None, # type: ignore
+        preconditioner: Callable[[Vector], Vector] = None, # type: ignore
+        *,
+        monitor: Monitor = None, # type: ignore
+    ) -> Tuple[Vector, List[float]]:
+        """
+        Right preconditioned BiCGSTAB method for general nonsingular systems.
+        Args:
+            matvec: Callable returning A x.
+            constants: The right-hand side b.
+            max_iterations: Maximum number of iterations.
+            tolerance: Convergence tolerance relative to ||b||.
+            initial_guess: Initial guess for the solution.
+            preconditioner: Callable returning M^-1 r.
+            monitor: Optional Monitor recording the residual norm of each iteration.
+        Returns:
+            A tuple containing the solution vector and the residual norm history.
+        Raises:
+            ValueError: If the method breaks down or does not converge.
+        """
+        n = len(constants)
+        x = _start(constants, initial_guess)
+        threshold = tolerance * (_norm(constants) or 1.0)
+        r = _residual(matvec, constants, x)
+        history = [_norm(r)]
+        if history[-1] <= threshold:
+            return x, history
+        r_hat = r[:]
+        rho = alpha = omega = 1.0
+        v = [0.0] * n
+        p = [0.0] * n
+        for _ in range(max_iterations):
+            rho_new = _dot(r_hat, r)
+            if rho_new == 0 or omega == 0:
+                raise ValueError("Method broke down. No solution found.")
+            beta = (rho_new / rho) * (alpha / omega)
+            rho = rho_new
+            for i in range(n):
+                p[i] = r[i] + beta * (p[i] - omega * v[i])
+            p_hat = preconditioner(p) if preconditioner else p[:]
+            v = matvec(p_hat)
+            r_hat_v = _dot(r_hat, v)
+            if r_hat_v == 0:
+                raise ValueError("Method broke down. No solution found.")
+            alpha = rho / r_hat_v
+            s = [r[i] - alpha * v[i] for i in range(n)]
+            if _norm(s) <= threshold:
+                for i in range(n):
+                    x[i] += alpha * p_hat[i]
+                history.append(_norm(s))
+                if monitor is not None:
+                    monitor.record(len(history) - 2, x, history[-1])
+                return x, history
+            s_hat = preconditioner(s) if preconditioner else s
+            t = matvec(s_hat)
+            tt = _dot(t, t)
+            omega = _dot(t, s) / tt if tt else 0.0
+            for i in range(n):
+                x[i] += alpha * p_hat[i] + omega * s_hat[i]
+                r[i] = s[i] - omega * t[i]
+            history.append(_norm(r))
+            if monitor is not None:
+                monitor.record(len(history) - 2, x, history[-1])
+            if history[-1] <= threshold:
+                return x, history
+        raise ValueError("Method did not converge within the maximum number of iterations.")
@@ -1,27 +1,141 @@
-from typing import List, Tuple
+import warnings
+from array import array
+from math import isqrt
+from typing import Callable, List, Tuple, Union
+
+from .Backend import Backend, off_diagonal_rows, resolve_backend
+from .CSRMatrix import CSRMatrix
+from .Krylov import Krylov
+from .Monitor import Monitor, instrumented
+
+
+_NUMERIC_FORMATS = set("bBhHiIlLqQfd")
+
+
+def _is_numeric_buffer(values) -> bool:
+    """Returns True for typed containers whose elements are numbers by construction."""
+    if isinstance(values, array):
+        return values.typecode in _NUMERIC_FORMATS
+    if isinstance(values, memoryview):
+        return values.format in _NUMERIC_FORMATS
+    dtype = getattr(values, "dtype", None)
+    return dtype is not None and dtype.kind in "biuf"
+
+
+def _as_vector(values, copy: bool):
+    """Returns the constants as a sequence, copied only when requested."""
+    if not copy:
+        return values
+    if hasattr(values, "copy") and not isinstance(values, list):
+        return values.copy() # NumPy arrays
+    if isinstance(values, memoryview):
+        return memoryview(array(values.format, values))
+    return values[:]
+
+
+def _as_list(values) -> list:
+    """Returns a solution vector of any backend as a list."""
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def _as_rows(coefficients, copy: bool):
+    """
+    Returns the coefficient matrix as an indexable sequence of rows.
+    Lists of lists and 2-D NumPy arrays keep their structure; other buffers are exposed as
+    memoryview slices of the underlying row-major data, so no element is copied unless requested.
+    """
+    if isinstance(coefficients, list):
+        if not all(isinstance(row, list) for row in coefficients):
+            raise ValueError("Coefficients must be provided as a list of lists.")
+        return [row[:] for row in coefficients] if copy else coefficients  # Deep copy to avoid modifying the original matrix
+    if getattr(coefficients, "ndim", None) == 2 and hasattr(coefficients, "dtype"):
+        return coefficients.copy() if copy else coefficients
+    try:
+        view = memoryview(coefficients)
+    except TypeError:
+        raise ValueError("Coefficients must be a list of lists, a 2-D array or a buffer.") from None
+    if view.format not in _NUMERIC_FORMATS:
+        raise ValueError("Coefficients must be numeric values.")
+    if view.ndim == 2:
+        n = view.shape[0]
+        if view.shape[1] != n:
+            raise ValueError("All rows in the coefficient matrix must have the same length.")
+        view = view.cast("B").cast(view.format) # Flatten, requires C-contiguous data
+    elif view.ndim == 1:
+        n = isqrt(len(view))
+        if n * n != len(view):
+            raise ValueError("A flat coefficient buffer must hold n * n values.")
+    else:
+        raise ValueError("Coefficients must be a 2-D matrix.")
+    if copy:
+        view = memoryview(array(view.format, view))
+    return [view[i * n:(i + 1) * n] for i in range(n)]
 
 class LinearSystem:
     """
     A class to solve a system of linear equations using Gaussian elimination.
     Attributes:
-        coefficients (list): A list of lists representing the coefficient matrix.
-        constants (list): A list representing the constant terms of the equations.
+        coefficients (list | CSRMatrix): A list of lists, a sparse CSRMatrix, a 2-D NumPy array or a list of
+                                         memoryview rows over a buffer, representing the coefficient matrix.
+        constants (list): A list or buffer representing the constant terms of the equations.
 
     Methods:
         gauss_elimination(): Solves the system of equations using Gaussian elimination.
+        gauss_jacobi(), gauss_seidel(), sor(), red_black_gauss_seidel(): Stationary iterative methods.
+        lu_solve(): Solves the system using a cached LU factorization with partial pivoting.
+        solve(): Solves the system with the direct solver that best fits the matrix bandwidth.
+        conjugate_gradient(), gmres(), bicgstab(): Preconditioned Krylov subspace solvers.
     """
-    def __init__(self, coefficients: list, constants: list):
-        self.coefficients = [row[:] for row in coefficients]  # Deep copy to avoid modifying the original matrix
-        self.constants = constants[:]
-        if len(coefficients) != len(constants):
-            raise ValueError("The number of equations must match the number of constants.")
-        if any(len(row) != len(coefficients) for row in coefficients):
-            raise ValueError("All rows in the coefficient matrix must have the same length.")
-        if not all(isinstance(c, (int, float)) for c in constants):
+    def __init__(self, coefficients: list, constants: list, copy: bool = False):
+        """
+        Args:
+            coefficients: A list of lists, a CSRMatrix, a 2-D NumPy array, or a buffer (array('d'), memoryview)
+                          holding the matrix in row-major order, either 2-D or flat with n * n entries.
+            constants: A list or buffer holding the constant terms.
+            copy: Whether to copy the inputs. By default lists and buffers are referenced, not copied:
+                  no method modifies them (gauss_elimination works on its own copy), but changing them
+                  afterwards invalidates the cached factorizations. A CSRMatrix is never copied.
+        """
+        self.sparse = isinstance(coefficients, CSRMatrix)
+        if self.sparse:
+            self.coefficients = coefficients
+        else:
+            self.coefficients = _as_rows(coefficients, copy)
+        self.constants = _as_vector(constants, copy)
+        if self.sparse:
+            if coefficients.shape != (len(constants), len(constants)):
+                raise ValueError("The number of equations must match the number of constants.")
+        else:
+            if len(self.coefficients) != len(constants):
+                raise ValueError("The number of equations must match the number of constants.")
+            if any(len(row) != len(self.coefficients) for row in self.coefficients):
+                raise ValueError("All rows in the coefficient matrix must have the same length.")
+        if not _is_numeric_buffer(constants) and not all(isinstance(c, (int, float)) for c in constants):
             raise ValueError("All constants must be numeric values.")
-        if not all(isinstance(row, list) for row in coefficients):
-            raise ValueError("Coefficients must be provided as a list of lists.")
-        
+        self._lu = None  # Cached (LU, permutation, sign) from lu_factorization
+        self._band = None  # Cached (band rows, permutation) from banded_factorization
+        self._bandwidth = None  # Cached (lower, upper) from bandwidth
+        self._tridiagonal = None  # Cached (lower, diagonal, upper) diagonals for thomas
+        self._direct = None  # Direct solver picked by solve
+
+    @classmethod
+    def from_triplets(cls, rows: List[int], cols: List[int], values: List[float], constants: list) -> "LinearSystem":
+        """
+        Builds a sparse system from the (row, column, value) triplets of its nonzero coefficients.
+        Args:
+            rows (list): Row index of each coefficient.
+            cols (list): Column index of each coefficient.
+            values (list): Value of each coefficient.
+            constants (list): The constant terms of the equations.
+        Returns:
+            LinearSystem: A system backed by a CSRMatrix.
+        """
+        n = len(constants)
+        return cls(CSRMatrix.from_triplets(rows, cols, values, (n, n)), constants)
+
+    def _dense_coefficients(self) -> List[list]:
+        """Returns the coefficient matrix as a list of lists, expanding it if it is sparse."""
+        return self.coefficients.to_dense() if self.sparse else self.coefficients
 
     def gauss_elimination(self) -> list:
         """ 
@@ -32,81 +146,426 @@ class LinearSystem:
             ValueError: If the matrix is singular or nearly singular, or if the input is invalid.
         """
 
+        if self.sparse:
+            raise ValueError("Gaussian elimination requires a dense matrix, use lu_solve for sparse systems.")
         n = len(self.constants)
         solution = [0] * n  # Initialize the solution vector with zeros
+        coefficients = [list(row) for row in self.coefficients]  # Work on a copy, the inputs are not copied at construction
+        constants = list(self.constants)
 
         # Transform the matrix to upper triangular form
         for k in range(n): # Iterate over each column
-            pivot=self.coefficients[k][k] # Get the pivot element
+            pivot=coefficients[k][k] # Get the pivot element
             if pivot == 0:
                 raise ValueError("Matrix is singular or nearly singular.")
             for i in range(k + 1, n): # Iterate over each row below the current row
-                factor = self.coefficients[i][k] / pivot # Calculate the factor to eliminate the variable
-                self.constants[i] -= factor * self.constants[k] # Adjust the constant term accordingly
+                factor = coefficients[i][k] / pivot # Calculate the factor to eliminate the variable
+                constants[i] -= factor * constants[k] # Adjust the constant term accordingly
                 for j in range(k, n): # Iterate over each column to the right of the current column
-                    self.coefficients[i][j] -= factor * self.coefficients[k][j] # Eliminate the variable in the current row
+                    coefficients[i][j] -= factor * coefficients[k][j] # Eliminate the variable in the current row
         
         # Back substitution to find the solution
         for i in range(n - 1, -1, -1): # Back substitution
-            s=sum(self.coefficients[i][j] * solution[j] for j in range(i + 1, n)) # Calculate the sum of known variables
-            solution[i] = (self.constants[i] - s) / self.coefficients[i][i] # Solve for the current variable
+            s=sum(coefficients[i][j] * solution[j] for j in range(i + 1, n)) # Calculate the sum of known variables
+            solution[i] = (constants[i] - s) / coefficients[i][i] # Solve for the current variable
         return solution
-    def gauss_jacobi(self, max_iterations=1000, tolerance=1e-10, initial_guess: List[float]=None) -> list: # type: ignore
+
+    def lu_factorization(self) -> Tuple[List[List[float]], List[int], int]:
         """
-        Solves the system of linear equations using the Gauss-Jacobi iterative method.
+        Computes the LU factorization PA = LU with partial pivoting and caches it.
+        The coefficient matrix is left untouched; the factors are stored in a single matrix,
+        with the unit lower triangle of L below the diagonal and U on and above it.
+        Returns:
+            Tuple[List[List[float]], List[int], int]: The combined LU matrix, the row permutation
+                                                      (row i of PA is row perm[i] of A) and the
+                                                      permutation sign.
+        Raises:
+            ValueError: If the matrix is singular.
+        """
+        if self._lu is not None:
+            return self._lu
+        n = len(self.constants)
+        lu = [list(map(float, row)) for row in self._dense_coefficients()]
+        perm = list(range(n))
+        sign = 1
+        for k in range(n):
+            p = max(range(k, n), key=lambda i: abs(lu[i][k])) # Row with the largest pivot candidate
+            if lu[p][k] == 0:
+                raise ValueError("Matrix is singular or nearly singular.")
+            if p != k:
+                lu[k], lu[p] = lu[p], lu[k]
+                perm[k], perm[p] = perm[p], perm[k]
+                sign = -sign
+            pivot_row = lu[k]
+            pivot = pivot_row[k]
+            for i in range(k + 1, n):
+                row = lu[i]
+                factor = row[k] / pivot
+                row[k] = factor # Store the multiplier in place of the eliminated entry
+                if factor != 0:
+                    for j in range(k + 1, n):
+                        row[j] -= factor * pivot_row[j]
+        self._lu = (lu, perm, sign)
+        return self._lu
 
+    def lu_solve(self, constants: List[float] = None) -> list: # type: ignore
+        """
+        Solves the system using the cached LU factorization, in O(n^2) once the matrix is factored.
         Args:
-            max_iterations (int): Maximum number of iterations.
-            tolerance (float): Convergence tolerance.
-            initial_guess (list): Initial guess for the solution.
+            constants (list): Right-hand side to solve for. Defaults to the constants of the system.
+        Returns:
+            list: Solution vector.
+        Raises:
+            ValueError: If the matrix is singular or the right-hand side has the wrong size.
+        """
+        lu, perm, _ = self.lu_factorization()
+        n = len(lu)
+        b = self.constants if constants is None else constants
+        if len(b) != n:
+            raise ValueError("The number of equations must match the number of constants.")
+        y = [b[p] for p in perm]
+        for i in range(n): # Forward substitution with the unit lower triangle
+            row = lu[i]
+            y[i] -= sum(row[j] * y[j] for j in range(i))
+        for i in range(n - 1, -1, -1): # Back substitution with the upper triangle
+            row = lu[i]
+            y[i] = (y[i] - sum(row[j] * y[j] for j in range(i + 1, n))) / row[i]
+        return y
 
+    def lu_solve_many(self, constants_list: List[List[float]]) -> List[list]:
+        """
+        Solves the system for several right-hand sides, reusing a single LU factorization.
+        Args:
+            constants_list (list): A list of right-hand side vectors.
+        Returns:
+            List[list]: One solution vector per right-hand side.
+        Raises:
+            ValueError: If the matrix is singular or a right-hand side has the wrong size.
+        """
+        return [self.lu_solve(constants) for constants in constants_list]
+
+    def determinant(self) -> float:
+        """
+        Computes the determinant of the coefficient matrix from the LU factorization.
+        Returns:
+            float: The determinant, zero if the matrix is singular.
+        """
+        try:
+            lu, _, sign = self.lu_factorization()
+        except ValueError:
+            return 0.0
+        det = float(sign)
+        for i in range(len(lu)):
+            det *= lu[i][i]
+        return det
+
+    def inverse(self) -> List[list]:
+        """
+        Computes the inverse of the coefficient matrix from the LU factorization.
+        Returns:
+            List[list]: The inverse matrix.
+        Raises:
+            ValueError: If the matrix is singular.
+        """
+        n = len(self.constants)
+        columns = self.lu_solve_many([[1.0 if i == j else 0.0 for i in range(n)] for j in range(n)])
+        return [[columns[j][i] for j in range(n)] for i in range(n)]
+
+    def bandwidth(self) -> Tuple[int, int]:
+        """
+        Computes the lower and upper bandwidth of the coefficient matrix and caches it.
+        A sparse matrix is scanned in O(nnz) from its column indices, a dense one in O(n^2) once.
+        Returns:
+            Tuple[int, int]: The largest i - j and j - i over the nonzero entries a_ij.
+        """
+        if self._bandwidth is not None:
+            return self._bandwidth
+        lower = upper = 0
+        if self.sparse:
+            A = self.coefficients
+            for i in range(A.shape[0]):
+                for k in range(A.indptr[i], A.indptr[i + 1]):
+                    if A.data[k] != 0:
+                        lower = max(lower, i - A.indices[k])
+                        upper = max(upper, A.indices[k] - i)
+        else:
+            for i, row in enumerate(self.coefficients):
+                nonzero = [j for j, v in enumerate(row) if v != 0]
+                if nonzero:
+                    lower = max(lower, i - nonzero[0])
+                    upper = max(upper, nonzero[-1] - i)
+        self._bandwidth = (lower, upper)
+        return self._bandwidth
+
+    def _band_rows(self, lower: int, upper: int) -> List[list]:
+        """Returns each row as [first column, values], keeping only columns i - lower to i + upper."""
+        n = len(self.constants)
+        rows = []
+        if self.sparse:
+            A = self.coefficients
+            for i in range(n):
+                start = max(0, i - lower)
+                values = [0.0] * (min(n, i + upper + 1) - start)
+                for k in range(A.indptr[i], A.indptr[i + 1]):
+                    values[A.indices[k] - start] += A.data[k]
+                rows.append([start, values])
+            return rows
+        for i, row in enumerate(self.coefficients):
+            start = max(0, i - lower)
+            rows.append([start, [float(v) for v in row[start:i + upper + 1]]])
+        return rows
+
+    @staticmethod
+    def tridiagonal_solve(lower: List[float], diagonal: List[float], upper: List[float], constants: List[float]) -> list:
+        """
+        Solves a tridiagonal system with the Thomas algorithm in O(n), storing only the three diagonals.
+        Args:
+            lower (list): The n - 1 entries below the diagonal.
+            diagonal (list): The n diagonal entries.
+            upper (list): The n - 1 entries above the diagonal.
+            constants (list): The constant terms of the equations.
         Returns:
             list: Solution vector.
+        Raises:
+            ValueError: If the diagonals have inconsistent sizes or a zero pivot is found.
+        """
+        n = len(diagonal)
+        if len(constants) != n or len(lower) != n - 1 or len(upper) != n - 1:
+            raise ValueError("Diagonals and constants must have sizes n - 1, n, n - 1 and n.")
+        c = [0.0] * n # Modified upper diagonal
+        d = [0.0] * n # Modified constants
+        pivot = diagonal[0]
+        for i in range(n):
+            if i > 0:
+                pivot = diagonal[i] - lower[i - 1] * c[i - 1]
+            if pivot == 0:
+                raise ValueError("Matrix is singular or nearly singular.")
+            if i < n - 1:
+                c[i] = upper[i] / pivot
+            d[i] = (constants[i] - (lower[i - 1] * d[i - 1] if i > 0 else 0.0)) / pivot
+        for i in range(n - 2, -1, -1): # Back substitution
+            d[i] -= c[i] * d[i + 1]
+        return d
 
+    def thomas(self, constants: List[float] = None, bandwidth: Tuple[int, int] = None) -> list: # type: ignore
+        """
+        Solves a tridiagonal system with the Thomas algorithm. The diagonals are extracted once and cached.
+        Args:
+            constants (list): Right-hand side to solve for. Defaults to the constants of the system.
+            bandwidth (tuple): The (lower, upper) bandwidth if already known, computed with bandwidth() otherwise.
+        Returns:
+            list: Solution vector.
         Raises:
-            ValueError: If input is invalid or method does not converge.
+            ValueError: If the matrix is not tridiagonal or a zero pivot is found.
+        """
+        if self._tridiagonal is None:
+            if any(width > 1 for width in bandwidth or self.bandwidth()):
+                raise ValueError("The Thomas algorithm requires a tridiagonal matrix.")
+            rows = self._band_rows(1, 1)
+            n = len(rows)
+            diagonal = [values[i - start] for i, (start, values) in enumerate(rows)]
+            lower = [rows[i][1][0] for i in range(1, n)]
+            upper = [rows[i][1][i + 1 - rows[i][0]] for i in range(n - 1)]
+            self._tridiagonal = (lower, diagonal, upper)
+        return self.tridiagonal_solve(*self._tridiagonal, self.constants if constants is None else constants)
+
+    def banded_factorization(self) -> Tuple[List[list], List[int]]:
+        """
+        Computes a banded LU factorization with partial pivoting and caches it.
+        Only the band is stored; pivoting can widen the upper band of U to lower + upper,
+        so the work is O(n * lower * (lower + upper)).
+        Returns:
+            Tuple[List[list], List[int]]: The factored rows as [first column, values], with the multipliers
+                                          of L stored left of the diagonal, and the row permutation.
+        Raises:
+            ValueError: If the matrix is singular.
+        """
+        if self._band is not None:
+            return self._band
+        lower, upper = self.bandwidth()
+        rows = self._band_rows(lower, upper)
+        n = len(rows)
+        perm = list(range(n))
+
+        def entry(row, j):
+            start, values = row
+            return values[j - start] if start <= j < start + len(values) else 0.0
+
+        for k in range(n):
+            last = min(n - 1, k + lower)
+            p = max(range(k, last + 1), key=lambda i: abs(entry(rows[i], k))) # Row with the largest pivot candidate
+            pivot = entry(rows[p], k)
+            if pivot == 0:
+                raise ValueError("Matrix is singular or nearly singular.")
+            if p != k:
+                rows[k], rows[p] = rows[p], rows[k]
+                perm[k], perm[p] = perm[p], perm[k]
+            pivot_start, pivot_values = rows[k]
+            end = pivot_start + len(pivot_values) # One past the last column of the pivot row
+            for i in range(k + 1, last + 1):
+                start, values = rows[i]
+                factor = entry(rows[i], k) / pivot
+                if start > k or factor == 0:
+                    continue
+                if start + len(values) < end:
+                    values.extend([0.0] * (end - start - len(values))) # Fill-in from pivoting
+                values[k - start] = factor # Store the multiplier in place of the eliminated entry
+                for j in range(k + 1, end):
+                    values[j - start] -= factor * pivot_values[j - pivot_start]
+        self._band = (rows, perm)
+        return self._band
+
+    def banded_solve(self, constants: List[float] = None) -> list: # type: ignore
+        """
+        Solves the system using the cached banded LU factorization, in O(n * bandwidth) per right-hand side.
+        Args:
+            constants (list): Right-hand side to solve for. Defaults to the constants of the system.
+        Returns:
+            list: Solution vector.
+        Raises:
+            ValueError: If the matrix is singular or the right-hand side has the wrong size.
+        """
+        rows, perm = self.banded_factorization()
+        n = len(rows)
+        b = self.constants if constants is None else constants
+        if len(b) != n:
+            raise ValueError("The number of equations must match the number of constants.")
+        y = [b[p] for p in perm]
+        for i in range(n): # Forward substitution with the multipliers left of the diagonal
+            start, values = rows[i]
+            y[i] -= sum(values[j - start] * y[j] for j in range(start, i))
+        for i in range(n - 1, -1, -1): # Back substitution with the band of U
+            start, values = rows[i]
+            end = start + len(values)
+            y[i] = (y[i] - sum(values[j - start] * y[j] for j in range(i + 1, end))) / values[i - start]
+        return y
+
+    def solve(self, constants: List[float] = None) -> list: # type: ignore
+        """
+        Solves the system with a direct method chosen from the bandwidth of the matrix:
+        the Thomas algorithm for tridiagonal matrices, banded LU for narrow bands and
+        dense LU otherwise. The bandwidth and the choice are computed on the first call and
+        reused with the cached factorization for every later right-hand side.
+        Args:
+            constants (list): Right-hand side to solve for. Defaults to the constants of the system.
+        Returns:
+            list: Solution vector.
+        Raises:
+            ValueError: If the matrix is singular.
+        """
+        if self._direct is None:
+            lower, upper = self.bandwidth()
+            if lower <= 1 and upper <= 1:
+                try:
+                    solution = self.thomas(constants, (lower, upper))
+                    self._direct = self.thomas
+                    return solution
+                except ValueError:
+                    pass # Zero pivot without pivoting, use the pivoted banded LU
+            self._direct = self.banded_solve if lower + upper < len(self.constants) // 2 else self.lu_solve
+        return self._direct(constants)
+
+    def _prepare_iteration(self, initial_guess: List[float]) -> list:
+        """
+        Validates the system for the iterative methods and returns the starting solution vector.
+        Raises:
+            ValueError: If the matrix is not square or has a zero on its diagonal.
         """
         criteria_ok, problematic_rows = self.row_criteria()
         if not criteria_ok:
-            print("Warning: The matrix does not satisfy the row criteria for convergence.")
-            print(f"Problematic rows: {problematic_rows}")
+            warnings.warn(f"The matrix does not satisfy the row criteria for convergence. Problematic rows: {problematic_rows}", RuntimeWarning, stacklevel=4)
 
         n = len(self.constants)
 
         # Validate input dimensions
-        if len(self.coefficients) != n or any(len(row) != n for row in self.coefficients):
+        if self.sparse:
+            if self.coefficients.shape != (n, n):
+                raise ValueError("Coefficient matrix must be square and match constants vector size.")
+        elif len(self.coefficients) != n or any(len(row) != n for row in self.coefficients):
             raise ValueError("Coefficient matrix must be square and match constants vector size.")
 
         # Check for zero diagonal elements
-        for i in range(n):
-            if self.coefficients[i][i] == 0:
-                raise ValueError("Matrix is singular or nearly singular.")
+        if any(d == 0 for d in self._diagonal()):
+            raise ValueError("Matrix is singular or nearly singular.")
         if initial_guess:
             if len(initial_guess) != n:
-                print("Warning: Initial guess size does not match number of variables. Using zero vector instead.")
-                solution = [0.0] * n
-            else:
-                solution = list(initial_guess)
-        else:
-            solution = [0.0] * n
+                warnings.warn("Initial guess size does not match number of variables. Using zero vector instead.", RuntimeWarning, stacklevel=4)
+                return [0.0] * n
+            return list(initial_guess)
+        return [0.0] * n
 
-        for iteration in range(max_iterations):
-            new_solution = [0.0] * n
-            for i in range(n):
-                s = 0.0
-                for j in range(n):  
-                    if j!=i:
-                        s+=self.coefficients[i][j]*solution[j]  # Sum of known variables
-                new_solution[i] = (self.constants[i] - s) / self.coefficients[i][i] # Update the solution for the current variable
+    def _diagonal(self) -> List[float]:
+        """Returns the main diagonal of the coefficient matrix."""
+        if self.sparse:
+            return self.coefficients.diagonal()
+        return [self.coefficients[i][i] for i in range(len(self.coefficients))]
+
+    @instrumented
+    def gauss_jacobi(self, max_iterations=1000, tolerance=1e-10, initial_guess: List[float]=None, backend: Union[str, Backend]=None, *, monitor: Monitor=None) -> list: # type: ignore
+        """
+        Solves the system of linear equations using the Gauss-Jacobi iterative method.
+
+        Args:
+            max_iterations (int): Maximum number of iterations.
+            tolerance (float): Convergence tolerance.
+            initial_guess (list): Initial guess for the solution.
+            backend (str | Backend): "python", "numpy" to perform each sweep as one matrix-vector product, or a Backend.
+                           By default NumPy for NumPy inputs, else the default backend (see Methods.Backend).
+            monitor (Monitor): Optional Monitor recording the max abs delta of each sweep.
+
+        Returns:
+            list: Solution vector.
+
+        Raises:
+            ValueError: If input is invalid or method does not converge.
+        """
+        solution = self._prepare_iteration(initial_guess)
+        kernel = resolve_backend(backend, self.coefficients, self.constants)
+        step = kernel.jacobi_sweep(self.coefficients, self.constants, self._diagonal())
+        solution = kernel.vector(solution)
 
+        for iteration in range(max_iterations):
+            solution, error = step(solution)
             # Check for convergence
-            error = max(abs(new_solution[i] - solution[i]) for i in range(n))   
+            if monitor is not None:
+                monitor.record(iteration, solution, error, matvecs=1)
             if error < tolerance:
-                return new_solution
-
-            solution = new_solution
+                return _as_list(solution)
         raise ValueError("Method did not converge within the maximum number of iterations.")
 
+    def sweep(self, source: list, target: list, constants: List[float]=None) -> None: # type: ignore
+        """
+        Performs one Jacobi sweep (source is not target) or Gauss-Seidel sweep (source is target),
+        writing the new values into target. This is the step of gauss_jacobi and gauss_seidel, for
+        callers that drive the iteration themselves, such as the smoother of Multigrid.
+        Args:
+            source (list): The current approximation.
+            target (list): Receives the new values; pass source itself for a Gauss-Seidel sweep.
+            constants (list): The right-hand side to relax against, the constants of the system when None.
+        """
+        constants = self.constants if constants is None else constants
+        if self.sparse:
+            A = self.coefficients
+            data, indices, indptr = A.data, A.indices, A.indptr
+            for i in range(len(target)):
+                s = 0.0
+                diagonal = 0.0
+                for k in range(indptr[i], indptr[i + 1]):
+                    j = indices[k]
+                    if j != i:
+                        s += data[k] * source[j]
+                    else:
+                        diagonal += data[k]
+                target[i] = (constants[i] - s) / diagonal
+            return
+        n = len(target)
+        for i in range(n):
+            s = 0.0
+            for j in range(n):
+                if j != i:
+                    s += self.coefficients[i][j] * source[j]  # Gauss-Seidel reads the values already updated in this sweep
+            target[i] = (constants[i] - s) / self.coefficients[i][i]
+
     def row_criteria(self) -> Tuple[bool, List[int]]:
         """
         Checks if the matrix satisfies the row criteria for convergence.
@@ -115,6 +574,14 @@ class LinearSystem:
                                     and the second element is a list of row indices that do not satisfy the criteria.
         """
         problematic_rows = []
+        if self.sparse:
+            A = self.coefficients
+            diagonal = A.diagonal()
+            for i in range(A.shape[0]):
+                row_sum = sum(abs(A.data[k]) for k in range(A.indptr[i], A.indptr[i + 1]) if A.indices[k] != i) # Sum of non-diagonal nonzeros
+                if abs(diagonal[i]) <= row_sum:
+                    problematic_rows.append(i)
+            return len(problematic_rows) == 0, problematic_rows
         n = len(self.coefficients)
         for i in range(n):
             row_sum = sum(abs(self.coefficients[i][j]) for j in range(n) if j != i) # Sum of non-diagonal elements
@@ -122,53 +589,302 @@ class LinearSystem:
                 problematic_rows.append(i)
         return len(problematic_rows) == 0, problematic_rows # Return True if no problematic rows
 
-    def gauss_seidel(self, max_iterations=1000, tolerance=1e-10, initial_guess: List[float]=None) -> list: # type: ignore
+    @instrumented
+    def gauss_seidel(self, max_iterations=1000, tolerance=1e-10, initial_guess: List[float]=None, *, monitor: Monitor=None) -> list: # type: ignore
         """
         Solves the system of linear equations using the Gauss-Seidel iterative method.
         Args:
             max_iterations (int): Maximum number of iterations.
             tolerance (float): Convergence tolerance.
             initial_guess (list): Initial guess for the solution.
+            monitor (Monitor): Optional Monitor recording the max abs delta of each sweep.
         Returns:
             list: Solution vector.
         Raises:
             ValueError: If input is invalid or method does not converge.
         """
-        criteria_ok, problematic_rows = self.row_criteria()
-        if not criteria_ok:
-            print("Warning: The matrix does not satisfy the row criteria for convergence.")
-            print(f"Problematic rows: {problematic_rows}")
-
+        solution = self._prepare_iteration(initial_guess)
         n = len(self.constants)
 
-        # Validate input dimensions
-        if len(self.coefficients) != n or any(len(row) != n for row in self.coefficients):
-            raise ValueError("Coefficient matrix must be square and match constants vector size.")
-
-        # Check for zero diagonal elements
-        for i in range(n):
-            if self.coefficients[i][i] == 0:
-                raise ValueError("Matrix is singular or nearly singular.")
-        if initial_guess:
-            if len(initial_guess) != n:
-                print("Warning: Initial guess size does not match number of variables. Using zero vector instead.")
-                solution = [0.0] * n
-            else:
-                solution = list(initial_guess)
-        else:
-            solution = [0.0] * n
-
         for iteration in range(max_iterations):
             new_solution = solution[:]
-            for i in range(n):
-                s = 0.0
-                for j in range(n):  
-                    if j!=i:
-                        s+=self.coefficients[i][j]*new_solution[j]  # Use the most recent values
-                new_solution[i] = (self.constants[i] - s) / self.coefficients[i][i] # Update the solution for the current variable
+            self.sweep(new_solution, new_solution)
             # Check for convergence
             error = max(abs(new_solution[i] - solution[i]) for i in range(n))   
+            if monitor is not None:
+                monitor.record(iteration, new_solution, error, matvecs=1)
             if error < tolerance:
                 return new_solution
             solution = new_solution
-        raise ValueError("Method did not converge within the maximum number of iterations.")
\ No newline at end of file
+        raise ValueError("Method did not converge within the maximum number of iterations.")
+
+    @instrumented
+    def sor(self, omega=1.0, max_iterations=1000, tolerance=1e-10, initial_guess: List[float]=None, *, monitor: Monitor=None) -> list: # type: ignore
+        """
+        Solves the system of linear equations using Successive Over-Relaxation.
+        With omega = 1 this is the Gauss-Seidel method. The solution is updated in place,
+        so no vector is allocated per iteration.
+        Args:
+            omega (float): Relaxation factor, strictly between 0 and 2.
+            max_iterations (int): Maximum number of iterations.
+            tolerance (float): Convergence tolerance.
+            initial_guess (list): Initial guess for the solution.
+            monitor (Monitor): Optional Monitor recording the max abs delta of each sweep.
+        Returns:
+            list: Solution vector.
+        Raises:
+            ValueError: If input is invalid or method does not converge.
+        """
+        if not 0 < omega < 2:
+            raise ValueError("omega must be strictly between 0 and 2.")
+        solution = self._prepare_iteration(initial_guess)
+        rows = self._off_diagonal_rows()
+        diagonal = self._diagonal()
+        constants = self.constants
+
+        for iteration in range(max_iterations):
+            error = 0.0
+            for i, (columns, values) in enumerate(rows):
+                s = 0.0
+                for j, a in zip(columns, values):
+                    s += a * solution[j]  # Use the most recent values
+                delta = omega * ((constants[i] - s) / diagonal[i] - solution[i])
+                solution[i] += delta
+                error = max(error, abs(delta))
+            if monitor is not None:
+                monitor.record(iteration, solution, error, matvecs=1)
+            # Check for convergence
+            if error < tolerance:
+                return solution
+        raise ValueError("Method did not converge within the maximum number of iterations.")
+
+    @instrumented
+    def red_black_gauss_seidel(self, max_iterations=1000, tolerance=1e-10, initial_guess: List[float]=None, omega=1.0, backend: Union[str, Backend]=None, *, monitor: Monitor=None) -> list: # type: ignore
+        """
+        Solves the system using Gauss-Seidel (or SOR) with red-black ordering.
+        The unknowns are split into two colors such that no equation couples two unknowns of the
+        same color, so each half-sweep only reads values of the other color and can be vectorized.
+        Args:
+            max_iterations (int): Maximum number of iterations.
+            tolerance (float): Convergence tolerance.
+            initial_guess (list): Initial guess for the solution.
+            omega (float): Relaxation factor, strictly between 0 and 2.
+            backend (str | Backend): "python", "numpy" to perform each half-sweep as one matrix-vector product, or a Backend.
+                           By default NumPy for NumPy inputs, else the default backend (see Methods.Backend).
+            monitor (Monitor): Optional Monitor recording the max abs delta of each sweep.
+        Returns:
+            list: Solution vector.
+        Raises:
+            ValueError: If the matrix graph cannot be two-colored, or the method does not converge.
+        """
+        if not 0 < omega < 2:
+            raise ValueError("omega must be strictly between 0 and 2.")
+        solution = self._prepare_iteration(initial_guess)
+        colors = self._two_coloring()
+        kernel = resolve_backend(backend, self.coefficients, self.constants)
+        step = kernel.red_black_sweep(self.coefficients, self.constants, self._diagonal(), colors, omega)
+        solution = kernel.vector(solution)
+
+        for iteration in range(max_iterations):
+            error = step(solution)
+            if monitor is not None:
+                monitor.record(iteration, solution, error, matvecs=1)
+            # Check for convergence
+            if error < tolerance:
+                return _as_list(solution)
+        raise ValueError("Method did not converge within the maximum number of iterations.")
+
+    def _off_diagonal_rows(self) -> List[Tuple[list, list]]:
+        """Returns the (columns, values) of the nonzero off-diagonal entries of each row."""
+        return off_diagonal_rows(self.coefficients)
+
+    def _two_coloring(self) -> Tuple[List[int], List[int]]:
+        """
+        Splits the unknowns into red and black sets with no coupling inside a set.
+        Raises:
+            ValueError: If the matrix graph is not bipartite.
+        """
+        rows = self._off_diagonal_rows()
+        n = len(rows)
+        color = [-1] * n
+        for root in range(n):
+            if color[root] >= 0:
+                continue
+            color[root] = 0
+            stack = [root]
+            while stack:
+                i = stack.pop()
+                for j in rows[i][0]:
+                    if color[j] < 0:
+                        color[j] = 1 - color[i]
+                        stack.append(j)
+                    elif color[j] == color[i]:
+                        raise ValueError("The matrix does not admit a red-black ordering.")
+        return [i for i in range(n) if color[i] == 0], [i for i in range(n) if color[i] == 1]
+
+    def matvec(self, x: List[float]) -> list:
+        """
+        Computes the product of the coefficient matrix with a vector.
+        Args:
+            x (list): A vector with one entry per variable.
+        Returns:
+            list: The product vector.
+        """
+        if self.sparse:
+            return self.coefficients.matvec(x)
+        return [sum(a * v for a, v in zip(row, x)) for row in self.coefficients]
+
+    def _csr(self) -> CSRMatrix:
+        """Returns the coefficient matrix in CSR format, compressing it if it is dense."""
+        return self.coefficients if self.sparse else CSRMatrix.from_dense(self.coefficients)
+
+    def jacobi_preconditioner(self) -> Callable[[list], list]:
+        """
+        Builds the Jacobi (diagonal) preconditioner M = D.
+        Returns:
+            Callable[[list], list]: A function returning M^-1 r.
+        Raises:
+            ValueError: If the matrix has a zero on its diagonal.
+        """
+        diagonal = self._diagonal()
+        if any(d == 0 for d in diagonal):
+            raise ValueError("Matrix is singular or nearly singular.")
+        inverse = [1.0 / d for d in diagonal]
+        return lambda r: [w * v for w, v in zip(inverse, r)]
+
+    def ssor_preconditioner(self, omega: float = 1.0) -> Callable[[list], list]:
+        """
+        Builds the SSOR preconditioner M = w/(2-w) (D/w + L) (D/w)^-1 (D/w + U).
+        Args:
+            omega (float): Relaxation factor, strictly between 0 and 2.
+        Returns:
+            Callable[[list], list]: A function returning M^-1 r in O(nnz).
+        Raises:
+            ValueError: If omega is out of range or the matrix has a zero on its diagonal.
+        """
+        if not 0 < omega < 2:
+            raise ValueError("omega must be strictly between 0 and 2.")
+        A = self._csr()
+        data, indices, indptr = A.data, A.indices, A.indptr
+        diagonal = A.diagonal()
+        if any(d == 0 for d in diagonal):
+            raise ValueError("Matrix is singular or nearly singular.")
+        n = len(diagonal)
+        scaled = [d / omega for d in diagonal]
+
+        def apply(r: list) -> list:
+            y = [0.0] * n
+            for i in range(n): # Forward solve with D/w + L
+                s = sum(data[k] * y[indices[k]] for k in range(indptr[i], indptr[i + 1]) if indices[k] < i)
+                y[i] = (r[i] - s) / scaled[i]
+            y = [scaled[i] * y[i] for i in range(n)]
+            z = [0.0] * n
+            for i in range(n - 1, -1, -1): # Backward solve with D/w + U
+                s = sum(data[k] * z[indices[k]] for k in range(indptr[i], indptr[i + 1]) if indices[k] > i)
+                z[i] = (y[i] - s) / scaled[i]
+            return [(2 - omega) / omega * v for v in z]
+
+        return apply
+
+    def ilu_preconditioner(self) -> Callable[[list], list]:
+        """
+        Builds the incomplete LU preconditioner ILU(0), whose factors keep the sparsity pattern of the matrix.
+        Returns:
+            Callable[[list], list]: A function returning (LU)^-1 r in O(nnz).
+        Raises:
+            ValueError: If a diagonal entry is missing or a zero pivot is found.
+        """
+        A = self._csr()
+        data, indices, indptr = list(A.data), A.indices, A.indptr
+        n = A.shape[0]
+        diagonal_position = [-1] * n
+        for i in range(n):
+            for k in range(indptr[i], indptr[i + 1]):
+                if indices[k] == i:
+                    diagonal_position[i] = k
+            if diagonal_position[i] < 0 or data[diagonal_position[i]] == 0:
+                raise ValueError("Matrix is singular or nearly singular.")
+        for i in range(1, n):
+            position = {indices[k]: k for k in range(indptr[i], indptr[i + 1])}
+            for kk in range(indptr[i], diagonal_position[i]): # Columns left of the diagonal, in order
+                k = indices[kk]
+                data[kk] /= data[diagonal_position[k]]
+                for jj in range(diagonal_position[k] + 1, indptr[k + 1]):
+                    j = position.get(indices[jj])
+                    if j is not None:
+                        data[j] -= data[kk] * data[jj] # Drop fill-in outside the original pattern
+            if data[diagonal_position[i]] == 0:
+                raise ValueError("Matrix is singular or nearly singular.")
+
+        def apply(r: list) -> list:
+            y = list(r)
+            for i in range(n): # Forward solve with the unit lower factor
+                y[i] -= sum(data[k] * y[indices[k]] for k in range(indptr[i], diagonal_position[i]))
+            for i in range(n - 1, -1, -1): # Backward solve with the upper factor
+                s = sum(data[k] * y[indices[k]] for k in range(diagonal_position[i] + 1, indptr[i + 1]))
+                y[i] = (y[i] - s) / data[diagonal_position[i]]
+            return y
+
+        return apply
+
+    def _preconditioner(self, preconditioner: Union[str, Callable[[list], list], None]) -> Callable[[list], list]:
+        """Resolves a preconditioner given by name ("jacobi", "ssor" or "ilu") or as a callable."""
+        if preconditioner is None or callable(preconditioner):
+            return preconditioner # type: ignore
+        builders = {
+            "jacobi": self.jacobi_preconditioner,
+            "ssor": self.ssor_preconditioner,
+            "ilu": self.ilu_preconditioner,
+        }
+        if preconditioner not in builders:
+            raise ValueError(f"Unknown preconditioner: {preconditioner}.")
+        return builders[preconditioner]()
+
+    def conjugate_gradient(self, max_iterations=1000, tolerance=1e-10, initial_guess: List[float]=None, preconditioner=None, *, monitor: Monitor=None) -> Tuple[list, List[float]]: # type: ignore
+        """
+        Solves a symmetric positive definite system using the preconditioned Conjugate Gradient method.
+        Args:
+            max_iterations (int): Maximum number of iterations.
+            tolerance (float): Convergence tolerance on the residual norm, relative to the constants.
+            initial_guess (list): Initial guess for the solution.
+            preconditioner (str | callable): "jacobi", "ssor", "ilu" or a callable returning M^-1 r.
+            monitor (Monitor): Optional Monitor recording the residual norm of each iteration.
+        Returns:
+            Tuple[list, List[float]]: The solution vector and the residual norm history.
+        Raises:
+            ValueError: If the method breaks down or does not converge.
+        """
+        return Krylov.conjugate_gradient(self.matvec, self.constants, max_iterations, tolerance, initial_guess, self._preconditioner(preconditioner), monitor=monitor)
+
+    def gmres(self, restart=30, max_iterations=1000, tolerance=1e-10, initial_guess: List[float]=None, preconditioner=None, *, monitor: Monitor=None) -> Tuple[list, List[float]]: # type: ignore
+        """
+        Solves the system using the restarted GMRES method.
+        Args:
+            restart (int): Size of the Krylov basis before restarting.
+            max_iterations (int): Maximum total number of iterations.
+            tolerance (float): Convergence tolerance on the residual norm, relative to the constants.
+            initial_guess (list): Initial guess for the solution.
+            preconditioner (str | callable): "jacobi", "ssor", "ilu" or a callable returning M^-1 r.
+            monitor (Monitor): Optional Monitor recording the residual norm of each iteration.
+        Returns:
+            Tuple[list, List[float]]: The solution vector and the residual norm history.
+        Raises:
+            ValueError: If the method does not converge.
+        """
+        return Krylov.gmres(self.matvec, self.constants, restart, max_iterations, tolerance, initial_guess, self._preconditioner(preconditioner), monitor=monitor)
+
+    def bicgstab(self, max_iterations=1000, tolerance=1e-10, initial_guess: List[float]=None, preconditioner=None, *, monitor: Monitor=None) -> Tuple[list, List[float]]: # type: ignore
+        """
+        Solves the system using the BiCGSTAB method.
+        Args:
+            max_iterations (int): Maximum number of iterations.
+            tolerance (float): Convergence tolerance on the residual norm, relative to the constants.
+            initial_guess (list): Initial guess for the solution.
+            preconditioner (str | callable): "jacobi", "ssor", "ilu" or a callable returning M^-1 r.
+            monitor (Monitor): Optional Monitor recording the residual norm of each iteration.
+        Returns:
+            Tuple[list, List[float]]: The solution vector and the residual norm history.
+        Raises:
+            ValueError: If the method breaks down or does not converge.
+        """
+        return Krylov.bicgstab(self.matvec, self.constants, max_iterations, tolerance, initial_guess, self._preconditioner(preconditioner), monitor=monitor)
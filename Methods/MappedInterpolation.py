@@ -0,0 +1,248 @@
+import ast
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, Tuple
+
+from .Backend import load_numpy
+
+_NPY_MAGIC = b"\x93NUMPY"
+_NATIVE_FLOAT64 = ("<f8" if sys.byteorder == "little" else ">f8", "=f8", "f8", "float64")
+
+
+def _chunks(values, size: int) -> Iterator:
+    """Splits values into consecutive chunks, slicing arrays and consuming other iterables lazily."""
+    if hasattr(values, "ndim"):
+        for start in range(0, len(values), size):
+            yield values[start:start + size]
+        return
+    iterator = iter(values)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def _npy_layout(header: bytes) -> Tuple[int, int, bool]:
+    """Parses an .npy header and returns the data offset, the number of samples and whether the columns are contiguous."""
+    major = header[6]
+    if major == 1:
+        (length,), start = struct.unpack("<H", header[8:10]), 10
+    elif major in (2, 3):
+        (length,), start = struct.unpack("<I", header[8:12]), 12
+    else:
+        raise ValueError(f"Unsupported .npy format version {major}.")
+    meta = ast.literal_eval(header[start:start + length].decode("latin1"))
+    if meta["descr"] not in _NATIVE_FLOAT64:
+        raise ValueError("The table must hold native float64 values.")
+    shape, fortran = tuple(meta["shape"]), meta["fortran_order"]
+    if len(shape) != 2 or 2 not in shape:
+        raise ValueError("The table must have shape (n, 2) or (2, n).")
+    if shape[1] == 2:
+        return start + length, shape[0], fortran # (n, 2): pairs in C order, columns in Fortran order
+    return start + length, shape[1], not fortran # (2, n): the reverse
+
+
+class MappedInterpolation:
+    """
+    Piecewise linear interpolation over a table too large for memory, read through mmap.
+    The table is either a raw file of native float64 (x, y) pairs, as written by write, or an .npy
+    file holding a float64 array of shape (n, 2) or (2, n). Only the pages touched by the binary
+    searches are read, so opening a table and evaluating points costs O(log n) page reads per point
+    regardless of its size, and batches are processed in chunks of bounded size.
+    The x column must be strictly increasing; this is only checked when validate=True, since it
+    requires a full pass over the file.
+    Attributes:
+        n (int): The number of samples.
+        x_min, x_max (float): The range of the table.
+    """
+
+    def __init__(self, path: str, offset: int = 0, validate: bool = False):
+        """
+        Args:
+            path: The table file.
+            offset: Bytes to skip at the start of a raw file.
+            validate: Whether to check that the x column is strictly increasing.
+        """
+        self._file = open(path, "rb")
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size == 0:
+                raise ValueError("The table is empty.")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+        if hasattr(self._mmap, "madvise") and hasattr(mmap, "MADV_RANDOM"):
+            self._mmap.madvise(mmap.MADV_RANDOM) # Binary searches jump around, read-ahead only wastes memory
+        if self._mmap[:len(_NPY_MAGIC)] == _NPY_MAGIC:
+            offset, n, columns = _npy_layout(self._mmap[:min(size, 65536)])
+        else:
+            n, columns = (size - offset) // 16, False
+        if n < 2 or offset + 16 * n > size:
+            self.close()
+            raise ValueError("The table must hold at least two samples.")
+        self.n = n
+        self._offset = offset
+        self._columns = columns
+        self._view = memoryview(self._mmap)[offset:offset + 16 * n].cast("d")
+        if columns:
+            self._x, self._y = self._view[:n], self._view[n:]
+        else:
+            self._x, self._y = self._view[0::2], self._view[1::2]
+        self._arrays = None
+        self.x_min = self._x[0]
+        self.x_max = self._x[n - 1]
+        if validate and not self._is_increasing():
+            self.close()
+            raise ValueError("x_values must be strictly increasing for interpolation.")
+
+    @staticmethod
+    def write(path: str, x_values: Iterable[float], y_values: Iterable[float], chunk_size: int = 65536) -> int:
+        """
+        Writes a raw table of (x, y) pairs, streaming the inputs in chunks.
+        Args:
+            path: The file to write.
+            x_values: The strictly increasing nodes.
+            y_values: The values at the nodes.
+            chunk_size: Number of pairs buffered before each write.
+        Returns:
+            The number of pairs written.
+        """
+        count = 0
+        with open(path, "wb") as file:
+            for chunk in _chunks(zip(x_values, y_values), chunk_size):
+                array("d", chain.from_iterable(chunk)).tofile(file)
+                count += len(chunk)
+        return count
+
+    def close(self) -> None:
+        """Releases the mapping and the file. Results already returned stay valid."""
+        if getattr(self, "_view", None) is not None:
+            for view in (self._x, self._y, self._view):
+                view.release()
+            self._x = self._y = self._view = None
+        self._arrays = None
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "MappedInterpolation":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _is_increasing(self, chunk_size: int = 1 << 20) -> bool:
+        """Checks the x column chunk by chunk, including the boundaries between chunks."""
+        previous = None
+        for start in range(0, self.n, chunk_size):
+            chunk = self._x[start:start + chunk_size].tolist()
+            if previous is not None and not previous < chunk[0]:
+                return False
+            if not all(a < b for a, b in zip(chunk, islice(chunk, 1, None))):
+                return False
+            previous = chunk[-1]
+        return True
+
+    def _interpolate(self, i: int, x: float) -> float:
+        x_0, x_1 = self._x[i], self._x[i + 1]
+        y_0, y_1 = self._y[i], self._y[i + 1]
+        return y_0 + (y_1 - y_0) * (x - x_0) / (x_1 - x_0)
+
+    def evaluate(self, x: float) -> float:
+        """
+        Evaluates the linear interpolant at x.
+        Args:
+            x: The point at which to evaluate.
+        Returns:
+            The interpolated value.
+        Raises:
+            ValueError: If x is outside the range of x_values.
+        """
+        if not self.x_min <= x <= self.x_max:
+            raise ValueError("x is outside the range of x_values.")
+        return self._interpolate(min(bisect_right(self._x, x) - 1, self.n - 2), x)
+
+    def _evaluate_chunk(self, chunk: List[float]) -> List[float]:
+        """Evaluates a chunk in ascending order, so each search starts from the previous interval."""
+        order = sorted(range(len(chunk)), key=chunk.__getitem__)
+        result = [0.0] * len(chunk)
+        lo = 0
+        for k in order:
+            x = chunk[k]
+            if not self.x_min <= x <= self.x_max:
+                raise ValueError("x is outside the range of x_values.")
+            lo = min(bisect_right(self._x, x, lo) - 1, self.n - 2)
+            result[k] = self._interpolate(lo, x)
+        return result
+
+    def _numpy_columns(self):
+        """Returns the x and y columns as NumPy views of the mapping, created once."""
+        if self._arrays is None:
+            np = load_numpy()
+            data = np.frombuffer(self._mmap, dtype=np.float64, count=2 * self.n, offset=self._offset)
+            if self._columns:
+                self._arrays = data[:self.n], data[self.n:]
+            else:
+                self._arrays = data[0::2], data[1::2]
+        return self._arrays
+
+    def _evaluate_chunk_numpy(self, chunk):
+        """Vectorized binary search: every query of the chunk is narrowed by one halving per step."""
+        np = load_numpy()
+        x, y = self._numpy_columns()
+        q = np.asarray(chunk, dtype=np.float64)
+        if not ((q >= self.x_min) & (q <= self.x_max)).all():
+            raise ValueError("x is outside the range of x_values.")
+        lo = np.zeros(len(q), dtype=np.int64) # Invariant: x[lo] <= q <= x[hi]
+        hi = np.full(len(q), self.n - 1, dtype=np.int64)
+        while True:
+            active = np.flatnonzero(hi - lo > 1)
+            if not len(active):
+                break
+            mid = (lo[active] + hi[active]) // 2
+            right = x[mid] <= q[active]
+            lo[active[right]] = mid[right]
+            hi[active[~right]] = mid[~right]
+        x_0, x_1, y_0, y_1 = x[lo], x[lo + 1], y[lo], y[lo + 1]
+        return y_0 + (y_1 - y_0) * (q - x_0) / (x_1 - x_0)
+
+    def evaluate_chunks(self, xs: Iterable[float], chunk_size: int = 65536, backend: str = "python") -> Iterator:
+        """
+        Evaluates the interpolant at every point of xs, one chunk at a time, so memory use is
+        bounded by chunk_size however many points there are.
+        Args:
+            xs: The points at which to evaluate, any iterable or a NumPy array.
+            chunk_size: Number of points evaluated together.
+            backend: "python" yields lists, "numpy" yields NumPy arrays (requires NumPy).
+        Returns:
+            An iterator over the results of each chunk, in the order of xs.
+        Raises:
+            ValueError: If chunk_size or the backend is invalid, raised at the call, or if a point
+                is outside the range of x_values, raised while iterating.
+        """
+        # Checked here rather than in the generator, so a bad argument fails at the call
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive value.")
+        if backend == "python":
+            return (self._evaluate_chunk(list(chunk)) for chunk in _chunks(xs, chunk_size))
+        if backend == "numpy":
+            return (self._evaluate_chunk_numpy(chunk) for chunk in _chunks(xs, chunk_size))
+        raise ValueError("Unknown backend. Use 'python' or 'numpy'.")
+
+    def evaluate_many(self, xs: Iterable[float], chunk_size: int = 65536, backend: str = "python") -> Iterator[float]:
+        """
+        Evaluates the interpolant at every point of xs, yielding the values one by one.
+        Args:
+            xs: The points at which to evaluate.
+            chunk_size: Number of points evaluated together.
+            backend: "python" or "numpy".
+        Returns:
+            An iterator over the interpolated values, in the order of xs.
+        """
+        return chain.from_iterable(self.evaluate_chunks(xs, chunk_size, backend))
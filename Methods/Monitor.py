@@ -0,0 +1,104 @@
+import functools
+import inspect
+from time import perf_counter
+from typing import Callable, List, Optional
+
+# Arguments of the solvers that hold the objective function, its derivatives, the Jacobian or the matrix-vector product
+_COUNTED_FUNCTIONS = ("f", "df", "d2f", "g", "jacobian")
+_COUNTED_MATVECS = ("matvec",)
+
+
+class Monitor:
+    """
+    Opt-in instrumentation for the iterative methods of Solutions, LinearSystem and Krylov.
+    Pass an instance as the monitor keyword argument of a solver to record, for that run,
+    the convergence measure of every iteration, the wall-clock time and the number of
+    function evaluations and matrix-vector products. Solvers called without a monitor
+    only pay for an `is None` check per iteration.
+    Attributes:
+        callback (callable | None): Called as callback(iteration, x, step) after each iteration.
+        keep_history (bool): Whether to store the step of every iteration in history.
+        history (list): The convergence measure of each iteration, the quantity each method
+                        compares with its error or tolerance.
+        iterations (int): Number of iterations recorded.
+        evaluations (int): Number of calls to f, its derivatives and the Jacobian of a nonlinear system.
+        matvecs (int): Number of matrix-vector products, a full sweep of a stationary method counts as one.
+        elapsed (float): Wall-clock seconds spent in the last run.
+    """
+
+    def __init__(self, callback: Optional[Callable[[int, object, float], None]] = None, keep_history: bool = True):
+        self.callback = callback
+        self.keep_history = keep_history
+        self.reset()
+
+    def reset(self) -> None:
+        """Clears the data recorded by previous runs."""
+        self.history: List[float] = []
+        self.iterations = 0
+        self.evaluations = 0
+        self.matvecs = 0
+        self.elapsed = 0.0
+        self._started = None
+
+    def start(self) -> None:
+        """Marks the start of a run."""
+        self.reset()
+        self._started = perf_counter()
+
+    def stop(self) -> None:
+        """Marks the end of a run and stores its duration."""
+        if self._started is not None:
+            self.elapsed = perf_counter() - self._started
+
+    def record(self, iteration: int, x, step: float, matvecs: int = 0) -> None:
+        """
+        Records one iteration of a solver.
+        Args:
+            iteration: The iteration index, as counted by the solver.
+            x: The current approximation.
+            step: The convergence measure compared with the error or tolerance.
+            matvecs: Number of matrix-vector products performed by the iteration, if not counted otherwise.
+        """
+        self.iterations += 1
+        self.matvecs += matvecs
+        if self.keep_history:
+            self.history.append(step)
+        if self.callback is not None:
+            self.callback(iteration, x, step)
+
+    def counted(self, f: Callable, attribute: str = "evaluations") -> Callable:
+        """Wraps f so each call increments the given counter."""
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            setattr(self, attribute, getattr(self, attribute) + 1)
+            return f(*args, **kwargs)
+        return wrapper
+
+
+def instrumented(method: Callable) -> Callable:
+    """
+    Decorator for solvers taking a keyword-only monitor argument.
+    When a Monitor is given, the run is timed and the function and matvec arguments are
+    wrapped to count their calls; otherwise the solver is called directly.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        monitor = kwargs.get("monitor")
+        if monitor is None:
+            return method(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        for name in _COUNTED_FUNCTIONS:
+            if callable(bound.arguments.get(name)):
+                bound.arguments[name] = monitor.counted(bound.arguments[name])
+        for name in _COUNTED_MATVECS:
+            if callable(bound.arguments.get(name)):
+                bound.arguments[name] = monitor.counted(bound.arguments[name], "matvecs")
+        monitor.start()
+        try:
+            return method(*bound.args, **bound.kwargs)
+        finally:
+            monitor.stop()
+
+    return wrapper
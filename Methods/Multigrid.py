@@ -0,0 +1,230 @@
+from itertools import product
+from math import prod, sqrt
+from typing import List, Sequence, Tuple
+
+from .CSRMatrix import CSRMatrix
+from .LinearSystem import LinearSystem
+from .Monitor import Monitor, instrumented
+
+Shape = Tuple[int, ...]
+
+
+def _poisson(shape: Shape, sigma: float) -> CSRMatrix:
+    """Assembles -Laplace(u) + sigma u on the interior of a unit grid with zero boundary values."""
+    inverse_squares = [(n + 1) ** 2 for n in shape]  # 1 / h^2 with h = 1 / (n + 1)
+    strides = [prod(shape[d + 1:]) for d in range(len(shape))]
+    diagonal = 2 * sum(inverse_squares) + sigma
+    rows, cols, values = [], [], []
+    for index, point in enumerate(product(*(range(n) for n in shape))):
+        rows.append(index)
+        cols.append(index)
+        values.append(diagonal)
+        for d, coordinate in enumerate(point):
+            for step in (-1, 1):
+                if 0 <= coordinate + step < shape[d]:
+                    rows.append(index)
+                    cols.append(index + step * strides[d])
+                    values.append(-inverse_squares[d])
+    size = prod(shape)
+    return CSRMatrix.from_triplets(rows, cols, values, (size, size))
+
+
+def _restrict_line(line: Sequence[float]) -> List[float]:
+    """Full weighting (1/4, 1/2, 1/4) from 2m + 1 points to m."""
+    return [0.25 * (line[2 * i] + 2 * line[2 * i + 1] + line[2 * i + 2]) for i in range(len(line) // 2)]
+
+
+def _prolong_line(line: Sequence[float]) -> List[float]:
+    """Linear interpolation from m points to 2m + 1."""
+    out = [0.0] * (2 * len(line) + 1)
+    for i, v in enumerate(line):
+        out[2 * i] += 0.5 * v
+        out[2 * i + 1] += v
+        out[2 * i + 2] += 0.5 * v
+    return out
+
+
+def _along_axes(values: List[float], shape: Shape, target: Shape, operator) -> List[float]:
+    """Applies a 1-D transfer operator along every axis whose size changes from shape to target, one axis at a time."""
+    shape = list(shape)
+    for axis, m in enumerate(target):
+        n = shape[axis]
+        if n == m:
+            continue  # Axis not coarsened at this level
+        stride = prod(shape[axis + 1:])
+        out = [0.0] * (prod(shape) // n * m)
+        for outer in range(prod(shape[:axis])):
+            for offset in range(stride):
+                source = outer * n * stride + offset
+                start = outer * m * stride + offset
+                out[start:start + m * stride:stride] = operator(values[source:source + n * stride:stride])
+        values, shape[axis] = out, m
+    return values
+
+
+class Multigrid:
+    """
+    Geometric multigrid solver for Poisson-type problems -Laplace(u) + sigma u = f on regular 1-D and 2-D
+    grids of the unit interval or square with zero boundary values, discretized with the standard
+    3-point and 5-point stencils. The right-hand side and solution are flat lists over the interior
+    grid points in row-major order.
+    Each level halves the grid: its error is smoothed with a few Jacobi or Gauss-Seidel sweeps of
+    LinearSystem, the residual is restricted by full weighting to the next level, the correction
+    computed there is prolonged back by linear interpolation, and the error is smoothed again. The
+    coarsest grid is solved directly with a cached LU factorization. The smoothers remove the
+    oscillatory error that Gauss-Seidel handles well and the coarse levels remove the smooth error
+    it takes O(n^2) sweeps to reach, so every cycle reduces the error by a factor independent of
+    the grid size and a solve costs O(n) work.
+    Each level halves the grid sizes n > 1 to (n - 1) / 2, only along the finest axis of grids
+    with unequal spacing, so the sizes must be of the form 2^k - 1 down to a grid with at most
+    coarse_size unknowns; other sizes are rejected rather than falling back to a dense
+    factorization of the fine grid.
+    Attributes:
+        shapes (list): The grid shape of every level, finest first.
+        cycle (str): "V" or "W".
+    """
+
+    def __init__(
+        self,
+        shape: Sequence[int],
+        sigma: float = 0.0,
+        cycle: str = "V",
+        smoother: str = "gauss_seidel",
+        pre_smoothing: int = 2,
+        post_smoothing: int = 2,
+        omega: float = 2 / 3,
+        coarse_size: int = 9,
+    ):
+        """
+        Args:
+            shape: The number of interior points per dimension, (n,) or (ny, nx).
+            sigma: The non-negative coefficient of the u term.
+            cycle: "V" visits each coarse level once per cycle, "W" twice.
+            smoother: "gauss_seidel", or "jacobi" for damped Jacobi sweeps.
+            pre_smoothing: Sweeps before the coarse-grid correction.
+            post_smoothing: Sweeps after the coarse-grid correction.
+            omega: Damping factor of the Jacobi smoother.
+            coarse_size: Levels with at most this many unknowns are solved directly.
+        Raises:
+            ValueError: If an argument is invalid or the grid cannot be coarsened down to coarse_size unknowns.
+        """
+        shape = tuple(int(n) for n in shape)
+        if len(shape) not in (1, 2) or any(n < 1 for n in shape):
+            raise ValueError("shape must hold one or two positive grid sizes.")
+        if sigma < 0:
+            raise ValueError("sigma must be a non-negative value.")
+        if cycle not in ("V", "W"):
+            raise ValueError("cycle must be 'V' or 'W'.")
+        if smoother not in ("gauss_seidel", "jacobi"):
+            raise ValueError("smoother must be 'gauss_seidel' or 'jacobi'.")
+        if pre_smoothing < 0 or post_smoothing < 0 or pre_smoothing + post_smoothing == 0:
+            raise ValueError("At least one smoothing sweep is required.")
+        if coarse_size < 1:
+            raise ValueError("coarse_size must be a positive value.")
+        self.cycle = cycle
+        self.smoother = smoother
+        self.pre_smoothing = pre_smoothing
+        self.post_smoothing = post_smoothing
+        self.omega = omega
+        self.shapes: List[Shape] = [shape]
+        while prod(shape) > coarse_size:
+            # Semi-coarsening: only the axes with the finest spacing are halved, as point smoothers
+            # cannot smooth across the weak coupling of a much coarser axis
+            finest = max(shape) + 1
+            coarsened = [n > 1 and 2 * (n + 1) > finest for n in shape]
+            if not any(coarsened):
+                break  # Every axis is down to a single point
+            if any(halve and n % 2 == 0 for n, halve in zip(shape, coarsened)):
+                raise ValueError(
+                    f"A grid of shape {self.shapes[0]} cannot be coarsened to {coarse_size} unknowns; "
+                    "use sizes of the form 2^k - 1 or a larger coarse_size."
+                )
+            shape = tuple(n // 2 if halve else n for n, halve in zip(shape, coarsened))
+            self.shapes.append(shape)
+        self._systems = [LinearSystem(_poisson(level, sigma), [0.0] * prod(level)) for level in self.shapes]
+        coarsest = self._systems[-1]
+        self._coarse = LinearSystem(coarsest.coefficients.to_dense(), coarsest.constants)
+        self._coarse.lu_factorization()
+
+    def system(self, constants: List[float]) -> LinearSystem:
+        """
+        Returns the fine-grid problem as a LinearSystem, to solve it with the other methods.
+        Args:
+            constants: The right-hand side f at the interior grid points.
+        Returns:
+            LinearSystem: The sparse system of the finest level.
+        """
+        return LinearSystem(self._systems[0].coefficients, constants)
+
+    def _smooth(self, system: LinearSystem, x: List[float], constants: List[float], sweeps: int) -> None:
+        if self.smoother == "gauss_seidel":
+            for _ in range(sweeps):
+                system.sweep(x, x, constants)
+            return
+        update = [0.0] * len(x)
+        for _ in range(sweeps):
+            system.sweep(x, update, constants)
+            for i, v in enumerate(update):
+                x[i] += self.omega * (v - x[i])
+
+    def _cycle(self, level: int, x: List[float], constants: List[float]) -> None:
+        """Improves x in place with one cycle for A_level x = constants."""
+        if level == len(self.shapes) - 1:
+            x[:] = self._coarse.lu_solve(constants)
+            return
+        system = self._systems[level]
+        fine, coarse = self.shapes[level], self.shapes[level + 1]
+        self._smooth(system, x, constants, self.pre_smoothing)
+        residual = [b - ax for b, ax in zip(constants, system.matvec(x))]
+        coarse_constants = _along_axes(residual, fine, coarse, _restrict_line)
+        correction = [0.0] * len(coarse_constants)
+        for _ in range(1 if self.cycle == "V" else 2):
+            self._cycle(level + 1, correction, coarse_constants)
+        correction = _along_axes(correction, coarse, fine, _prolong_line)
+        for i, e in enumerate(correction):
+            x[i] += e
+        self._smooth(system, x, constants, self.post_smoothing)
+
+    @instrumented
+    def solve(
+        self,
+        constants: List[float],
+        tolerance: float = 1e-8,
+        max_cycles: int = 100,
+        initial_guess: List[float] = None, # type: ignore
+        *,
+        monitor: Monitor = None, # type: ignore
+    ) -> Tuple[list, List[float]]:
+        """
+        Solves the fine-grid problem with repeated multigrid cycles.
+        Args:
+            constants: The right-hand side f at the interior grid points, in row-major order.
+            tolerance: Convergence tolerance on the residual norm, relative to the constants.
+            max_cycles: Maximum number of cycles.
+            initial_guess: Initial guess for the solution.
+            monitor: Optional Monitor recording the residual norm after each cycle.
+        Returns:
+            Tuple[list, List[float]]: The solution vector and the residual norm history, starting with the initial residual.
+        Raises:
+            ValueError: If the constants do not match the grid or the method does not converge.
+        """
+        n = prod(self.shapes[0])
+        if len(constants) != n:
+            raise ValueError("The number of constants must match the number of grid points.")
+        x = [float(v) for v in initial_guess] if initial_guess else [0.0] * n
+        if len(x) != n:
+            raise ValueError("Initial guess size does not match number of variables.")
+        constants = [float(v) for v in constants]
+        fine = self._systems[0]
+        threshold = tolerance * (sqrt(sum(b * b for b in constants)) or 1.0)
+        history = [sqrt(sum((b - ax) ** 2 for b, ax in zip(constants, fine.matvec(x))))]
+        for cycle in range(max_cycles):
+            if history[-1] <= threshold:
+                return x, history
+            self._cycle(0, x, constants)
+            history.append(sqrt(sum((b - ax) ** 2 for b, ax in zip(constants, fine.matvec(x)))))
+            if monitor is not None:
+                monitor.record(cycle, x, history[-1])
+        if history[-1] <= threshold:
+            return x, history
+        raise ValueError("Method did not converge within the maximum number of iterations.")
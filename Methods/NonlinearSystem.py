@@ -0,0 +1,128 @@
+from typing import Callable, List, Sequence
+
+from .Dual import Dual
+from .LinearSystem import LinearSystem
+from .Monitor import Monitor, instrumented
+
+VectorFunction = Callable[[List], Sequence]
+
+
+class NonlinearSystem:
+    """
+    Newton-type methods for systems of nonlinear equations F(x) = 0 with F: R^n -> R^n.
+    When no Jacobian is supplied it is computed exactly by forward-mode automatic differentiation,
+    so f must be written with Dual-aware operations (arithmetic, the functions of Methods.Dual,
+    or NumPy ufuncs on object arrays).
+    """
+
+    @staticmethod
+    def _jacobian(f: VectorFunction, jacobian, x: List[float]):
+        """Returns F(x) and the Jacobian at x, from the user callable or by automatic differentiation."""
+        if jacobian is None:
+            return Dual.jacobian(f, x)
+        return [float(v) for v in f(x)], [list(row) for row in jacobian(x)]
+
+    @staticmethod
+    @instrumented
+    def newton(
+        f: VectorFunction,
+        x0: Sequence[float],
+        error: float,
+        max_iter: int,
+        jacobian: Callable[[List[float]], Sequence[Sequence[float]]] = None, # type: ignore
+        *,
+        monitor: Monitor = None, # type: ignore
+    ):
+        """
+        Newton method for nonlinear systems: solves J(x_k) dx = -F(x_k) with a pivoted LU
+        factorization from LinearSystem and sets x_k+1 = x_k + dx.
+        Args:
+            f: The vector function for which to find a root.
+            x0: The initial guess.
+            error: The acceptable error margin on the largest component of the step.
+            max_iter: The maximum number of iterations to perform.
+            jacobian: Optional callable returning the Jacobian matrix, automatic differentiation when None.
+            monitor: Optional Monitor recording each iteration.
+        Returns:
+            A tuple containing the root and the number of iterations performed.
+        Raises:
+            ValueError: If the Jacobian is singular or the method fails to converge within the maximum number of iterations.
+        """
+        if error <= 0 or max_iter <= 0:
+            raise ValueError("Error and max_iter must be positive values.")
+        x = [float(v) for v in x0]
+        i = 0
+        while i <= max_iter:
+            F_x, J = NonlinearSystem._jacobian(f, jacobian, x)
+            if len(F_x) != len(x):
+                raise ValueError("f must return as many equations as there are unknowns.")
+            dx = LinearSystem(J, [-v for v in F_x]).lu_solve()
+            x = [a + d for a, d in zip(x, dx)]
+            step = max(abs(d) for d in dx)
+            if monitor is not None:
+                monitor.record(i, x, step)
+            if step < error:
+                return x, i
+            i += 1
+        raise ValueError("Method failed after maximum iterations")
+
+    @staticmethod
+    @instrumented
+    def broyden(
+        f: VectorFunction,
+        x0: Sequence[float],
+        error: float,
+        max_iter: int,
+        jacobian: Callable[[List[float]], Sequence[Sequence[float]]] = None, # type: ignore
+        *,
+        monitor: Monitor = None, # type: ignore
+    ):
+        """
+        Broyden quasi-Newton method: the Jacobian is computed only at x0 and inverted once with
+        LinearSystem, then its inverse H is kept up to date with the rank-one "good Broyden" update
+            H <- H + (dx - H dF) dx^T H / (dx^T H dF),
+        so each iteration costs one evaluation of f and O(n^2) work.
+        Args:
+            f: The vector function for which to find a root.
+            x0: The initial guess.
+            error: The acceptable error margin on the largest component of the step.
+            max_iter: The maximum number of iterations to perform.
+            jacobian: Optional callable returning the initial Jacobian, automatic differentiation when None.
+            monitor: Optional Monitor recording each iteration.
+        Returns:
+            A tuple containing the root and the number of iterations performed.
+        Raises:
+            ValueError: If the Jacobian is singular or the method fails to converge within the maximum number of iterations.
+        """
+        if error <= 0 or max_iter <= 0:
+            raise ValueError("Error and max_iter must be positive values.")
+        x = [float(v) for v in x0]
+        n = len(x)
+        F_x, J = NonlinearSystem._jacobian(f, jacobian, x)
+        if len(F_x) != n:
+            raise ValueError("f must return as many equations as there are unknowns.")
+        H = LinearSystem(J, [0.0] * n).inverse()
+        i = 0
+        while i <= max_iter:
+            dx = [-sum(h * v for h, v in zip(row, F_x)) for row in H]
+            x = [a + d for a, d in zip(x, dx)]
+            step = max(abs(d) for d in dx)
+            if monitor is not None:
+                monitor.record(i, x, step)
+            if step < error:
+                return x, i
+            F_new = [float(v) for v in f(x)]
+            dF = [b - a for a, b in zip(F_x, F_new)]
+            F_x = F_new
+            H_dF = [sum(h * v for h, v in zip(row, dF)) for row in H]
+            dx_H = [sum(dx[k] * H[k][j] for k in range(n)) for j in range(n)]
+            denominator = sum(d * v for d, v in zip(dx, H_dF))
+            if denominator == 0:
+                raise ValueError("Division by zero. No solution found.")
+            u = [(d - v) / denominator for d, v in zip(dx, H_dF)]
+            for r in range(n):
+                row = H[r]
+                for c in range(n):
+                    row[c] += u[r] * dx_H[c]
+            i += 1
+        raise ValueError("Method failed after maximum iterations")
@@ -0,0 +1,173 @@
+import cmath
+import sys
+from typing import List, Sequence, Tuple
+
+from .Backend import load_numpy
+
+
+class Polynomial:
+    """
+    Simultaneous root finders for polynomials given by their coefficient list, highest degree first:
+    [a_0, a_1, ..., a_n] is a_0 x^n + a_1 x^(n-1) + ... + a_n.
+    All roots, real and complex, are approximated at once, so no deflation is needed.
+    An approximation at which |p| is below the rounding error of evaluating it is kept in place:
+    no further step can improve it, and this also ends the iteration on multiple roots, which
+    are only determined to about the m-th root of machine precision for multiplicity m.
+    The iterative methods update the roots with plain Python complex arithmetic: a degree-n
+    iteration costs O(n^2), small enough for the polynomials they are meant for that moving it to
+    the array backends was left out; use companion_roots for a NumPy-based solve.
+    """
+
+    @staticmethod
+    def horner(coefficients: Sequence[complex], points: Sequence[complex]) -> Tuple[List[complex], List[complex]]:
+        """
+        Evaluates a polynomial and its derivative at every point with a single batched Horner pass.
+        Args:
+            coefficients: The polynomial coefficients, highest degree first.
+            points: The points at which to evaluate.
+        Returns:
+            A tuple with the lists of p(x) and p'(x) at each point.
+        """
+        p = [0j] * len(points)
+        dp = [0j] * len(points)
+        for a in coefficients:
+            dp = [d * x + v for d, x, v in zip(dp, points, p)]
+            p = [v * x + a for v, x in zip(p, points)]
+        return p, dp
+
+    @staticmethod
+    def _prepare(coefficients: Sequence[complex]) -> Tuple[List[complex], int]:
+        """Strips leading zeros and returns the coefficients without the roots at zero, and how many there were."""
+        coefficients = list(coefficients)
+        while coefficients and coefficients[0] == 0:
+            coefficients.pop(0)
+        if not coefficients:
+            raise ValueError("The zero polynomial has no isolated roots.")
+        zeros = 0
+        while len(coefficients) > 1 and coefficients[-1] == 0:
+            coefficients.pop()
+            zeros += 1
+        return coefficients, zeros
+
+    @staticmethod
+    def _rounding_bounds(coefficients: List[complex], points: Sequence[complex]) -> List[float]:
+        """Bounds on the rounding error of Horner's rule at each point; a smaller |p(z)| is as good as zero."""
+        bounds = [0.0] * len(points)
+        for a in coefficients:
+            bounds = [b * abs(x) + abs(a) for b, x in zip(bounds, points)]
+        unit = 2 * len(coefficients) * sys.float_info.epsilon
+        return [unit * b for b in bounds]
+
+    @staticmethod
+    def _initial_guesses(coefficients: List[complex]) -> List[complex]:
+        """Spreads the starting points on a circle around the root centroid whose radius bounds the roots."""
+        n = len(coefficients) - 1
+        center = -coefficients[1] / (n * coefficients[0])
+        radius = 2 * max(abs(coefficients[k] / coefficients[0]) ** (1 / k) for k in range(1, n + 1)) # Fujiwara bound
+        return [center + radius * cmath.exp(1j * (2 * cmath.pi * k / n + 0.4)) for k in range(n)]
+
+    @staticmethod
+    def aberth(coefficients: Sequence[complex], error: float = 1e-12, max_iter: int = 500):
+        """
+        Aberth-Ehrlich method: every approximation z_k takes the Newton step w_k = p(z_k)/p'(z_k),
+        corrected for the repulsion of the other approximations,
+            z_k <- z_k - w_k / (1 - w_k * sum_{j != k} 1 / (z_k - z_j)),
+        with all approximations updated together. Converges cubically to simple roots.
+        Args:
+            coefficients: The polynomial coefficients, highest degree first.
+            error: The acceptable error margin on every correction, relative to max(1, |z_k|).
+            max_iter: The maximum number of iterations to perform.
+        Returns:
+            A tuple containing the list of complex roots and the number of iterations performed.
+        Raises:
+            ValueError: If the method fails to converge within the maximum number of iterations.
+        """
+        if error <= 0 or max_iter <= 0:
+            raise ValueError("Error and max_iter must be positive values.")
+        coefficients, zeros = Polynomial._prepare(coefficients)
+        if len(coefficients) == 1:
+            return [0j] * zeros, 0
+        z = Polynomial._initial_guesses(coefficients)
+        n = len(z)
+        i = 0
+        while i <= max_iter:
+            p, dp = Polynomial.horner(coefficients, z)
+            bounds = Polynomial._rounding_bounds(coefficients, z)
+            corrections = []
+            for k in range(n):
+                if abs(p[k]) <= bounds[k]: # Root found to working precision, keep it in place
+                    corrections.append(0j)
+                    continue
+                repulsion = sum(1 / (z[k] - z[j]) for j in range(n) if j != k)
+                if dp[k] == 0: # Newton step undefined, fall back to the Weierstrass-like term
+                    corrections.append(-1 / repulsion if repulsion else 0j)
+                    continue
+                w = p[k] / dp[k]
+                corrections.append(w / (1 - w * repulsion))
+            z = [zk - c for zk, c in zip(z, corrections)]
+            if all(abs(c) <= error * max(1, abs(zk)) for zk, c in zip(z, corrections)):
+                return z + [0j] * zeros, i
+            i += 1
+        raise ValueError("Method failed after maximum iterations")
+
+    @staticmethod
+    def durand_kerner(coefficients: Sequence[complex], error: float = 1e-12, max_iter: int = 1000):
+        """
+        Durand-Kerner (Weierstrass) method: z_k <- z_k - p(z_k) / (a_0 * prod_{j != k} (z_k - z_j)),
+        with all approximations updated together. Converges quadratically to simple roots.
+        Args:
+            coefficients: The polynomial coefficients, highest degree first.
+            error: The acceptable error margin on every correction, relative to max(1, |z_k|).
+            max_iter: The maximum number of iterations to perform.
+        Returns:
+            A tuple containing the list of complex roots and the number of iterations performed.
+        Raises:
+            ValueError: If the method fails to converge within the maximum number of iterations.
+        """
+        if error <= 0 or max_iter <= 0:
+            raise ValueError("Error and max_iter must be positive values.")
+        coefficients, zeros = Polynomial._prepare(coefficients)
+        if len(coefficients) == 1:
+            return [0j] * zeros, 0
+        z = Polynomial._initial_guesses(coefficients)
+        n = len(z)
+        leading = coefficients[0]
+        i = 0
+        while i <= max_iter:
+            p, _ = Polynomial.horner(coefficients, z)
+            bounds = Polynomial._rounding_bounds(coefficients, z)
+            corrections = []
+            for k in range(n):
+                if abs(p[k]) <= bounds[k]: # Root found to working precision, keep it in place
+                    corrections.append(0j)
+                    continue
+                denominator = leading
+                for j in range(n):
+                    if j != k:
+                        denominator *= z[k] - z[j]
+                corrections.append(p[k] / denominator if denominator != 0 else 0j)
+            z = [zk - c for zk, c in zip(z, corrections)]
+            if all(abs(c) <= error * max(1, abs(zk)) for zk, c in zip(z, corrections)):
+                return z + [0j] * zeros, i
+            i += 1
+        raise ValueError("Method failed after maximum iterations")
+
+    @staticmethod
+    def companion_roots(coefficients: Sequence[complex]) -> List[complex]:
+        """
+        Computes the roots as the eigenvalues of the companion matrix, using NumPy.
+        Serves as a reference for the iterative methods.
+        Args:
+            coefficients: The polynomial coefficients, highest degree first.
+        Returns:
+            The list of complex roots.
+        """
+        np = load_numpy()
+        coefficients, zeros = Polynomial._prepare(coefficients)
+        n = len(coefficients) - 1
+        if n == 0:
+            return [0j] * zeros
+        companion = np.zeros((n, n), dtype=complex)
+        companion[0, :] = -np.asarray(coefficients[1:], dtype=complex) / coefficients[0]
+        companion[np.arange(1, n), np.arange(n - 1)] = 1
+        return [complex(root) for root in np.linalg.eigvals(companion)] + [0j] * zeros
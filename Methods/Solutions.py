@@ -1,15 +1,29 @@
-from typing import Callable
+import sys
+from concurrent.futures import Executor
+from typing import Callable, List, Optional
+
+from .Monitor import Monitor, instrumented
 
 
 class Solutions:
+    """
+    Root finding and fixed point methods for scalar functions.
+    Every method calls f as a plain callable and does not wrap it itself; to cache values,
+    limit the number of evaluations or count them, pass an Evaluator as f.
+    Every method also accepts a keyword-only Monitor to record the convergence history,
+    the number of evaluations and the wall-clock time of a run.
+    """
 
     @staticmethod
+    @instrumented
     def bisection(
         f: Callable[[float], float],
         a: float,
         b: float,
         error: float,
         max_iter: int,
+        *,
+        monitor: Monitor = None, # type: ignore
     ):
         """
         Bisection method to find a root of the function f in the interval [a, b].
@@ -19,6 +33,7 @@ class Solutions:
             b: The end of the interval.
             error: The acceptable error margin.
             max_iter: The maximum number of iterations to perform.
+            monitor: Optional Monitor recording each iteration.
         Returns:
             A tuple containing the root and the number of iterations performed.
         Raises:
@@ -26,12 +41,15 @@ class Solutions:
         """
         if error <= 0 or max_iter <= 0:
             raise ValueError("Error and max_iter must be positive values.")
-        if f(a) * f(b) >= 0:
-            raise ValueError("f(a) and f(b) must have different signs.")
         F_a = f(a)
+        if F_a * f(b) >= 0:
+            raise ValueError("f(a) and f(b) must have different signs.")
         i = 0
         while i <= max_iter:
-            if (F_x := f(x := (a + b) / 2)) == 0 or (b - a) / 2 < error:
+            F_x = f(x := (a + b) / 2)
+            if monitor is not None:
+                monitor.record(i, x, (b - a) / 2)
+            if F_x == 0 or (b - a) / 2 < error:
                 return x, i
 
             if F_a * F_x > 0:
@@ -42,11 +60,14 @@ class Solutions:
         raise ValueError("Method failed after maximum iterations")
 
     @staticmethod
+    @instrumented
     def fixed_point(
         g: Callable[[float], float], 
         x0: float, 
         error: float, 
-        max_iter: int
+        max_iter: int,
+        *,
+        monitor: Monitor = None, # type: ignore
     ):
         """
         Fixed Point Iteration method to find a fixed point of the function g.
@@ -55,6 +76,7 @@ class Solutions:
             x0: The initial guess.
             error: The acceptable error margin.
             max_iter: The maximum number of iterations to perform.
+            monitor: Optional Monitor recording each iteration.
         Returns:
             A tuple containing the fixed point and the number of iterations performed.
         Raises:
@@ -66,6 +88,8 @@ class Solutions:
         x_n = x0
         while i <= max_iter:
             x_n1 = g(x_n)
+            if monitor is not None:
+                monitor.record(i, x_n1, abs(x_n1 - x_n))
             if abs(x_n1 - x_n) < error:
                 return x_n1, i
             x_n = x_n1
@@ -73,12 +97,15 @@ class Solutions:
         raise ValueError("Method failed after maximum iterations")
 
     @staticmethod
+    @instrumented
     def newton_raphson(
         f: Callable[[float], float],
         df: Callable[[float], float],
         x0: float,
         error: float,
         max_iter: int,
+        *,
+        monitor: Monitor = None, # type: ignore
     ):
         """
         Newton-Raphson method to find a root of the function f.
@@ -88,6 +115,7 @@ class Solutions:
             x0: The initial guess.
             error: The acceptable error margin.
             max_iter: The maximum number of iterations to perform.
+            monitor: Optional Monitor recording each iteration.
         Returns:
             A tuple containing the root and the number of iterations performed.
         Raises:
@@ -102,6 +130,8 @@ class Solutions:
             if df_xn == 0:
                 raise ValueError("Derivative is zero. No solution found.")
             x_n1 = x_n - f(x_n) / df_xn
+            if monitor is not None:
+                monitor.record(i, x_n1, abs(x_n1 - x_n))
             if abs(x_n1 - x_n) < error:
                 return x_n1, i
             x_n = x_n1
@@ -109,12 +139,15 @@ class Solutions:
         raise ValueError("Method failed after maximum iterations")
 
     @staticmethod
+    @instrumented
     def secant(
         f: Callable[[float], float], 
         x0: float, 
         x1: float, 
         error: float, 
-        max_iter: int
+        max_iter: int,
+        *,
+        monitor: Monitor = None, # type: ignore
     ):
         """
         Secant method to find a root of the function f.
@@ -124,6 +157,7 @@ class Solutions:
             x1: The second initial guess.
             error: The acceptable error margin.
             max_iter: The maximum number of iterations to perform.
+            monitor: Optional Monitor recording each iteration.
         Returns:
             A tuple containing the root and the number of iterations performed.
         Raises:
@@ -132,25 +166,33 @@ class Solutions:
         if error <= 0 or max_iter <= 0:
             raise ValueError("Error and max_iter must be positive values.")
         i = 0
+        f_x0 = f(x0)
+        f_x1 = f(x1)
         while i <= max_iter:
-            f_x0 = f(x0)
-            f_x1 = f(x1)
             if f_x1 - f_x0 == 0:
                 raise ValueError("Division by zero. No solution found.")
             x2 = x1 - f_x1 * (x1 - x0) / (f_x1 - f_x0)
+            if monitor is not None:
+                monitor.record(i, x2, abs(x2 - x1))
             if abs(x2 - x1) < error:
                 return x2, i
+            if i == max_iter:
+                break # Do not evaluate a point that will never be used
             x0, x1 = x1, x2
+            f_x0, f_x1 = f_x1, f(x2) # Only the new point needs evaluating
             i += 1
         raise ValueError("Method failed after maximum iterations")
 
     @staticmethod
+    @instrumented
     def regula_falsi(
         f: Callable[[float], float], 
         a: float, 
         b: float, 
         error: float, 
-        max_iter: int
+        max_iter: int,
+        *,
+        monitor: Monitor = None, # type: ignore
     ):
         """
         Regula Falsi method to find a root of the function f in the interval [a, b].
@@ -160,6 +202,7 @@ class Solutions:
             b: The end of the interval.
             error: The acceptable error margin.
             max_iter: The maximum number of iterations to perform.
+            monitor: Optional Monitor recording each iteration.
         Returns:
             A tuple containing the root and the number of iterations performed.
         Raises:
@@ -167,15 +210,16 @@ class Solutions:
         """
         if error <= 0 or max_iter <= 0:
             raise ValueError("Error and max_iter must be positive values.")
-        if f(a) * f(b) >= 0:
-            raise ValueError("f(a) and f(b) must have different signs.")
         F_a = f(a)
         F_b = f(b)
+        if F_a * F_b >= 0:
+            raise ValueError("f(a) and f(b) must have different signs.")
         i = 0
         while i <= max_iter:
-            if (F_x := f(x := (a * F_b - b * F_a) / (F_b - F_a))) == 0 or abs(
-                F_x
-            ) < error:
+            F_x = f(x := (a * F_b - b * F_a) / (F_b - F_a))
+            if monitor is not None:
+                monitor.record(i, x, abs(F_x))
+            if F_x == 0 or abs(F_x) < error:
                 return x, i
 
             if F_a * F_x > 0:
@@ -186,6 +230,7 @@ class Solutions:
         raise ValueError("Method failed after maximum iterations")
 
     @staticmethod
+    @instrumented
     def muller(
         f: Callable[[float], float],
         x0: float,
@@ -193,6 +238,8 @@ class Solutions:
         x2: float,
         error: float,
         max_iter: int,
+        *,
+        monitor: Monitor = None, # type: ignore
     ):
         """
         Muller method to find a root of the function f.
@@ -203,6 +250,7 @@ class Solutions:
             x2: The third initial guess.
             error: The acceptable error margin.
             max_iter: The maximum number of iterations to perform.
+            monitor: Optional Monitor recording each iteration.
         Returns:
             A tuple containing the root and the number of iterations performed.
         Raises:
@@ -211,11 +259,10 @@ class Solutions:
         if error <= 0 or max_iter <= 0:
             raise ValueError("Error and max_iter must be positive values.")
         i = 0
+        f_x0 = f(x0)
+        f_x1 = f(x1)
+        f_x2 = f(x2)
         while i <= max_iter:
-            f_x0 = f(x0)
-            f_x1 = f(x1)
-            f_x2 = f(x2)
-
             h0 = x1 - x0
             h1 = x2 - x1
             if h0 == 0 or h1 == 0:
@@ -238,10 +285,237 @@ class Solutions:
             if denominator == 0:
                 raise ValueError("Division by zero. No solution found.")
             x3 = x2 - (2 * c) / denominator
+            if monitor is not None:
+                monitor.record(i, x3, abs(x3 - x2))
 
             if abs(x3 - x2) < error:
                 return x3, i
+            if i == max_iter:
+                break # Do not evaluate a point that will never be used
 
             x0, x1, x2 = x1, x2, x3
+            f_x0, f_x1, f_x2 = f_x1, f_x2, f(x3) # Only the new point needs evaluating
             i += 1
         raise ValueError("Method failed after maximum iterations")
+
+    @staticmethod
+    @instrumented
+    def brent(
+        f: Callable[[float], float],
+        a: float,
+        b: float,
+        error: float,
+        max_iter: int,
+        *,
+        monitor: Monitor = None, # type: ignore
+    ):
+        """
+        Brent method to find a root of the function f in the interval [a, b].
+        Combines inverse quadratic interpolation and the secant step with bisection
+        as a fallback, so it keeps the bracket of the bisection method while
+        converging superlinearly on smooth functions.
+        Args:
+            f: The function for which to find the root.
+            a: The start of the interval.
+            b: The end of the interval.
+            error: The acceptable error margin.
+            max_iter: The maximum number of iterations to perform.
+            monitor: Optional Monitor recording each iteration.
+        Returns:
+            A tuple containing the root, the number of iterations performed and the number of evaluations of f.
+        Raises:
+            ValueError: If the method fails to converge within the maximum number of iterations.
+        """
+        if error <= 0 or max_iter <= 0:
+            raise ValueError("Error and max_iter must be positive values.")
+        F_a = f(a)
+        F_b = f(b)
+        evaluations = 2
+        if F_a * F_b >= 0:
+            raise ValueError("f(a) and f(b) must have different signs.")
+        c, F_c = b, F_b
+        d = e = b - a
+        i = 0
+        while i <= max_iter:
+            if (F_b > 0 and F_c > 0) or (F_b < 0 and F_c < 0): # Keep the root bracketed between b and c
+                c, F_c = a, F_a
+                d = e = b - a
+            if abs(F_c) < abs(F_b): # Make b the best estimate so far
+                a, b, c = b, c, b
+                F_a, F_b, F_c = F_b, F_c, F_b
+            tol = 2 * sys.float_info.epsilon * abs(b) + error / 2
+            m = (c - b) / 2
+            if monitor is not None:
+                monitor.record(i, b, abs(m))
+            if abs(m) <= tol or F_b == 0:
+                return b, i, evaluations
+
+            if abs(e) >= tol and abs(F_a) > abs(F_b):
+                s = F_b / F_a
+                if a == c: # Secant step
+                    p = 2 * m * s
+                    q = 1 - s
+                else: # Inverse quadratic interpolation
+                    q = F_a / F_c
+                    r = F_b / F_c
+                    p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+                if p > 0:
+                    q = -q
+                p = abs(p)
+                if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                    e, d = d, p / q # Accept the interpolation
+                else:
+                    d = e = m # Fall back to bisection
+            else:
+                d = e = m
+            if i == max_iter:
+                break # Do not evaluate a point that will never be used
+            a, F_a = b, F_b
+            b += d if abs(d) > tol else (tol if m > 0 else -tol)
+            F_b = f(b)
+            evaluations += 1
+            i += 1
+        raise ValueError("Method failed after maximum iterations")
+
+    @staticmethod
+    @instrumented
+    def halley(
+        f: Callable[[float], float],
+        df: Callable[[float], float],
+        d2f: Callable[[float], float],
+        x0: float,
+        error: float,
+        max_iter: int,
+        *,
+        monitor: Monitor = None, # type: ignore
+    ):
+        """
+        Halley method to find a root of the function f, with cubic convergence near simple roots.
+        Args:
+            f: The function for which to find the root.
+            df: The first derivative of the function f.
+            d2f: The second derivative of the function f.
+            x0: The initial guess.
+            error: The acceptable error margin.
+            max_iter: The maximum number of iterations to perform.
+            monitor: Optional Monitor recording each iteration.
+        Returns:
+            A tuple containing the root, the number of iterations performed and the
+            number of evaluations of f, df and d2f combined.
+        Raises:
+            ValueError: If the method fails to converge within the maximum number of iterations.
+        """
+        if error <= 0 or max_iter <= 0:
+            raise ValueError("Error and max_iter must be positive values.")
+        i = 0
+        evaluations = 0
+        x_n = x0
+        while i <= max_iter:
+            f_xn = f(x_n)
+            df_xn = df(x_n)
+            d2f_xn = d2f(x_n)
+            evaluations += 3
+            denominator = 2 * df_xn**2 - f_xn * d2f_xn
+            if denominator == 0:
+                raise ValueError("Division by zero. No solution found.")
+            x_n1 = x_n - 2 * f_xn * df_xn / denominator
+            if monitor is not None:
+                monitor.record(i, x_n1, abs(x_n1 - x_n))
+            if abs(x_n1 - x_n) < error:
+                return x_n1, i, evaluations
+            x_n = x_n1
+            i += 1
+        raise ValueError("Method failed after maximum iterations")
+
+    @staticmethod
+    def _sample(f: Callable, points: List[float], vectorized: bool) -> List[float]:
+        """Evaluates f at every point, in a single call when f is vectorized."""
+        if vectorized:
+            return [float(v) for v in f(points)]
+        return [f(x) for x in points]
+
+    @staticmethod
+    def find_all_roots(
+        f: Callable[[float], float],
+        a: float,
+        b: float,
+        error: float,
+        max_iter: int,
+        samples: int = 100,
+        method: str = "brent",
+        vectorized: bool = False,
+        refine: float = 0.05,
+        max_depth: int = 6,
+        executor: Optional[Executor] = None,
+    ) -> List[float]:
+        """
+        Finds every root of f in [a, b] that shows up as a sign change on an adaptive grid.
+        f is sampled on an even grid; intervals where f is far from linear (its midpoint deviates from
+        the chord by more than refine times the sampled range of f) or steep (it changes by more than
+        four times that amount) are bisected again, up to max_depth times, so the grid is denser where
+        f changes quickly. Every sign change of the final grid is
+        then refined with a bracketed method, concurrently when an executor is given.
+        Roots of even multiplicity that never change sign are only found if a grid point hits them.
+        Args:
+            f: The function for which to find the roots.
+            a: The start of the interval.
+            b: The end of the interval.
+            error: The acceptable error margin, also the distance under which two roots are merged.
+            max_iter: The maximum number of iterations of each refinement.
+            samples: Number of points of the initial grid, at least 2.
+            method: Bracketed method used to refine each root: "brent", "bisection" or "regula_falsi".
+            vectorized: Whether f accepts a list of points and returns a list of values.
+            refine: Tolerance of the adaptive refinement, relative to the sampled range of f.
+            max_depth: Maximum number of times an initial grid interval is halved.
+            executor: Thread or process pool used to refine the brackets, a ProcessPoolExecutor
+                      requires f to be picklable.
+        Returns:
+            The sorted list of roots.
+        Raises:
+            ValueError: If the arguments are invalid or a refinement fails to converge.
+        """
+        if error <= 0 or max_iter <= 0:
+            raise ValueError("Error and max_iter must be positive values.")
+        if samples < 2 or a >= b:
+            raise ValueError("samples must be at least 2 and a must be smaller than b.")
+        refiners = {"brent": Solutions.brent, "bisection": Solutions.bisection, "regula_falsi": Solutions.regula_falsi}
+        if method not in refiners:
+            raise ValueError(f"Unknown method: {method}.")
+        xs = [a + (b - a) * i / (samples - 1) for i in range(samples)]
+        fs = Solutions._sample(f, xs, vectorized)
+        scale = refine * ((max(fs) - min(fs)) or 1.0)
+        active = list(range(samples - 1)) # Intervals [xs[i], xs[i + 1]] still to be checked
+        for _ in range(max_depth):
+            if not active:
+                break
+            midpoints = [(xs[i] + xs[i + 1]) / 2 for i in active]
+            values = Solutions._sample(f, midpoints, vectorized)
+            inserted = dict(zip(active, zip(midpoints, values)))
+            new_xs, new_fs, new_active = [], [], []
+            for i in range(len(xs)):
+                new_xs.append(xs[i])
+                new_fs.append(fs[i])
+                if i in inserted:
+                    x_m, F_m = inserted[i]
+                    if abs(F_m - (fs[i] + fs[i + 1]) / 2) > scale or abs(fs[i + 1] - fs[i]) > 4 * scale: # Far from linear or steep, keep refining both halves
+                        new_active += [len(new_xs) - 1, len(new_xs)]
+                    new_xs.append(x_m)
+                    new_fs.append(F_m)
+            xs, fs, active = new_xs, new_fs, new_active
+
+        roots = [x for x, F_x in zip(xs, fs) if F_x == 0]
+        brackets = [(xs[i], xs[i + 1]) for i in range(len(xs) - 1) if fs[i] * fs[i + 1] < 0]
+        refiner = refiners[method]
+        if executor is None:
+            results = [refiner(f, lo, hi, error, max_iter) for lo, hi in brackets]
+        else:
+            futures = [executor.submit(refiner, f, lo, hi, error, max_iter) for lo, hi in brackets]
+            results = [future.result() for future in futures]
+        roots += [result[0] for result in results]
+
+        unique: List[float] = []
+        for root in sorted(roots): # Merge roots closer than the error margin
+            if not unique or root - unique[-1] > error:
+                unique.append(root)
+        return unique
@@ -1,8 +1,14 @@
 from .Solutions import Solutions
 from .Errors import Errors
+# Imported eagerly: binding the classes here keeps `from Methods import LinearSystem` a class even
+# after the submodule of the same name is imported. NumPy itself is still only loaded on first use.
+from .LinearSystem import LinearSystem
+from .Interpolation import Interpolation
 
 
 __all__ = [
     "Solutions",
-    "Errors"
-]
\ No newline at end of file
+    "Errors",
+    "LinearSystem",
+    "Interpolation",
+]
@@ -0,0 +1,33 @@
+"""
+Compares wall-clock time and evaluation counts of the sequential bisection method and the
+concurrent k-section method on a mock objective with artificial latency. Run from the
+project root:
+
+    python -m benchmarks.async_k_section
+"""
+import asyncio
+from time import perf_counter
+
+from Methods.AsyncSolutions import AsyncSolutions
+
+LATENCY = 0.01 # Seconds per evaluation of the mock objective
+
+
+async def remote_objective(x: float) -> float:
+    await asyncio.sleep(LATENCY) # Stands in for a call to a remote simulator
+    return x**3 - 2 * x - 5
+
+
+async def main():
+    start = perf_counter()
+    root, iterations = await AsyncSolutions.bisection(remote_objective, 2, 3, 1e-10, 100)
+    print(f"bisection   root={root:.12f} rounds={iterations:3d} time={perf_counter() - start:.3f}s")
+    for k in (2, 4, 8, 16, 32):
+        start = perf_counter()
+        root, iterations, evaluations = await AsyncSolutions.k_section(remote_objective, 2, 3, 1e-10, 100, k=k)
+        elapsed = perf_counter() - start
+        print(f"k-section k={k:<2d} root={root:.12f} rounds={iterations:3d} evaluations={evaluations:4d} time={elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""
+Cross-checks the pure Python and NumPy backends (requires NumPy): every kernel used by
+LinearSystem, Interpolation and Errors is run with both on the same inputs, and the largest
+difference between the results is reported with the time each backend took.
+The exit status is 1 if the backends disagree beyond the tolerance. Run from the project root:
+
+    python -m benchmarks.backends
+"""
+import math
+import random
+import sys
+from time import perf_counter
+
+from Methods.Backend import get_backend
+from Methods.Errors import Errors, ErrorStatistics
+from Methods.Interpolation import CubicSpline, Interpolation
+from Methods.LinearSystem import LinearSystem
+
+TOLERANCE = 1e-9
+
+
+def _difference(a, b) -> float:
+    """Largest difference between two results, treating equal infinities and NaNs as equal."""
+    worst = 0.0
+    for x, y in zip(a, b):
+        x, y = float(x), float(y)
+        if x == y or (math.isnan(x) and math.isnan(y)):
+            continue
+        worst = max(worst, abs(x - y) / max(1.0, abs(x)))
+    return worst
+
+
+def _timed(run):
+    start = perf_counter()
+    result = run()
+    return result, perf_counter() - start
+
+
+def _cases(n: int):
+    random.seed(n)
+    nodes = [math.cos(math.pi * (n - 1 - k) / (n - 1)) for k in range(n)]
+    values = [math.sin(3 * x) for x in nodes]
+    queries = [random.uniform(-1, 1) for _ in range(20 * n)] + nodes[:5]
+    interpolation = Interpolation(nodes, values)
+    spline = CubicSpline(nodes, values)
+    true_values = [random.choice((0.0, random.gauss(0, 1))) for _ in range(20 * n)]
+    approx_values = [t + random.gauss(0, 1e-3) for t in true_values]
+    size = math.isqrt(n) ** 2
+    width = math.isqrt(size)
+    matrix = [[5.0 if i == j else (-1.0 if abs(i - j) == width or (abs(i - j) == 1 and max(i, j) % width) else 0.0) for j in range(size)] for i in range(size)]
+    system = LinearSystem(matrix, [1.0] * size)
+    return {
+        "barycentric_lagrange_many": lambda backend: interpolation.barycentric_lagrange_many(queries, backend),
+        "newton_many": lambda backend: interpolation.newton_many(queries, backend),
+        "cubic_spline": lambda backend: spline.evaluate_many(queries, backend),
+        "absolute_errors": lambda backend: Errors.absolute_errors(true_values, approx_values, backend),
+        "relative_errors": lambda backend: Errors.relative_errors(true_values, approx_values, "inf", backend),
+        "error_statistics": lambda backend: list(ErrorStatistics().update(approx_values, backend).to_dict().values()),
+        "gauss_jacobi": lambda backend: system.gauss_jacobi(tolerance=1e-12, backend=backend),
+        "red_black_gauss_seidel": lambda backend: system.red_black_gauss_seidel(tolerance=1e-12, backend=backend),
+    }
+
+
+def main() -> int:
+    python, numpy = get_backend("python"), get_backend("numpy")
+    failures = 0
+    print(f"{'n':>5}  {'kernel':<26}{'python (ms)':>13}{'numpy (ms)':>12}{'difference':>12}")
+    for n in (16, 64, 256):
+        for name, run in _cases(n).items():
+            expected, python_time = _timed(lambda: run(python))
+            result, numpy_time = _timed(lambda: run(numpy))
+            difference = _difference(expected, result)
+            failures += difference > TOLERANCE
+            flag = "" if difference <= TOLERANCE else "  MISMATCH"
+            print(f"{n:>5}  {name:<26}{python_time * 1e3:>13.2f}{numpy_time * 1e3:>12.2f}{difference:>12.1e}{flag}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Cross-checks BatchSolutions against the scalar Solutions methods, the reference for correctness
+(requires NumPy): every batch method solves a parameter sweep of x^3 + k x - c = 0 and each problem
+is solved again with the scalar method. The largest root difference, the number of problems whose
+iteration count or convergence flag differ and the time taken by each are reported. The sweep
+includes brackets without a sign change and guesses with a zero derivative, which the scalar
+methods reject with a ValueError and the batch methods report as not converged.
+The exit status is 1 if the two disagree. Run from the project root:
+
+    python -m benchmarks.batch_solutions
+"""
+import math
+import sys
+from time import perf_counter
+
+from Methods import Solutions
+from Methods.Backend import load_numpy
+from Methods.BatchSolutions import BatchSolutions
+
+TOLERANCE = 1e-12
+ERROR = 1e-10
+MAX_ITER = 100
+K = 0.5  # Shared by every problem, passed to the batch methods as a scalar
+
+
+def f(x, c, k):
+    return x**3 + k * x - c
+
+
+def df(x, c, k):
+    return 3 * x**2 + k
+
+
+def _cases(n: int):
+    np = load_numpy()
+    c = np.linspace(-20.0, 160.0, n)  # Roots outside [0, 5] for c < 0 and c > 127.5
+    guesses = np.where(np.arange(n) % 25 == 0, 0.0, 1.5)
+    no_slope = lambda x, c, k: 3 * x**2  # Zero at x = 0, where the Newton step fails
+    return {
+        "bisection": (
+            lambda: BatchSolutions.bisection(f, 0.0 * c, 0.0 * c + 5, ERROR, MAX_ITER, (c, K)),
+            lambda i: Solutions.bisection(lambda x: f(x, c[i], K), 0.0, 5.0, ERROR, MAX_ITER),
+        ),
+        "regula_falsi": (
+            lambda: BatchSolutions.regula_falsi(f, 0.0 * c, 0.0 * c + 5, ERROR, MAX_ITER, (c, K)),
+            lambda i: Solutions.regula_falsi(lambda x: f(x, c[i], K), 0.0, 5.0, ERROR, MAX_ITER),
+        ),
+        "newton_raphson": (
+            lambda: BatchSolutions.newton_raphson(f, no_slope, guesses, ERROR, MAX_ITER, (c, K)),
+            lambda i: Solutions.newton_raphson(lambda x: f(x, c[i], K), lambda x: no_slope(x, c[i], K), guesses[i], ERROR, MAX_ITER),
+        ),
+        "newton_raphson (df)": (
+            lambda: BatchSolutions.newton_raphson(f, df, guesses + 0.5, ERROR, MAX_ITER, (c, K)),
+            lambda i: Solutions.newton_raphson(lambda x: f(x, c[i], K), lambda x: df(x, c[i], K), guesses[i] + 0.5, ERROR, MAX_ITER),
+        ),
+        "secant": (
+            lambda: BatchSolutions.secant(f, guesses, guesses + 1, ERROR, MAX_ITER, (c, K)),
+            lambda i: Solutions.secant(lambda x: f(x, c[i], K), guesses[i], guesses[i] + 1, ERROR, MAX_ITER),
+        ),
+    }
+
+
+def _scalar(solve, n: int):
+    """Runs the scalar method on every problem, recording failures as not converged."""
+    roots, iterations, converged = [], [], []
+    for i in range(n):
+        try:
+            root, count = solve(i)
+        except ValueError:
+            root, count = math.nan, None
+        roots.append(float(root))
+        iterations.append(count)
+        converged.append(count is not None)
+    return roots, iterations, converged
+
+
+def main() -> int:
+    failures = 0
+    print(f"{'n':>6}  {'method':<22}{'scalar (ms)':>13}{'batch (ms)':>12}{'root diff':>11}{'iterations':>12}{'flags':>7}")
+    for n in (100, 10000):
+        for name, (batch, scalar) in _cases(n).items():
+            start = perf_counter()
+            expected = _scalar(scalar, n)
+            scalar_time = perf_counter() - start
+            start = perf_counter()
+            roots, iterations, converged = batch()
+            batch_time = perf_counter() - start
+            difference = max((abs(a - b) for a, b, ok in zip(expected[0], roots, expected[2]) if ok), default=0.0)
+            flags = sum(bool(a) != bool(b) for a, b in zip(expected[2], converged))
+            counts = sum(ok and a != b for a, b, ok in zip(expected[1], iterations, expected[2]))
+            mismatch = difference > TOLERANCE or flags or counts
+            failures += bool(mismatch)
+            flag = "  MISMATCH" if mismatch else ""
+            print(f"{n:>6}  {name:<22}{scalar_time * 1e3:>13.2f}{batch_time * 1e3:>12.2f}{difference:>11.1e}{counts:>12}{flags:>7}{flag}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+"""
+Measures the cost of the instrumentation hooks: each solver is timed undecorated (the function
+wrapped by @instrumented), decorated without a monitor, which is what every caller pays, with a
+Monitor and with a Monitor plus callback. Run from the project root:
+
+    python -m benchmarks.monitor_overhead
+"""
+from math import cos
+from timeit import repeat
+
+from Methods import Solutions
+from Methods.LinearSystem import LinearSystem
+from Methods.Monitor import Monitor
+from Methods.NonlinearSystem import NonlinearSystem
+
+
+def _best(statement, number):
+    return min(repeat(statement, number=number, repeat=5)) / number
+
+
+def main():
+    n = 60
+    matrix = [[4.0 if i == j else (-1.0 if abs(i - j) == 1 else 0.0) for j in range(n)] for i in range(n)]
+    system = LinearSystem(matrix, [1.0] * n)
+    circle = lambda x: [x[0] ** 2 + x[1] ** 2 - 4, x[0] - x[1]]
+    cases = {
+        "bisection": (Solutions.bisection, (lambda x: x**3 - 2 * x - 5, 2, 3, 1e-12, 100), 2000),
+        "secant": (Solutions.secant, (lambda x: cos(x) - x, 0, 1, 1e-12, 100), 5000),
+        "gauss_seidel": (LinearSystem.gauss_seidel, (system,), 20),
+        "newton_system": (NonlinearSystem.newton, (circle, [1.0, 0.5], 1e-12, 50, lambda x: [[2 * x[0], 2 * x[1]], [1, -1]]), 2000),
+    }
+    print(f"{'method':<15}{'plain (us)':>12}{'decorated':>12}{'overhead':>10}{'monitor':>12}{'callback':>12}")
+    for name, (solver, args, number) in cases.items():
+        plain = _best(lambda: solver.__wrapped__(*args), number)
+        decorated = _best(lambda: solver(*args), number)
+        monitored = _best(lambda: solver(*args, monitor=Monitor()), number)
+        callback = _best(lambda: solver(*args, monitor=Monitor(callback=lambda i, x, step: None)), number)
+        overhead = (decorated - plain) / plain
+        print(f"{name:<15}{plain * 1e6:>12.2f}{decorated * 1e6:>12.2f}{overhead:>10.1%}{monitored * 1e6:>12.2f}{callback * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compares the multigrid solver with the iterative methods of LinearSystem on the Poisson
+problem -Laplace(u) = 1 over 1-D and 2-D grids of growing size. For each method the wall time,
+the number of iterations (cycles for multigrid, whose time includes building the grid hierarchy)
+and the final residual norm relative to the right-hand side are reported. The multigrid cycle
+count stays flat as the grid is refined, while the Gauss-Seidel sweeps grow with the square of
+the points per dimension and the SOR and Conjugate Gradient iterations grow linearly.
+Run from the project root:
+
+    python -m benchmarks.multigrid
+    python -m benchmarks.multigrid --quick
+"""
+import argparse
+import warnings
+from math import pi, prod, sin, sqrt
+from time import perf_counter
+
+from Methods.Monitor import Monitor
+from Methods.Multigrid import Multigrid
+
+
+def _relative_residual(system, x) -> float:
+    b = system.constants
+    r = [bi - ax for bi, ax in zip(b, system.matvec(x))]
+    return sqrt(sum(v * v for v in r)) / sqrt(sum(v * v for v in b))
+
+
+def _methods(shape):
+    omega = 2 / (1 + sin(pi / (max(shape) + 1)))  # Optimal SOR factor for the model problem
+    return {
+        "multigrid V": lambda system, monitor: Multigrid(shape).solve(system.constants, 1e-10, monitor=monitor)[0],
+        "multigrid W": lambda system, monitor: Multigrid(shape, cycle="W").solve(system.constants, 1e-10, monitor=monitor)[0],
+        "multigrid V (jacobi)": lambda system, monitor: Multigrid(shape, smoother="jacobi").solve(system.constants, 1e-10, monitor=monitor)[0],
+        "gauss_seidel": lambda system, monitor: system.gauss_seidel(50000, 1e-12, monitor=monitor),
+        f"sor ({omega:.3f})": lambda system, monitor: system.sor(omega, 50000, 1e-12, monitor=monitor),
+        "conjugate_gradient": lambda system, monitor: system.conjugate_gradient(5000, 1e-10, monitor=monitor)[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="Only the smaller grids.")
+    args = parser.parse_args()
+    shapes = [(31,), (127,), (15, 15), (31, 31)] if args.quick else [(31,), (127,), (511,), (15, 15), (31, 31), (63, 63)]
+    print(f"{'grid':<10}{'method':<22}{'time (ms)':>11}{'iterations':>12}{'residual':>11}")
+    for shape in shapes:
+        system = Multigrid(shape).system([1.0] * prod(shape))
+        for name, run in _methods(shape).items():
+            monitor = Monitor()
+            start = perf_counter()
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")  # The discrete Laplacian is only weakly diagonally dominant
+                    x = run(system, monitor)
+            except ValueError:
+                print(f"{'x'.join(map(str, shape)):<10}{name:<22}{'did not converge':>34}")
+                continue
+            elapsed = perf_counter() - start
+            residual = _relative_residual(system, x)
+            print(f"{'x'.join(map(str, shape)):<10}{name:<22}{elapsed * 1e3:>11.1f}{monitor.iterations:>12}{residual:>11.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Compares the simultaneous polynomial root finders with the companion matrix eigenvalues
+(requires NumPy) on random polynomials. Run from the project root:
+
+    python -m benchmarks.polynomial_roots
+"""
+import random
+from time import perf_counter
+
+from Methods.Polynomial import Polynomial
+
+
+def _residual(coefficients, roots):
+    p, _ = Polynomial.horner(coefficients, roots)
+    return max(abs(v) for v in p)
+
+
+def main():
+    random.seed(0)
+    methods = {
+        "aberth": lambda c: Polynomial.aberth(c)[0],
+        "durand_kerner": lambda c: Polynomial.durand_kerner(c)[0],
+        "companion": Polynomial.companion_roots,
+    }
+    print(f"{'degree':>6}  {'method':<14}{'time (ms)':>12}{'max |p(z)|':>14}")
+    for degree in (5, 10, 20, 40):
+        coefficients = [random.uniform(-1, 1) for _ in range(degree + 1)]
+        for name, method in methods.items():
+            start = perf_counter()
+            try:
+                roots = method(coefficients)
+            except (ImportError, ValueError) as exc:
+                print(f"{degree:>6}  {name:<14}{'-':>12}  {exc}")
+                continue
+            elapsed = perf_counter() - start
+            print(f"{degree:>6}  {name:<14}{elapsed * 1e3:>12.2f}{_residual(coefficients, roots):>14.2e}")
+
+
+if __name__ == "__main__":
+    main()
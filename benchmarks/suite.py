@@ -0,0 +1,263 @@
+"""
+Benchmark and regression suite for every method of Solutions, LinearSystem and Interpolation.
+Each case is run over a sweep of problem sizes and records the best wall time over several
+repeats, the peak memory allocated during one run (tracemalloc), and the iteration, function
+evaluation and matrix-vector product counts reported by a Monitor for the iterative methods.
+Results are saved as JSON and can be compared with a stored baseline; the exit status is 1 when
+a case fails, or when compared with the baseline a case got slower or larger than the thresholds
+allow, needs more iterations or evaluations, or is missing from the run.
+Run from the project root:
+
+    python -m benchmarks.suite -o results.json
+    python -m benchmarks.suite --baseline results.json --threshold 0.2
+"""
+import argparse
+import json
+import math
+import platform
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from Methods import Solutions
+from Methods.Interpolation import Interpolation
+from Methods.LinearSystem import LinearSystem
+from Methods.Monitor import Monitor
+
+COUNTERS = ("iterations", "evaluations", "matvecs")
+
+
+class Case(NamedTuple):
+    name: str
+    setup: Callable[[], Any] # Builds the untimed input of one run
+    run: Callable[[Any, Optional[Monitor]], Any]
+    counted: bool # Whether run accepts a Monitor
+
+
+def _solution_cases(quick: bool) -> List[Case]:
+    f = lambda x: x**3 - 2 * x - 5
+    df = lambda x: 3 * x**2 - 2
+    d2f = lambda x: 6 * x
+    g = lambda x: math.cos(x)
+    methods = {
+        "bisection": lambda e, m: Solutions.bisection(f, 2, 3, e, 200, monitor=m),
+        "fixed_point": lambda e, m: Solutions.fixed_point(g, 1.0, e, 500, monitor=m),
+        "newton_raphson": lambda e, m: Solutions.newton_raphson(f, df, 2.0, e, 100, monitor=m),
+        "secant": lambda e, m: Solutions.secant(f, 2.0, 3.0, e, 100, monitor=m),
+        "regula_falsi": lambda e, m: Solutions.regula_falsi(f, 2, 3, e, 500, monitor=m),
+        "muller": lambda e, m: Solutions.muller(f, 1.5, 2.0, 3.0, e, 100, monitor=m),
+        "brent": lambda e, m: Solutions.brent(f, 2, 3, e, 100, monitor=m),
+        "halley": lambda e, m: Solutions.halley(f, df, d2f, 2.0, e, 100, monitor=m),
+    }
+    cases = []
+    for error in (1e-6,) if quick else (1e-6, 1e-12):
+        for name, method in methods.items():
+            cases.append(Case(f"solutions.{name}[error={error:g}]", lambda: None, lambda _, m, method=method, error=error: method(error, m), True))
+    for samples in (100,) if quick else (100, 1000):
+        cases.append(Case(
+            f"solutions.find_all_roots[samples={samples}]",
+            lambda: None,
+            lambda _, m, samples=samples: Solutions.find_all_roots(lambda x: math.sin(3 * x), 0.1, 20, 1e-10, 100, samples=samples),
+            False,
+        ))
+    return cases
+
+
+def _matrix(n: int, tridiagonal: bool = False) -> List[List[float]]:
+    """Diagonally dominant SPD matrix with the pattern of a 2-D five-point stencil on a sqrt(n) x sqrt(n) grid."""
+    width = n if tridiagonal else math.isqrt(n)
+    matrix = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        matrix[i][i] = 5.0
+        neighbours = [i - width, i + width] if not tridiagonal else []
+        if i % width:
+            neighbours.append(i - 1)
+        if (i + 1) % width:
+            neighbours.append(i + 1)
+        for j in neighbours:
+            if 0 <= j < n:
+                matrix[i][j] = -1.0
+    return matrix
+
+
+def _linear_system_cases(quick: bool) -> List[Case]:
+    methods = {
+        "gauss_elimination": lambda s, m: s.gauss_elimination(),
+        "lu_solve": lambda s, m: s.lu_solve(),
+        "determinant": lambda s, m: s.determinant(),
+        "inverse": lambda s, m: s.inverse(),
+        "banded_solve": lambda s, m: s.banded_solve(),
+        "solve": lambda s, m: s.solve(),
+        "gauss_jacobi": lambda s, m: s.gauss_jacobi(tolerance=1e-8, monitor=m),
+        "gauss_seidel": lambda s, m: s.gauss_seidel(tolerance=1e-8, monitor=m),
+        "sor": lambda s, m: s.sor(1.2, tolerance=1e-8, monitor=m),
+        "red_black_gauss_seidel": lambda s, m: s.red_black_gauss_seidel(tolerance=1e-8, monitor=m),
+        "conjugate_gradient": lambda s, m: s.conjugate_gradient(tolerance=1e-8, monitor=m),
+        "conjugate_gradient_ilu": lambda s, m: s.conjugate_gradient(tolerance=1e-8, preconditioner="ilu", monitor=m),
+        "gmres": lambda s, m: s.gmres(tolerance=1e-8, monitor=m),
+        "bicgstab": lambda s, m: s.bicgstab(tolerance=1e-8, monitor=m),
+    }
+    counted = {"gauss_jacobi", "gauss_seidel", "sor", "red_black_gauss_seidel", "conjugate_gradient", "conjugate_gradient_ilu", "gmres", "bicgstab"}
+    cases = []
+    for n in (16,) if quick else (16, 64, 144):
+        matrix = _matrix(n)
+        tridiagonal = _matrix(n, tridiagonal=True)
+        constants = [1.0] * n
+        setup = lambda matrix=matrix, constants=constants: LinearSystem(matrix, constants) # Fresh system, factorizations are cached
+        for name, method in methods.items():
+            cases.append(Case(f"linear_system.{name}[n={n}]", setup, method, name in counted))
+        cases.append(Case(f"linear_system.thomas[n={n}]", lambda t=tridiagonal, c=constants: LinearSystem(t, c), lambda s, m: s.thomas(), False))
+    return cases
+
+
+def _interpolation_cases(quick: bool) -> List[Case]:
+    methods = {
+        "lagrange": lambda p, xs: [p.lagrange(x) for x in xs],
+        "barycentric_lagrange": lambda p, xs: p.barycentric_lagrange_many(xs),
+        "newton": lambda p, xs: p.newton_many(xs),
+        "linear_spline": lambda p, xs: [p.linear_spline(x) for x in xs],
+        "cubic_spline": lambda p, xs: [p.cubic_spline(x) for x in xs],
+    }
+    cases = []
+    for n in (16,) if quick else (16, 64, 256):
+        nodes = [math.cos(math.pi * (n - 1 - k) / (n - 1)) for k in range(n)] # Chebyshev points, increasing
+        values = [1 / (1 + 25 * x * x) for x in nodes]
+        queries = [-1 + 2 * (k + 0.5) / 50 for k in range(50)]
+        setup = lambda nodes=nodes, values=values: Interpolation(nodes, values) # Fresh instance, weights are cached
+        for name, method in methods.items():
+            cases.append(Case(f"interpolation.{name}[n={n}]", setup, lambda p, m, method=method, queries=queries: method(p, queries), False))
+        cases.append(Case(
+            f"interpolation.add_node[n={n}]",
+            lambda nodes=nodes, values=values: Interpolation(nodes[:2], values[:2]),
+            lambda p, m, nodes=nodes, values=values: [p.add_node(x, y) for x, y in zip(nodes[2:], values[2:])],
+            False,
+        ))
+    return cases
+
+
+def cases(quick: bool = False) -> List[Case]:
+    """Every benchmark case, over the full size sweep or only the smallest size when quick is set."""
+    return _solution_cases(quick) + _linear_system_cases(quick) + _interpolation_cases(quick)
+
+
+def measure(case: Case, repeat: int = 5, budget: float = 0.005) -> Dict[str, Any]:
+    """
+    Runs one case and returns its measurements.
+    The run is repeated in batches taking at least budget seconds, each call on a fresh input
+    from setup, and the best time per call is kept.
+    """
+    case.run(case.setup(), None) # Warm up and calibrate
+    inputs = [case.setup()]
+    start = perf_counter()
+    case.run(inputs[0], None)
+    number = max(1, min(10000, int(budget / max(perf_counter() - start, 1e-9))))
+    best = math.inf
+    for _ in range(repeat):
+        inputs = [case.setup() for _ in range(number)]
+        start = perf_counter()
+        for value in inputs:
+            case.run(value, None)
+        best = min(best, (perf_counter() - start) / number)
+    value = case.setup()
+    tracemalloc.start()
+    try:
+        case.run(value, None)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    result: Dict[str, Any] = {"time": best, "peak_memory": peak}
+    if case.counted:
+        monitor = Monitor(keep_history=False)
+        case.run(case.setup(), monitor)
+        result.update({counter: getattr(monitor, counter) for counter in COUNTERS})
+    return result
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float = 0.25,
+    memory_threshold: float = 0.25,
+) -> List[str]:
+    """
+    Compares results with a baseline and returns one message per regression.
+    A case regresses when its time or peak memory grew by more than the relative thresholds,
+    when it needs more iterations, evaluations or matrix-vector products than before, or when
+    it is in the baseline but not in the results, as happens when it failed.
+    """
+    regressions = [f"{name}: missing from this run" for name in baseline if name not in results]
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current["time"] > previous["time"] * (1 + threshold):
+            regressions.append(f"{name}: time {previous['time'] * 1e6:.1f}us -> {current['time'] * 1e6:.1f}us")
+        if current["peak_memory"] > previous["peak_memory"] * (1 + memory_threshold) + 1024: # Ignore allocator noise
+            regressions.append(f"{name}: peak memory {previous['peak_memory']} -> {current['peak_memory']} bytes")
+        for counter in COUNTERS:
+            if counter in current and counter in previous and current[counter] > previous[counter]:
+                regressions.append(f"{name}: {counter} {previous[counter]} -> {current[counter]}")
+    return regressions
+
+
+def main(argv: List[str] = None) -> int: # type: ignore
+    parser = argparse.ArgumentParser(description="Benchmark every numerical method and compare with a baseline.")
+    parser.add_argument("-o", "--output", help="JSON file to save the results to")
+    parser.add_argument("--baseline", help="JSON file of earlier results to compare with")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed relative slowdown (default 0.25)")
+    parser.add_argument("--memory-threshold", type=float, default=0.25, help="allowed relative growth of peak memory (default 0.25)")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats per case (default 5)")
+    parser.add_argument("--quick", action="store_true", help="only the smallest problem size")
+    args = parser.parse_args(argv)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    failures: Dict[str, str] = {}
+    print(f"{'case':<48}{'time (us)':>12}{'peak (KiB)':>12}{'iter':>8}{'evals':>8}{'matvecs':>8}")
+    for case in cases(args.quick):
+        if args.filter not in case.name:
+            continue
+        try:
+            result = measure(case, args.repeat)
+        except (ValueError, ZeroDivisionError) as exc:
+            print(f"{case.name:<48}  failed: {exc}")
+            failures[case.name] = f"{type(exc).__name__}: {exc}"
+            continue
+        results[case.name] = result
+        counts = "".join(f"{result.get(counter, '-'):>8}" for counter in COUNTERS)
+        print(f"{case.name:<48}{result['time'] * 1e6:>12.1f}{result['peak_memory'] / 1024:>12.1f}{counts}")
+
+    if args.output:
+        report = {
+            "meta": {
+                "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "results": results,
+            "failures": failures,
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        baseline = {name: result for name, result in baseline.items() if args.filter in name}
+        regressions = compare(results, baseline, args.threshold, args.memory_threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        if not failures:
+            print(f"\nNo regressions against {args.baseline}.")
+    if failures:
+        print(f"\n{len(failures)} case(s) failed.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+import asyncio
+import math
+
+import pytest
+
+from Methods.AsyncSolutions import AsyncSolutions
+
+
+def test_k_section_finds_the_root():
+    root, _, _ = AsyncSolutions.parallel_k_section(lambda x: x**2 - 2, 0.0, 2.0, 1e-10, 100, k=4)
+    assert root == pytest.approx(math.sqrt(2), abs=1e-9)
+
+
+def test_k_section_accepts_coroutines():
+    async def f(x):
+        await asyncio.sleep(0)
+        return x - 0.25
+
+    root, _, _ = asyncio.run(AsyncSolutions.k_section(f, 0.0, 1.0, 1e-10, 100, k=3))
+    assert root == pytest.approx(0.25, abs=1e-9)
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf])
+def test_k_section_rejects_non_finite_probes(value):
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        return value if 0.4 < x < 0.6 else x - 0.7
+
+    with pytest.raises(ValueError, match="not finite"):
+        AsyncSolutions.parallel_k_section(f, 0.0, 1.0, 1e-12, 10**6, k=2)
+    assert len(calls) < 10
+
+
+def test_k_section_rejects_non_finite_endpoints():
+    with pytest.raises(ValueError, match="not finite"):
+        AsyncSolutions.parallel_k_section(lambda x: math.nan, 0.0, 1.0, 1e-12, 100)
@@ -0,0 +1,47 @@
+import pytest
+
+from Methods.Backend import Backend, PythonBackend
+from Methods.LinearSystem import LinearSystem
+
+MATRIX = [[4.0, -1.0, 0.0], [-1.0, 4.0, -1.0], [0.0, -1.0, 4.0]]
+CONSTANTS = [1.0, 2.0, 3.0]
+SOLUTION = [13 / 28, 6 / 7, 27 / 28]
+
+
+class CountingBackend(PythonBackend):
+    """A custom backend whose name is not one of the built-in ones."""
+
+    name = "counting"
+
+    def __init__(self):
+        self.sweeps = 0
+
+    def _counted(self, step):
+        def counted(x):
+            self.sweeps += 1
+            return step(x)
+        return counted
+
+    def jacobi_sweep(self, coefficients, constants, diagonal):
+        return self._counted(super().jacobi_sweep(coefficients, constants, diagonal))
+
+    def red_black_sweep(self, coefficients, constants, diagonal, colors, omega):
+        return self._counted(super().red_black_sweep(coefficients, constants, diagonal, colors, omega))
+
+
+def test_backend_is_abstract():
+    with pytest.raises(TypeError):
+        Backend()
+
+
+@pytest.mark.parametrize("method", ["gauss_jacobi", "red_black_gauss_seidel"])
+def test_custom_backend_runs_the_sweeps(method):
+    backend = CountingBackend()
+    solution = getattr(LinearSystem(MATRIX, CONSTANTS), method)(tolerance=1e-12, backend=backend)
+    assert backend.sweeps > 0
+    assert solution == pytest.approx(SOLUTION, abs=1e-10)
+
+
+def test_sparse_and_dense_sweeps_agree():
+    sparse = LinearSystem.from_triplets([0, 0, 1, 1, 1, 2, 2], [0, 1, 0, 1, 2, 1, 2], [4.0, -1, -1, 4, -1, -1, 4], CONSTANTS)
+    assert sparse.gauss_jacobi(tolerance=1e-12) == LinearSystem(MATRIX, CONSTANTS).gauss_jacobi(tolerance=1e-12)
@@ -0,0 +1,52 @@
+import io
+from time import perf_counter
+
+import pytest
+
+from Methods.BatchRunner import BatchRunner, _function
+
+ROOT = {"id": 1, "method": "bisection", "f": "x**2 - 4", "a": 0, "b": 3, "error": 1e-8, "max_iter": 100}
+# Once the bracket is down to two adjacent floats it stops shrinking, so this runs for max_iter steps
+STUCK = {"id": 2, "method": "bisection", "f": "x**2 - 3", "a": 1, "b": 2, "error": 1e-300, "max_iter": 10**9}
+
+
+def _records(specs, **options):
+    return sorted(BatchRunner.execute(specs, **options), key=lambda record: record["index"])
+
+
+def test_malformed_lines_are_reported():
+    stream = io.StringIO('{bad json\n[1, 2]\n' + '{"id": 1, "method": "bisection", "f": "x - 1", "a": 0, "b": 3, "error": 1e-8, "max_iter": 100}\n')
+    records = _records(BatchRunner.read_specs(stream), workers=0)
+    assert [record["status"] for record in records] == ["error", "error", "ok"]
+    assert records[0]["error"].startswith("ValueError: Invalid JSON on line 1")
+
+
+@pytest.mark.parametrize("expression", ["().__class__.__base__.__subclasses__()", "x[0]", "__import__('os')", "factorial(10**6)"])
+def test_unsafe_expressions_are_rejected(expression):
+    with pytest.raises(ValueError):
+        _function(expression)
+
+
+@pytest.mark.parametrize("expression", ["pow(10, pow(10, 10))", "10**10**10", "x**x**x"])
+def test_huge_powers_fail_fast(expression):
+    spec = dict(ROOT, f=expression, a=9, b=10)
+    start = perf_counter()
+    [record] = _records([spec], workers=0)
+    assert perf_counter() - start < 1
+    assert record["status"] == "error"
+    assert record["error"].startswith("OverflowError")
+
+
+def test_stuck_chunk_times_out():
+    specs = [ROOT, STUCK, ROOT, ROOT]
+    start = perf_counter()
+    records = _records(specs, workers=1, chunk_size=1, timeout=1.0)
+    assert perf_counter() - start < 30
+    assert [record["index"] for record in records] == [0, 1, 2, 3]
+    assert [record["status"] for record in records] == ["ok", "error", "ok", "ok"]
+    assert records[1]["id"] == 2 and records[1]["error"].startswith("TimeoutError")
+
+
+def test_timeout_must_be_positive():
+    with pytest.raises(ValueError):
+        list(BatchRunner.execute([ROOT], workers=1, timeout=0))
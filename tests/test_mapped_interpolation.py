@@ -0,0 +1,29 @@
+import pytest
+
+from Methods.MappedInterpolation import MappedInterpolation
+
+
+@pytest.fixture
+def table(tmp_path):
+    path = str(tmp_path / "table.bin")
+    MappedInterpolation.write(path, [0.0, 1.0, 2.0, 4.0], [0.0, 10.0, 20.0, 0.0])
+    with MappedInterpolation(path) as interpolation:
+        yield interpolation
+
+
+def test_evaluate_many_in_chunks(table):
+    points = [0.5, 1.5, 3.0, 4.0, 0.0]
+    assert list(table.evaluate_many(iter(points), chunk_size=2)) == pytest.approx([5.0, 15.0, 10.0, 0.0, 0.0])
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_invalid_chunk_size_fails_at_the_call(table, chunk_size):
+    with pytest.raises(ValueError, match="chunk_size"):
+        table.evaluate_chunks([0.5], chunk_size=chunk_size)
+    with pytest.raises(ValueError, match="chunk_size"):
+        table.evaluate_many([0.5], chunk_size=chunk_size)
+
+
+def test_unknown_backend_fails_at_the_call(table):
+    with pytest.raises(ValueError, match="backend"):
+        table.evaluate_chunks([0.5], backend="fortran")
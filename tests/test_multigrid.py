@@ -0,0 +1,33 @@
+import pytest
+
+from Methods.Multigrid import Multigrid
+
+
+def test_solution_matches_direct_solve():
+    multigrid = Multigrid((15, 15))
+    constants = [1.0] * 225
+    solution, history = multigrid.solve(constants, tolerance=1e-10)
+    assert solution == pytest.approx(multigrid.system(constants).lu_solve(), abs=1e-9)
+    assert len(history) <= 12
+
+
+def test_cycle_count_does_not_grow_with_the_grid():
+    cycles = [len(Multigrid((n,)).solve([1.0] * n, tolerance=1e-10)[1]) for n in (31, 127, 511)]
+    assert max(cycles) - min(cycles) <= 1
+
+
+@pytest.mark.parametrize("coarse_size", [0, -3])
+def test_non_positive_coarse_size_is_rejected(coarse_size):
+    with pytest.raises(ValueError):
+        Multigrid((7,), coarse_size=coarse_size)
+
+
+def test_coarsening_stops_at_a_single_point():
+    multigrid = Multigrid((7, 7), coarse_size=1)
+    assert multigrid.shapes[-1] == (1, 1)
+    assert len(multigrid.solve([1.0] * 49)[1]) > 1
+
+
+def test_uncoarsenable_grid_is_rejected():
+    with pytest.raises(ValueError):
+        Multigrid((20,))
@@ -0,0 +1,24 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run(code: str) -> str:
+    """Runs code in a fresh interpreter, as the checks depend on what was imported first."""
+    return subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+
+
+def test_exports_are_classes_after_submodule_import():
+    output = _run(
+        "import Methods.Multigrid, Methods.MappedInterpolation\n"
+        "import Methods\n"
+        "from Methods import LinearSystem, Interpolation\n"
+        "print(isinstance(Methods.LinearSystem, type), isinstance(LinearSystem, type), isinstance(Interpolation, type))"
+    )
+    assert output.split() == ["True", "True", "True"]
+
+
+def test_import_does_not_load_numpy():
+    assert _run("import sys, Methods; print('numpy' in sys.modules)").strip() == "False"
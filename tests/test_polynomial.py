@@ -0,0 +1,30 @@
+import pytest
+
+from Methods.Polynomial import Polynomial
+
+METHODS = [Polynomial.aberth, Polynomial.durand_kerner]
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_distinct_roots(method):
+    roots, _ = method([1, -10, 35, -50, 24])
+    assert sorted(root.real for root in roots) == pytest.approx([1, 2, 3, 4])
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_large_roots_use_a_relative_tolerance(method):
+    roots, _ = method([1, -3e6, 2e12])
+    assert sorted(root.real for root in roots) == pytest.approx([1e6, 2e6], rel=1e-12)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_multiple_root_stops_at_working_precision(method):
+    roots, iterations = method([1, -4, 6, -4, 1])
+    assert iterations < 100
+    assert all(abs(root - 1) < 1e-3 for root in roots)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_roots_at_zero(method):
+    roots, _ = method([1, -1, 0, 0])
+    assert sorted(root.real for root in roots) == pytest.approx([0, 0, 1])
@@ -0,0 +1,33 @@
+import math
+
+import pytest
+
+from Methods import Solutions
+from Methods.Evaluator import Evaluator
+
+
+def test_secant_failure_evaluates_only_used_points():
+    f = Evaluator(lambda x: math.exp(x), cache_size=0) # No root, the iterates run off to -inf
+    with pytest.raises(ValueError):
+        Solutions.secant(f, 0.0, 1.0, 1e-300, 5)
+    assert f.evaluations == 2 + 5
+
+
+def test_muller_failure_evaluates_only_used_points():
+    f = Evaluator(lambda x: x**3 - 2 * x + 2, cache_size=0)
+    with pytest.raises(ValueError):
+        Solutions.muller(f, -3.0, -2.0, -1.0, 1e-300, 2)
+    assert f.evaluations == 3 + 2
+
+
+def test_brent_failure_evaluates_only_used_points():
+    f = Evaluator(lambda x: x**3 - 2, cache_size=0)
+    with pytest.raises(ValueError):
+        Solutions.brent(f, 0.0, 2.0, 1e-300, 2)
+    assert f.evaluations == 2 + 2
+
+
+def test_evaluator_budget():
+    f = Evaluator(lambda x: x * x - 2, max_evaluations=3)
+    with pytest.raises(ValueError, match="function evaluations"):
+        Solutions.bisection(f, 0.0, 2.0, 1e-12, 100)
@@ -0,0 +1,35 @@
+import json
+
+from benchmarks import suite
+
+
+def _case(name, run):
+    return suite.Case(name, lambda: None, lambda value, monitor: run(), False)
+
+
+def _run(monkeypatch, tmp_path, cases, *arguments):
+    monkeypatch.setattr(suite, "cases", lambda quick=False: cases)
+    return suite.main(["--repeat", "1", *arguments])
+
+
+def _failing():
+    raise ValueError("Method did not converge within the maximum number of iterations.")
+
+
+def test_failed_case_fails_the_run(monkeypatch, tmp_path):
+    assert _run(monkeypatch, tmp_path, [_case("fine", lambda: 1)]) == 0
+    assert _run(monkeypatch, tmp_path, [_case("fine", lambda: 1), _case("broken", _failing)]) == 1
+
+
+def test_case_missing_from_baseline_run_is_a_regression(monkeypatch, tmp_path):
+    baseline = tmp_path / "baseline.json"
+    assert _run(monkeypatch, tmp_path, [_case("fine", lambda: 1), _case("broken", lambda: 1)], "-o", str(baseline)) == 0
+    assert "broken" in json.loads(baseline.read_text())["results"]
+    assert _run(monkeypatch, tmp_path, [_case("fine", lambda: 1), _case("broken", _failing)], "--baseline", str(baseline), "--threshold", "1e9") == 1
+    assert _run(monkeypatch, tmp_path, [_case("fine", lambda: 1)], "--baseline", str(baseline), "--threshold", "1e9") == 1
+    assert _run(monkeypatch, tmp_path, [_case("fine", lambda: 1)], "--baseline", str(baseline), "--threshold", "1e9", "--filter", "fine") == 0
+
+
+def test_compare_reports_missing_cases():
+    baseline = {"a": {"time": 1.0, "peak_memory": 0}, "b": {"time": 1.0, "peak_memory": 0}}
+    assert suite.compare({"a": {"time": 1.0, "peak_memory": 0}}, baseline) == ["b: missing from this run"]